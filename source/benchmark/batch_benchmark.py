@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark importing many small text formatted datasets, using one process per dataset versus
+using the batch mode of the import command
+"""
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.alias import TippingPointByAction
+from adaptation_pathways.cli.import_ import import_many
+from adaptation_pathways.io import text
+from adaptation_pathways.plot.alias import ColourByActionName
+
+
+nr_datasets = 200
+nr_actions = 50
+nr_workers_to_test = [1, 2, 4]
+
+# Script installed as the ap_import command
+script_path = Path(__file__).parent.parent / "script" / "ap_import.py"
+
+
+def import_per_process(text_path: Path, binary_path: Path) -> None:
+    binary_path.mkdir(exist_ok=True)
+
+    for path in sorted(text_path.glob("*-action.txt")):
+        name = path.name.removesuffix("-action.txt")
+        subprocess.run(
+            [
+                sys.executable,
+                str(script_path),
+                str(text_path / name),
+                str(binary_path / f"{name}.apw"),
+            ],
+            check=True,
+        )
+
+
+def import_batch(text_path: Path, binary_path: Path, nr_workers: int) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        status = import_many(str(text_path), str(binary_path), nr_workers)
+
+    assert status == 0
+
+
+def main() -> int:
+    actions, sequences = tree_dataset(nr_actions)
+    tipping_point_by_action: TippingPointByAction = {
+        action: 2000 + idx for idx, action in enumerate(actions)
+    }
+    colour_by_action_name: ColourByActionName = {
+        action.name: (1, 0, 0, 1) for action in actions
+    }
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        directory_path = Path(directory_pathname)
+        text_path = directory_path / "text"
+        text_path.mkdir()
+
+        for idx in range(nr_datasets):
+            text.write_dataset(
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+                str(text_path / f"dataset_{idx}"),
+            )
+
+        rows.append(
+            [
+                "process per dataset",
+                1,
+                time_call(
+                    import_per_process,
+                    text_path,
+                    directory_path / "per_process",
+                    repeat=1,
+                ),
+            ]
+        )
+
+        for nr_workers in nr_workers_to_test:
+            if nr_workers <= (os.cpu_count() or 1):
+                rows.append(
+                    [
+                        "batch",
+                        nr_workers,
+                        time_call(
+                            import_batch,
+                            text_path,
+                            directory_path / f"batch_{nr_workers}",
+                            nr_workers,
+                            repeat=1,
+                        ),
+                    ]
+                )
+
+    print(f"Importing {nr_datasets} datasets of {nr_actions} actions")
+    print_table(["mode", "nr_workers", "duration (s)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+This module contains code shared between the benchmarks
+"""
+
+import random
+import time
+import typing
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.alias import Actions, Sequences
+from adaptation_pathways.app.model.metric import MetricValue, MetricValueState
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+
+
+def tree_dataset(nr_actions: int, *, seed: int = 0) -> tuple[Actions, Sequences]:
+    """
+    Return actions and sequences representing a randomly shaped tree
+
+    :param nr_actions: Number of actions. The first action is the root action.
+    :param seed: Seed for the random number generator, for reproducible datasets
+
+    Each action, except the root action, is the continuation of one randomly selected action
+    defined before it.
+    """
+    generator = random.Random(seed)
+    actions: Actions = [Action(f"action_{idx}") for idx in range(nr_actions)]
+    sequences: Sequences = [
+        (actions[generator.randrange(idx)], actions[idx])
+        for idx in range(1, nr_actions)
+    ]
+
+    return actions, sequences
+
+
+def chain_dataset(nr_actions: int) -> tuple[Actions, Sequences]:
+    """
+    Return actions and sequences representing a single, serial pathway
+
+    :param nr_actions: Number of actions. The first action is the root action.
+    """
+    actions: Actions = [Action(f"action_{idx}") for idx in range(nr_actions)]
+    sequences: Sequences = list(zip(actions[:-1], actions[1:]))
+
+    return actions, sequences
+
+
+def diamond_lattice_dataset(nr_diamonds: int) -> tuple[Actions, Sequences]:
+    """
+    Return actions and sequences representing a serial lattice of diamonds
+
+    :param nr_diamonds: Number of diamonds
+
+    In each diamond, two actions continue the same action, and are both continued by the same
+    action. The number of pathways doubles with each diamond.
+    """
+    action = Action("action_0")
+    actions: Actions = [action]
+    sequences: Sequences = []
+
+    for idx in range(nr_diamonds):
+        left_action = Action(f"action_{idx}_left")
+        right_action = Action(f"action_{idx}_right")
+        next_action = Action(f"action_{idx + 1}")
+
+        actions += [left_action, right_action, next_action]
+        sequences += [
+            (action, left_action),
+            (action, right_action),
+            (left_action, next_action),
+            (right_action, next_action),
+        ]
+        action = next_action
+
+    return actions, sequences
+
+
+def pathways_project(
+    nr_pathways: int,
+    *,
+    nr_actions: int = 20,
+    nr_metrics: int = 5,
+    nr_years: int = 80,
+    seed: int = 0,
+) -> PathwaysProject:
+    """
+    Return a project containing a randomly shaped tree of pathways
+
+    :param nr_pathways: Number of pathways. The first pathway is the root pathway.
+    :param nr_actions: Number of actions. The first action is the one of the root pathway.
+    :param nr_metrics: Number of conditions and of criteria
+    :param nr_years: Number of years in the single scenario, with a value for each condition
+    :param seed: Seed for the random number generator, for reproducible projects
+
+    Each pathway, except the root pathway, continues a randomly selected pathway defined
+    before it, with a randomly selected action. All pathway values are estimates, calculated from the action effects.
+    """
+    generator = random.Random(seed)
+    project = PathwaysProject("project", "Project", "Organization", 2020, 2100)
+
+    for _ in range(nr_metrics):
+        project.create_condition()
+        project.create_criteria()
+
+    for _ in range(nr_actions):
+        action = project.create_action("#ff0000", "icon")
+
+        for effect in action.metric_data.values():
+            effect.value = generator.uniform(0, 10)
+
+    scenario = project.create_scenario("Scenario")
+
+    for year in range(project.start_year, project.start_year + nr_years):
+        for metric in project.all_conditions:
+            scenario.set_data(
+                year,
+                metric.id,
+                MetricValue(generator.uniform(0, 100), MetricValueState.OVERRIDE),
+            )
+
+    project.root_action_id = project.action_ids[0]
+    project.root_pathway_id = project.create_pathway(project.root_action_id).id
+    pathway_ids = [project.root_pathway_id]
+
+    while len(pathway_ids) < nr_pathways:
+        action_id = project.action_ids[generator.randrange(1, nr_actions)]
+        parent_id = generator.choice(pathway_ids)
+
+        if f"{parent_id}->{action_id}" not in project.pathways_by_id:
+            pathway_ids.append(project.create_pathway(action_id, parent_id).id)
+
+    return project
+
+
+def time_call(function: typing.Callable, *args, repeat: int = 3, **kwargs) -> float:
+    """
+    Call the function passed in a number of times and return the shortest duration, in seconds
+    """
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def print_table(header: list[str], rows: list[list[typing.Any]]) -> None:
+    """
+    Print a table with a header and rows, with right-aligned columns
+    """
+
+    def format_value(value: typing.Any) -> str:
+        return f"{value:.4f}" if isinstance(value, float) else f"{value}"
+
+    rows_as_strings = [[format_value(value) for value in row] for row in rows]
+    widths = [
+        max(len(value) for value in column) for column in zip(header, *rows_as_strings)
+    ]
+
+    for row in [header] + rows_as_strings:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading binary formatted datasets, for datasets with an increasing number of sequences
+
+Writing the datasets is not part of the timings.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.alias import TippingPointByAction
+from adaptation_pathways.io import binary
+from adaptation_pathways.plot.alias import ColourByActionName
+
+
+nr_sequences_to_test = [10000, 100000]
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        for nr_sequences in nr_sequences_to_test:
+            actions, sequences = tree_dataset(nr_sequences + 1)
+            tipping_point_by_action: TippingPointByAction = {
+                action: 2000 + idx for idx, action in enumerate(actions)
+            }
+            colour_by_action_name: ColourByActionName = {
+                action.name: (1, 0, 0, 1) for action in actions
+            }
+            database_path = Path(directory_pathname) / f"dataset_{nr_sequences}.apw"
+
+            binary.write_dataset(
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+                database_path,
+            )
+
+            rows.append(
+                [
+                    nr_sequences,
+                    time_call(binary.read_dataset, database_path),
+                ]
+            )
+
+    print_table(["nr_sequences", "reading (s)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark writing binary formatted datasets, with and without bulk mode, for datasets with an
+increasing number of sequences
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.io import binary
+
+
+nr_sequences_to_test = [10000, 100000, 1000000]
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        for nr_sequences in nr_sequences_to_test:
+            actions, sequences = tree_dataset(nr_sequences + 1)
+            tipping_point_by_action = {
+                action: 2000 + idx for idx, action in enumerate(actions)
+            }
+            colour_by_action_name = {action.name: (1, 0, 0, 1) for action in actions}
+            database_path = Path(directory_pathname) / f"dataset_{nr_sequences}.apw"
+            durations = [
+                time_call(
+                    binary.write_dataset,
+                    actions,
+                    sequences,
+                    tipping_point_by_action,
+                    colour_by_action_name,
+                    database_path,
+                    bulk=bulk,
+                    repeat=1,
+                )
+                for bulk in [False, True]
+            ]
+
+            rows.append([nr_sequences, *durations])
+
+    print_table(["nr_sequences", "writing (s)", "bulk writing (s)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
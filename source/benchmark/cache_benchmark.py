@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading binary formatted datasets and converting them into graphs, as done by the
+plot command-line utilities, without a cache and with a cache containing the results
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.alias import TippingPointByAction
+from adaptation_pathways.cli.dataset import read_graphs, read_pathway_map
+from adaptation_pathways.io import binary
+from adaptation_pathways.io.cache import Cache
+from adaptation_pathways.plot.alias import ColourByActionName
+
+
+nr_actions_to_test = [1000, 10000, 100000]
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        directory_path = Path(directory_pathname)
+        cache_pathname = str(directory_path / "cache")
+
+        for nr_actions in nr_actions_to_test:
+            actions, sequences = tree_dataset(nr_actions)
+
+            # Each action is the continuation of an action defined before it, so tipping
+            # points increase along each pathway
+            tipping_point_by_action: TippingPointByAction = {
+                action: 2000 + idx for idx, action in enumerate(actions)
+            }
+            colour_by_action_name: ColourByActionName = {
+                action.name: (1, 0, 0, 1) for action in actions
+            }
+            basename_pathname = str(directory_path / f"dataset_{nr_actions}")
+            binary.write_dataset(
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+                basename_pathname,
+                bulk=True,
+            )
+
+            for function in [read_pathway_map, read_graphs]:
+                uncached = time_call(function, basename_pathname, repeat=1)
+                Cache(cache_pathname).clear()
+                miss = time_call(function, basename_pathname, cache_pathname, repeat=1)
+                hit = time_call(function, basename_pathname, cache_pathname)
+
+                rows.append(
+                    [
+                        nr_actions,
+                        function.__name__,
+                        uncached,
+                        miss,
+                        hit,
+                        f"{uncached / hit:.1f}",
+                    ]
+                )
+
+    print_table(
+        [
+            "nr_actions",
+            "function",
+            "no cache (s)",
+            "cache miss (s)",
+            "cache hit (s)",
+            "speedup",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark writing and reading datasets in the binary and columnar formats, and verifying their
+tipping points
+
+Verifying tipping points of a binary dataset requires reading it and converting it into a
+pathway map. Verifying tipping points of a columnar dataset is done on the memory-mapped
+columns.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.graph import (
+    SequenceGraph,
+    sequence_graph_to_pathway_map,
+    tipping_point_violations,
+)
+from adaptation_pathways.io import binary, columnar
+
+
+nr_actions_to_test = [1000, 10000, 100000]
+
+
+def verify_binary(path: Path) -> None:
+    _, sequences, tipping_point_by_action, _ = binary.read_dataset(path)
+    pathway_map = sequence_graph_to_pathway_map(
+        SequenceGraph(sequences), share_prefixes=True
+    )
+    assert len(tipping_point_violations(pathway_map, tipping_point_by_action)) == 0
+
+
+def verify_columnar(path: Path) -> None:
+    assert len(columnar.read_columns(path).tipping_point_violations()) == 0
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        directory_path = Path(directory_pathname)
+
+        for nr_actions in nr_actions_to_test:
+            actions, sequences = tree_dataset(nr_actions)
+
+            # Each action is the continuation of an action defined before it, so tipping
+            # points increase along each pathway
+            tipping_point_by_action = {
+                action: 2000 + idx for idx, action in enumerate(actions)
+            }
+            colour_by_action_name = {action.name: (1, 0, 0, 1) for action in actions}
+            dataset = (
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+            )
+
+            for name, module, path, verify in [
+                ("binary", binary, directory_path / f"{nr_actions}.apw", verify_binary),
+                (
+                    "columnar",
+                    columnar,
+                    directory_path / f"{nr_actions}.apc",
+                    verify_columnar,
+                ),
+            ]:
+                rows.append(
+                    [
+                        nr_actions,
+                        name,
+                        time_call(module.write_dataset, *dataset, path, repeat=1),
+                        time_call(module.read_dataset, path),
+                        time_call(verify, path),
+                    ]
+                )
+
+    print_table(
+        ["nr_actions", "format", "write (s)", "read (s)", "verify (s)"],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory usage and traversal time of pathway maps stored in a networkx.DiGraph
+versus a CompactDiGraph
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.graph import (
+    PathwayMap,
+    SequenceGraph,
+    sequence_graph_to_pathway_map,
+)
+from adaptation_pathways.graph.node import ActionBegin
+
+
+nr_actions_to_test = [1000, 10000, 50000]
+
+
+def traverse(pathway_map: PathwayMap) -> None:
+    # Visit all nodes reachable from the roots, and look up the neighbours of each node
+    for root_node in pathway_map.root_nodes:
+        for node in pathway_map.all_to_nodes(root_node):
+            pathway_map.to_nodes(node)
+            pathway_map.from_nodes(node)
+
+
+def build(edges, *, compact: bool) -> tuple[PathwayMap, int]:
+    """
+    Build a pathway map from the edges passed in and return it, together with the number of
+    bytes allocated for storing the graph
+
+    The nodes are created up front, so only the memory used by the graph itself is measured.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    pathway_map = PathwayMap(compact=compact)
+
+    for from_node, to_node in edges:
+        if isinstance(from_node, ActionBegin):
+            pathway_map.add_period(from_node, to_node)
+        else:
+            pathway_map.add_conversion(from_node, to_node)
+
+    # Make sure all lazily built data structures are built
+    pathway_map.nr_edges()
+
+    nr_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return pathway_map, nr_bytes
+
+
+def main() -> int:
+    rows = []
+
+    for nr_actions in nr_actions_to_test:
+        _, sequences = tree_dataset(nr_actions)
+        edges = list(
+            sequence_graph_to_pathway_map(SequenceGraph(sequences))._graph.edges
+        )
+
+        for compact in [False, True]:
+            pathway_map, nr_bytes = build(edges, compact=compact)
+            duration = time_call(traverse, pathway_map)
+            rows.append(
+                [
+                    nr_actions,
+                    "compact" if compact else "networkx",
+                    pathway_map.nr_nodes(),
+                    nr_bytes / 2**20,
+                    duration,
+                ]
+            )
+
+    print_table(
+        ["nr_actions", "engine", "nr_nodes", "graph memory (MiB)", "traversal (s)"],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory used by the nodes of pathway graphs and pathway maps, for trees of
+increasing size
+
+Only the memory allocated for the nodes themselves is measured, not the memory used by the
+graph storing them.
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmark import print_table, tree_dataset
+
+from adaptation_pathways.graph.node import (
+    ActionBegin,
+    ActionConversion,
+    ActionEnd,
+    ActionPeriod,
+)
+
+
+nr_actions_to_test = [10000, 100000, 1000000]
+
+
+def create_nodes(actions) -> list:
+    """
+    Create nodes for the actions passed in, like the ones created when converting a sequence
+    graph to a pathway map
+    """
+    periods = [ActionPeriod(action) for action in actions]
+    conversions = [
+        ActionConversion(from_period, to_period)
+        for from_period, to_period in zip(periods[:-1], periods[1:])
+    ]
+    begins = [ActionBegin(action) for action in actions]
+    ends = [ActionEnd(action) for action in actions]
+
+    return [periods, conversions, begins, ends]
+
+
+def main() -> int:
+    rows = []
+
+    for nr_actions in nr_actions_to_test:
+        actions, _ = tree_dataset(nr_actions)
+
+        gc.collect()
+        tracemalloc.start()
+        nodes = create_nodes(actions)
+        nr_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        nr_nodes = sum(len(nodes_) for nodes_ in nodes)
+        rows.append([nr_actions, nr_nodes, nr_bytes / 2**20, nr_bytes / nr_nodes])
+        del nodes
+
+    print_table(["nr_actions", "nr_nodes", "memory (MiB)", "per node (B)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
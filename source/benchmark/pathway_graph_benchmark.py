@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the conversion of sequence graphs to pathway graphs, for deep chains and for diamond
+lattices of increasing size
+
+Chains are much deeper than Python's recursion limit. In diamond lattices the number of action
+periods in the pathway graph doubles with each diamond. The duration per action period must stay
+roughly constant in both cases.
+"""
+import sys
+
+from benchmark import (
+    chain_dataset,
+    diamond_lattice_dataset,
+    print_table,
+    time_call,
+)
+
+from adaptation_pathways.graph import SequenceGraph, sequence_graph_to_pathway_graph
+
+
+nr_actions_to_test = [1000, 10000, 100000]
+nr_diamonds_to_test = [8, 12, 16]
+
+
+def main() -> int:
+    rows = []
+    datasets = [
+        (f"chain({nr_actions})", chain_dataset(nr_actions))
+        for nr_actions in nr_actions_to_test
+    ] + [
+        (f"diamonds({nr_diamonds})", diamond_lattice_dataset(nr_diamonds))
+        for nr_diamonds in nr_diamonds_to_test
+    ]
+
+    for name, (actions, sequences) in datasets:
+        sequence_graph = SequenceGraph(sequences)
+        nr_action_periods: list[int] = []
+        duration = time_call(
+            sequence_graph_to_pathway_graph,
+            sequence_graph,
+            progress=nr_action_periods.append,
+        )
+        rows.append(
+            [
+                name,
+                len(actions),
+                nr_action_periods[-1],
+                duration,
+                1e6 * duration / nr_action_periods[-1],
+            ]
+        )
+
+    print_table(
+        [
+            "dataset",
+            "nr_actions",
+            "nr_action_periods",
+            "duration (s)",
+            "per action period (µs)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark the size, classic layout time and rendering time of pathway maps with and without
+shared prefixes, for trees of increasing size
+
+Without shared prefixes, the number of nodes in a pathway map is proportional to the number of
+pathways times their length. With shared prefixes, it is proportional to the number of actions.
+"""
+import sys
+
+from benchmark import print_table, time_call, tree_dataset
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from adaptation_pathways.graph import SequenceGraph, sequence_graph_to_pathway_map
+from adaptation_pathways.plot.pathway_map import plot_classic_pathway_map
+from adaptation_pathways.plot.pathway_map.classic import _layout
+from adaptation_pathways.plot.util import action_level_by_first_occurrence
+
+
+nr_actions_to_test = [500, 1000, 2000, 5000]
+
+
+def render(pathway_map, tipping_point_by_action) -> None:
+    figure = Figure()
+    axes = figure.subplots()
+    plot_classic_pathway_map(
+        axes, pathway_map, tipping_point_by_action=tipping_point_by_action
+    )
+    FigureCanvasAgg(figure).draw()
+
+
+def main() -> int:
+    rows = []
+
+    for nr_actions in nr_actions_to_test:
+        actions, sequences = tree_dataset(nr_actions)
+
+        # Each action is the continuation of an action defined before it, so tipping points
+        # increase along each pathway
+        tipping_point_by_action = {
+            action: float(idx) for idx, action in enumerate(actions)
+        }
+        sequence_graph = SequenceGraph(sequences)
+
+        for share_prefixes in [False, True]:
+            pathway_map = sequence_graph_to_pathway_map(
+                sequence_graph, share_prefixes=share_prefixes
+            )
+            level_by_action_name = action_level_by_first_occurrence(pathway_map)
+
+            rows.append(
+                [
+                    nr_actions,
+                    "yes" if share_prefixes else "no",
+                    pathway_map.nr_nodes(),
+                    time_call(
+                        sequence_graph_to_pathway_map,
+                        sequence_graph,
+                        share_prefixes=share_prefixes,
+                        repeat=1,
+                    ),
+                    time_call(
+                        _layout,
+                        pathway_map,
+                        level_by_action_name=level_by_action_name,
+                        tipping_point_by_action=tipping_point_by_action,
+                        repeat=1,
+                    ),
+                    time_call(render, pathway_map, tipping_point_by_action, repeat=1),
+                ]
+            )
+
+    print_table(
+        [
+            "nr_actions",
+            "shared prefixes",
+            "nr_nodes",
+            "construction (s)",
+            "layout (s)",
+            "rendering (s)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark recalculating the estimated metric values of pathways after editing a project
+
+Per edit, the values are recalculated incrementally, for the pathways affected only, and
+completely, for all pathways and metrics, as was done before the recalculation was incremental.
+"""
+import sys
+
+from benchmark import pathways_project, print_table, time_call
+
+from adaptation_pathways.app.model.metric import MetricValue, MetricValueState
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+
+
+nr_pathways_to_test = [100, 1000, 10000]
+
+
+def recalculate_all(project: PathwaysProject) -> None:
+    for metric in project.all_metrics():
+        project.update_pathway_values(metric.id)
+
+
+def create_pathway(project: PathwaysProject) -> None:
+    parent = project.pathways_by_id[project.pathway_ids[-1]]
+    action_id = next(
+        action_id
+        for action_id in project.action_ids[1:]
+        if f"{parent.id}->{action_id}" not in project.pathways_by_id
+    )
+    pathway = project.create_pathway(action_id, parent.id)
+    project.delete_pathway(pathway.id)
+
+
+def edit_pathway_value(project: PathwaysProject) -> None:
+    pathway = project.pathways_by_id[project.pathway_ids[len(project.pathway_ids) // 2]]
+    metric_id = project.condition_ids[0]
+    pathway.metric_data[metric_id] = MetricValue(1.0, MetricValueState.OVERRIDE)
+    project.invalidate_pathway(pathway.id, metric_id)
+    project.update_values()
+
+
+def edit_action_effect(project: PathwaysProject) -> None:
+    action = project.get_action(project.action_ids[1])
+    metric_id = project.condition_ids[0]
+    action.metric_data[metric_id].value += 1
+    project.invalidate_action(action.id, metric_id)
+    project.update_values()
+
+
+def main() -> int:
+    rows = []
+
+    for nr_pathways in nr_pathways_to_test:
+        project = pathways_project(nr_pathways)
+        full_duration = time_call(recalculate_all, project)
+
+        for name, edit in [
+            ("create pathway", create_pathway),
+            ("edit pathway value", edit_pathway_value),
+            ("edit action effect", edit_action_effect),
+        ]:
+            duration = time_call(edit, project, repeat=10)
+            rows.append(
+                [
+                    nr_pathways,
+                    name,
+                    duration * 1000,
+                    full_duration * 1000,
+                    full_duration / duration,
+                ]
+            )
+
+    print_table(
+        [
+            "nr_pathways",
+            "edit",
+            "incremental (ms)",
+            "all (ms)",
+            "speedup",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark opening projects stored as JSON and in a container
+
+Opening a JSON file decodes the whole project. Opening a container only decodes the header,
+metrics, actions and the structure of the pathways. The time it takes to subsequently access
+a single scenario, and the metric values of all pathways, is measured as well.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import pathways_project, print_table, time_call
+
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service.project_service import ProjectService
+
+
+nr_pathways_to_test = [1000, 10000]
+nr_years_to_test = [80, 800]
+
+
+def save_json(project: PathwaysProject, path: Path) -> None:
+    path.write_text(ProjectService.to_json(project), encoding="utf-8")
+
+
+def open_and_access_scenario(pathname: Path) -> None:
+    project = ProjectService.from_file(pathname)
+    _ = project.scenarios_by_id[project.scenario_ids[0]].yearly_data
+
+
+def open_and_access_all(pathname: Path) -> None:
+    project = ProjectService.from_file(pathname)
+
+    for pathway in project.all_pathways:
+        _ = pathway.metric_data
+
+    for scenario in project.all_scenarios:
+        _ = scenario.yearly_data
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        directory_path = Path(directory_pathname)
+
+        for nr_pathways in nr_pathways_to_test:
+            for nr_years in nr_years_to_test:
+                # Ten scenarios, each containing values for each condition and year
+                project = pathways_project(nr_pathways, nr_years=nr_years)
+
+                for idx in range(9):
+                    project.copy_scenario(project.scenario_ids[0], f" ({idx})")
+
+                json_path = directory_path / "project.pwproj"
+                container_path = directory_path / "project.pwprojdb"
+
+                for name, path, save in [
+                    ("json", json_path, save_json),
+                    ("container", container_path, ProjectService.to_container),
+                ]:
+                    save_duration = time_call(save, project, path, repeat=1)
+
+                    rows.append(
+                        [
+                            nr_pathways,
+                            nr_years,
+                            name,
+                            path.stat().st_size / 2**20,
+                            save_duration,
+                            time_call(ProjectService.from_file, path),
+                            time_call(open_and_access_scenario, path),
+                            time_call(open_and_access_all, path),
+                        ]
+                    )
+
+    print_table(
+        [
+            "nr_pathways",
+            "nr_years",
+            "format",
+            "size (MiB)",
+            "save (s)",
+            "open (s)",
+            "+1 scenario (s)",
+            "+all (s)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark saving edits made to a project by appending them to a journal, compared to saving the
+whole project
+
+Each edit changes the metric value of a single pathway. Saving the whole project is done by
+compacting the journal. Recovering the project reads the snapshot and replays all edits in the
+journal.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import pathways_project, print_table, time_call
+
+from adaptation_pathways.app.model.metric import MetricValueState
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service.project_journal import ProjectJournal, recover
+
+
+nr_pathways_to_test = [1000, 10000]
+nr_edits = 100
+
+
+def edit_and_save(
+    project: PathwaysProject, journal: ProjectJournal, pathway_ids: list[str]
+) -> None:
+    for pathway_id in pathway_ids:
+        metric_value = project.pathways_by_id[pathway_id].metric_data["1"]
+        metric_value.value += 1
+        metric_value.state = MetricValueState.OVERRIDE
+        project.notify_changed("pathway", pathway_id)
+        journal.save()
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        for nr_pathways in nr_pathways_to_test:
+            project = pathways_project(nr_pathways)
+            pathname = Path(directory_pathname) / f"{nr_pathways}.pwprojdb"
+            journal = ProjectJournal(
+                project, pathname, max_nr_records=10 * nr_edits + 1
+            )
+
+            compact_duration = time_call(journal.compact, repeat=1)
+            save_duration = (
+                time_call(
+                    edit_and_save,
+                    project,
+                    journal,
+                    project.pathway_ids[-nr_edits:],
+                    repeat=1,
+                )
+                / nr_edits
+            )
+            recover_duration = time_call(recover, pathname, repeat=1)
+
+            rows.append(
+                [
+                    nr_pathways,
+                    compact_duration,
+                    save_duration,
+                    compact_duration / save_duration,
+                    recover_duration,
+                ]
+            )
+
+    print_table(
+        [
+            "nr_pathways",
+            "save project (s)",
+            "save edit (s)",
+            "speedup",
+            f"recover, {nr_edits} edits (s)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
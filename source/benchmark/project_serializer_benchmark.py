@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark saving and opening projects in the app, by converting them to JSON and back
+
+If jsonpickle is installed, the legacy format, written by earlier versions of the app, is
+benchmarked as well.
+"""
+import json
+import sys
+import typing
+
+from benchmark import pathways_project, print_table, time_call
+
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service import serialization
+from adaptation_pathways.app.service.project_service import ProjectService
+
+
+try:
+    import jsonpickle
+except ImportError:
+    jsonpickle = None
+
+
+nr_pathways_to_test = [100, 1000, 10000]
+
+
+def main() -> int:
+    formats: list[
+        tuple[
+            str,
+            typing.Callable[[PathwaysProject], str],
+            typing.Callable[[str], PathwaysProject],
+        ]
+    ] = [("schema", ProjectService.to_json, ProjectService.from_json)]
+
+    if jsonpickle is not None:
+        formats += [
+            ("jsonpickle", jsonpickle.encode, jsonpickle.decode),
+            (
+                "jsonpickle → schema",
+                jsonpickle.encode,
+                lambda text: serialization.project_from_legacy_value(json.loads(text)),
+            ),
+        ]
+
+    rows = []
+
+    for nr_pathways in nr_pathways_to_test:
+        project = pathways_project(nr_pathways)
+
+        for name, encode, decode in formats:
+            text = encode(project)
+            nr_megabytes = len(text.encode("utf-8")) / 2**20
+            encode_duration = time_call(encode, project)
+            decode_duration = time_call(decode, text)
+
+            rows.append(
+                [
+                    nr_pathways,
+                    name,
+                    nr_megabytes,
+                    encode_duration,
+                    decode_duration,
+                    nr_megabytes / encode_duration,
+                    nr_megabytes / decode_duration,
+                ]
+            )
+
+    print_table(
+        [
+            "nr_pathways",
+            "format",
+            "size (MiB)",
+            "encode (s)",
+            "decode (s)",
+            "encode (MiB/s)",
+            "decode (MiB/s)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark passing projects between Python and the browser in the web app
+
+The project is passed either as a single JSON text, or compressed, base64-encoded and in
+chunks. The messages containing the project are created, but not posted. Peak memory usage is
+measured using tracemalloc, and includes the memory used for converting the project to and from
+values following the schema.
+"""
+import json
+import sys
+import tracemalloc
+import typing
+
+from benchmark import pathways_project, print_table, time_call
+
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service import project_stream
+from adaptation_pathways.app.service.project_service import ProjectService
+
+
+nr_pathways_to_test = [100, 1000, 10000]
+
+
+def message(value: dict) -> str:
+    # The message as passed to run_js
+    return json.dumps(json.dumps(value))
+
+
+def save_text(project: PathwaysProject) -> int:
+    project_json = json.dumps(ProjectService.to_json(project))
+    message_json = json.dumps(
+        f'{{ "action": "save_project", "filename":"project.pwproj", "content":{project_json} }}'
+    )
+
+    return len(message_json)
+
+
+def save_chunks(project: PathwaysProject) -> int:
+    nr_characters = 0
+
+    for chunk in project_stream.iter_encoded(project):
+        nr_characters += len(
+            message({"action": "save_project_chunk", "content": chunk})
+        )
+
+    return nr_characters
+
+
+def open_text(text: str) -> PathwaysProject:
+    message_json = json.dumps({"action": "open_project_result", "payload": text})
+
+    return ProjectService.from_json(json.loads(message_json)["payload"])
+
+
+def open_chunks(chunks: list[str]) -> PathwaysProject:
+    decoder = project_stream.ProjectDecoder()
+
+    for chunk in chunks:
+        message_json = json.dumps({"action": "open_project_chunk", "payload": chunk})
+        decoder.feed(json.loads(message_json)["payload"])
+
+    return decoder.finish()
+
+
+def peak_memory(function, *args) -> float:
+    tracemalloc.start()
+    function(*args)
+    nr_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return nr_bytes / 2**20
+
+
+def main() -> int:
+    rows = []
+
+    for nr_pathways in nr_pathways_to_test:
+        project = pathways_project(nr_pathways)
+        text = ProjectService.to_json(project)
+        chunks = list(project_stream.iter_encoded(project))
+
+        transfers: list[tuple[str, typing.Callable, typing.Callable, typing.Any]] = [
+            ("text", save_text, open_text, text),
+            ("chunks", save_chunks, open_chunks, chunks),
+        ]
+
+        for name, save, open_, data in transfers:
+            rows.append(
+                [
+                    nr_pathways,
+                    name,
+                    save(project) / 2**20,
+                    time_call(save, project),
+                    peak_memory(save, project),
+                    time_call(open_, data),
+                    peak_memory(open_, data),
+                ]
+            )
+
+    print_table(
+        [
+            "nr_pathways",
+            "transfer",
+            "message size (MiB)",
+            "save (s)",
+            "save peak (MiB)",
+            "open (s)",
+            "open peak (MiB)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Benchmark the default sequence graph layout for trees of increasing size
+
+Looking up the from-actions of an action must be proportional to the in-degree of the action.
+In that case, the duration per action stays roughly constant as the number of actions grows.
+"""
+import sys
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.graph import SequenceGraph
+from adaptation_pathways.plot.sequence_graph.default import _layout
+
+
+nr_actions_to_test = [1000, 2000, 5000, 10000, 20000]
+
+
+def main() -> int:
+    rows = []
+
+    for nr_actions in nr_actions_to_test:
+        _, sequences = tree_dataset(nr_actions)
+        sequence_graph = SequenceGraph(sequences)
+        duration = time_call(_layout, sequence_graph)
+        rows.append([nr_actions, duration, 1e6 * duration / nr_actions])
+
+    print_table(["nr_actions", "duration (s)", "per action (µs)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
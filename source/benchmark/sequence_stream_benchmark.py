@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the peak memory usage of reading gzip compressed sequence files at once versus in
+batches, for files with an increasing number of lines
+"""
+import gc
+import gzip
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmark import print_table, tree_dataset
+
+from adaptation_pathways.io import text
+
+
+nr_lines_to_test = [10000, 100000, 1000000]
+
+
+def read_at_once(path: Path, actions) -> int:
+    sequences, _ = text.read_sequences(path, actions)
+
+    return len(sequences)
+
+
+def read_in_batches(path: Path, actions) -> int:
+    return sum(len(sequences) for sequences, _ in text.iter_sequences(path, actions))
+
+
+def peak_memory(function, *args) -> float:
+    """
+    Call the function passed in and return the peak amount of memory allocated, in MiB
+    """
+    gc.collect()
+    tracemalloc.start()
+    function(*args)
+    nr_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return nr_bytes / 2**20
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        for nr_lines in nr_lines_to_test:
+            actions, sequences = tree_dataset(nr_lines)
+            path = Path(directory_pathname) / f"dataset_{nr_lines}-sequence.txt.gz"
+
+            with gzip.open(path, "wt", encoding="utf8") as file:
+                file.write(f"{actions[0].name} {actions[0].name} 2000\n")
+
+                for from_action, to_action in sequences:
+                    file.write(f"{from_action.name} {to_action.name} 2000\n")
+
+            rows.append(
+                [
+                    nr_lines,
+                    peak_memory(read_at_once, path, actions),
+                    peak_memory(read_in_batches, path, actions),
+                ]
+            )
+
+    print_table(
+        ["nr_lines", "at once (MiB)", "in batches (MiB)"],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading and writing many small binary formatted datasets, one file per dataset
+versus using dataset stores
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.alias import TippingPointByAction
+from adaptation_pathways.io import binary
+from adaptation_pathways.io.store import Dataset, DirectoryStore, FileStore
+from adaptation_pathways.plot.alias import ColourByActionName
+
+
+nr_datasets = 1000
+nr_actions = 50
+
+
+def write_files(directory_path: Path, dataset_by_name: dict[str, Dataset]) -> None:
+    for name, (
+        actions,
+        sequences,
+        tipping_point_by_action,
+        colour_by_action_name,
+    ) in dataset_by_name.items():
+        binary.write_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            directory_path / f"{name}.apw",
+        )
+
+
+def read_files(directory_path: Path, names: list[str]) -> dict[str, Dataset]:
+    return {name: binary.read_dataset(directory_path / f"{name}.apw") for name in names}
+
+
+def main() -> int:
+    actions, sequences = tree_dataset(nr_actions)
+    tipping_point_by_action: TippingPointByAction = {
+        action: 2000 + idx for idx, action in enumerate(actions)
+    }
+    colour_by_action_name: ColourByActionName = {
+        action.name: (1, 0, 0, 1) for action in actions
+    }
+    dataset: Dataset = (
+        actions,
+        sequences,
+        tipping_point_by_action,
+        colour_by_action_name,
+    )
+    dataset_by_name = {f"dataset_{idx}": dataset for idx in range(nr_datasets)}
+    names = list(dataset_by_name)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        directory_path = Path(directory_pathname)
+
+        files_path = directory_path / "files"
+        files_path.mkdir()
+        rows.append(
+            [
+                "separate files",
+                time_call(write_files, files_path, dataset_by_name, repeat=1),
+                time_call(read_files, files_path, names),
+            ]
+        )
+
+        with DirectoryStore(
+            directory_path / "directory_store", max_nr_connections=nr_datasets
+        ) as store:
+            rows.append(
+                [
+                    "directory store",
+                    time_call(store.write_many, dataset_by_name, repeat=1),
+                    # Except for the first call, connections are reused
+                    time_call(store.read_many, names),
+                ]
+            )
+
+        with FileStore(directory_path / "file_store.db") as store:
+            rows.append(
+                [
+                    "file store",
+                    time_call(store.write_many, dataset_by_name, repeat=1),
+                    time_call(store.read_many, names),
+                ]
+            )
+
+    print(f"{nr_datasets} datasets of {nr_actions} actions")
+    print_table(["storage", "writing (s)", "reading (s)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
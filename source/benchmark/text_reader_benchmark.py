@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading text formatted datasets, for sequence files with an increasing number of lines
+
+The time it takes to read a dataset should be linear in the number of lines: the time per line
+should be (about) constant.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.io import text
+
+
+nr_lines_to_test = [10000, 100000, 1000000]
+
+
+def write_dataset(nr_actions: int, basename_pathname: str) -> None:
+    actions, sequences = tree_dataset(nr_actions)
+
+    with open(
+        text.format_actions_path(basename_pathname), "w", encoding="utf8"
+    ) as file:
+        for action in actions:
+            file.write(f"{action.name} #ff0000ff\n")
+
+    with open(
+        text.format_sequences_path(basename_pathname), "w", encoding="utf8"
+    ) as file:
+        file.write(f"{actions[0].name} {actions[0].name} 2000\n")
+
+        for idx, (from_action, to_action) in enumerate(sequences):
+            file.write(f"{from_action.name} {to_action.name} {2000 + idx % 100}\n")
+
+
+def main() -> int:
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory_pathname:
+        for nr_lines in nr_lines_to_test:
+            basename_pathname = str(Path(directory_pathname) / f"dataset_{nr_lines}")
+
+            # Each action occurs once in the sequences file, and there is one root sequence
+            write_dataset(nr_lines, basename_pathname)
+            duration = time_call(text.read_dataset, basename_pathname, repeat=1)
+            rows.append([nr_lines, duration, 1e6 * duration / nr_lines])
+
+    print_table(["nr_lines", "reading (s)", "per line (us)"], rows)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark the verification of tipping points in pathway maps for trees of increasing size
+
+Each conversion in the pathway map is checked once, so the duration is proportional to the
+number of edges, and the duration per edge must stay roughly constant.
+"""
+import sys
+
+from benchmark import print_table, time_call, tree_dataset
+
+from adaptation_pathways.graph import (
+    SequenceGraph,
+    sequence_graph_to_pathway_map,
+    verify_tipping_points,
+)
+
+
+nr_actions_to_test = [1000, 5000, 20000]
+
+
+def main() -> int:
+    rows = []
+
+    for nr_actions in nr_actions_to_test:
+        actions, sequences = tree_dataset(nr_actions)
+
+        # Each action is the continuation of an action defined before it, so tipping points
+        # increase along each pathway
+        tipping_point_by_action = {
+            action: float(idx) for idx, action in enumerate(actions)
+        }
+        sequence_graph = SequenceGraph(sequences)
+
+        for share_prefixes in [False, True]:
+            pathway_map = sequence_graph_to_pathway_map(
+                sequence_graph, share_prefixes=share_prefixes
+            )
+            duration = time_call(
+                verify_tipping_points, pathway_map, tipping_point_by_action
+            )
+            rows.append(
+                [
+                    nr_actions,
+                    "yes" if share_prefixes else "no",
+                    pathway_map.nr_edges(),
+                    duration,
+                    1e6 * duration / pathway_map.nr_edges(),
+                ]
+            )
+
+    print_table(
+        [
+            "nr_actions",
+            "shared prefixes",
+            "nr_edges",
+            "duration (s)",
+            "per edge (µs)",
+        ],
+        rows,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
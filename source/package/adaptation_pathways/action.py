@@ -30,6 +30,15 @@ class Action:
     def __repr__(self) -> str:
         return f'Action("{self._name}")'
 
+    def __copy__(self) -> "Action":
+        # Shallow copy, like the default implementation, but without the overhead of the
+        # generic copy protocol. Each edition of an action is a copy, and datasets can contain
+        # many of them.
+        action = self.__class__.__new__(self.__class__)
+        action.__dict__.update(self.__dict__)
+
+        return action
+
     @property
     def name(self) -> str:
         return self._name
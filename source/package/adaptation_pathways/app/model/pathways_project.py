@@ -3,7 +3,7 @@
 The single class that stores all data needed to work on a project
 """
 from json import JSONEncoder
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, MutableMapping
 
 from .action import Action
 from .metric import Metric, MetricEffect, MetricOperation, MetricValue, MetricValueState
@@ -25,7 +25,7 @@ class PathwaysProject:
         criteria_ids: list[str] | None = None,
         actions_by_id: dict[str, Action] | None = None,
         action_ids: list[str] | None = None,
-        scenarios_by_id: dict[str, Scenario] | None = None,
+        scenarios_by_id: MutableMapping[str, Scenario] | None = None,
         scenario_ids: list[str] | None = None,
         pathways_by_id: dict[str, Pathway] | None = None,
         pathway_ids: list[str] | None = None,
@@ -49,7 +49,7 @@ class PathwaysProject:
         self.criteria_by_id = criteria_by_id or {}
 
         self.scenario_ids = scenario_ids or []
-        self.scenarios_by_id = scenarios_by_id or {}
+        self.scenarios_by_id: MutableMapping[str, Scenario] = scenarios_by_id or {}
 
         self.action_ids = action_ids or []
         self.actions_by_id = actions_by_id or {}
@@ -65,6 +65,15 @@ class PathwaysProject:
         self.graph_scenario_id = graph_scenario_id or "none"
         self.graph_is_time = graph_is_time
 
+        # Called with the kind and ID of each object created, changed or deleted. Kinds are
+        # "project", "condition", "criteria", "scenario", "action" and "pathway".
+        self.change_listeners: list[Callable[[str, str], None]] = []
+
+        # Per metric ID the IDs of the pathways whose estimated values, and those of their
+        # descendants, must be recalculated
+        self._dirty_pathway_ids: dict[str, set[str]] = {}
+        self._pathway_index: _PathwayIndex | None = None
+
     def __hash__(self):
         return self.id.__hash__()
 
@@ -104,6 +113,21 @@ class PathwaysProject:
     def graph_scenario(self):
         return self.get_scenario(self.graph_scenario_id)
 
+    def notify_changed(self, kind: str, object_id: str):
+        """
+        Notify listeners about an object which was created, changed or deleted
+
+        Methods of the project call this themselves. Code changing objects directly must call
+        it as well. For pathways, this also updates the project's index of the children and
+        actions of pathways, which is needed after changing the parent or action of a pathway,
+        or after replacing it.
+        """
+        if kind == "pathway" and self._pathway_index is not None:
+            self._pathway_index.update(object_id, self.pathways_by_id.get(object_id))
+
+        for listener in self.change_listeners:
+            listener(kind, object_id)
+
     def _create_id(self) -> str:
         self._current_id += 1
         return str(self._current_id)
@@ -119,22 +143,28 @@ class PathwaysProject:
         yield from self.all_criteria
 
     def _create_metric(
-        self, name: str, metrics_by_id: dict[str, Metric], metric_ids: list[str]
+        self,
+        name: str,
+        metrics_by_id: dict[str, Metric],
+        metric_ids: list[str],
+        kind: str,
     ) -> Metric:
         metric_id = self._create_id()
         metric = Metric(metric_id, name, "")
         metrics_by_id[metric_id] = metric
         metric_ids.append(metric_id)
+        self.notify_changed(kind, metric_id)
 
         for action in self.all_actions:
             action.metric_data[metric_id] = MetricEffect(0, MetricOperation.ADD)
+            self.notify_changed("action", action.id)
 
         self.update_pathway_values(metric.id)
         return metric
 
     def create_condition(self) -> Metric:
         metric = self._create_metric(
-            "New Condition", self.conditions_by_id, self.condition_ids
+            "New Condition", self.conditions_by_id, self.condition_ids, "condition"
         )
         if self.graph_metric_id == "none":
             self.graph_metric_id = metric.id
@@ -143,18 +173,20 @@ class PathwaysProject:
 
     def create_criteria(self) -> Metric:
         metric = self._create_metric(
-            "New Criteria", self.criteria_by_id, self.criteria_ids
+            "New Criteria", self.criteria_by_id, self.criteria_ids, "criteria"
         )
         return metric
 
     def delete_condition(self, metric_id: str) -> Metric | None:
         metric = self.conditions_by_id.pop(metric_id)
         self.condition_ids.remove(metric_id)
+        self.notify_changed("condition", metric_id)
         return metric
 
     def delete_criteria(self, metric_id: str) -> Metric | None:
         metric = self.criteria_by_id.pop(metric_id)
         self.criteria_ids.remove(metric_id)
+        self.notify_changed("criteria", metric_id)
         return metric
 
     def get_scenario(self, scenario_id: str) -> Scenario | None:
@@ -165,6 +197,7 @@ class PathwaysProject:
         scenario = Scenario(scenario_id, name)
         self.scenarios_by_id[scenario.id] = scenario
         self.scenario_ids.append(scenario.id)
+        self.notify_changed("scenario", scenario.id)
 
         if self.graph_scenario_id == "none":
             self.graph_scenario_id = scenario_id
@@ -184,11 +217,13 @@ class PathwaysProject:
                     metric_data.value, metric_data.state
                 )
 
+        self.notify_changed("scenario", new_scenario.id)
         return new_scenario
 
     def delete_scenario(self, scenario_id: str) -> Scenario | None:
         scenario = self.scenarios_by_id.pop(scenario_id)
         self.scenario_ids.remove(scenario_id)
+        self.notify_changed("scenario", scenario_id)
         if self.graph_scenario_id == scenario_id:
             self.graph_scenario_id = (
                 self.scenario_ids[0] if len(self.scenario_ids) > 0 else "none"
@@ -199,6 +234,12 @@ class PathwaysProject:
         for scenario_id in scenario_ids:
             self.delete_scenario(scenario_id)
 
+    def set_scenario_data(
+        self, scenario_id: str, year: int, metric_id: str, value: MetricValue
+    ):
+        self.scenarios_by_id[scenario_id].set_data(year, metric_id, value)
+        self.notify_changed("scenario", scenario_id)
+
     def update_scenario_values(self, metric_id: str):
         for scenario in self.all_scenarios:
             scenario.recalculate_values(metric_id)
@@ -221,11 +262,13 @@ class PathwaysProject:
 
         self.actions_by_id[action.id] = action
         self.action_ids.append(action.id)
+        self.notify_changed("action", action.id)
         return action
 
     def delete_action(self, action_id: str) -> Action | None:
         action = self.actions_by_id.pop(action_id)
         self.action_ids.remove(action_id)
+        self.notify_changed("action", action_id)
         return action
 
     def delete_actions(self, action_ids: Iterable[str]):
@@ -250,28 +293,145 @@ class PathwaysProject:
         pathway = Pathway(action_id, parent_pathway_id)
         self.pathways_by_id[pathway.id] = pathway
         self.pathway_ids.append(pathway.id)
+        self.notify_changed("pathway", pathway.id)
 
-        for metric in self.all_metrics():
-            self.update_pathway_values(metric.id)
+        self.invalidate_pathway(pathway.id)
+        self.update_values()
 
         return pathway
 
-    def update_pathway_values(self, metric_id: str):
-        metric = self.get_metric(metric_id)
-        if metric is None:
+    def _get_pathway_index(self) -> "_PathwayIndex":
+        # Code adding, removing or changing pathways directly, instead of through the project,
+        # must call notify_changed or update_pathway_values afterwards, which update or rebuild
+        # the index. Replacing the collection of pathways, or changing the number of pathways,
+        # is also detected here.
+        if (
+            self._pathway_index is None
+            or self._pathway_index.pathways_by_id is not self.pathways_by_id
+            or self._pathway_index.nr_pathways != len(self.pathways_by_id)
+        ):
+            self._pathway_index = _PathwayIndex(self.pathways_by_id)
+
+        return self._pathway_index
+
+    def _metric_ids(self, metric_id: str | None) -> list[str]:
+        return (
+            [metric.id for metric in self.all_metrics()]
+            if metric_id is None
+            else [metric_id]
+        )
+
+    def invalidate_pathway(self, pathway_id: str, metric_id: str | None = None):
+        """
+        Mark the estimated values of the pathway passed in, and of its descendants, as
+        outdated
+
+        :param metric_id: ID of the metric whose values are outdated, or None for all metrics
+
+        Call :py:meth:`update_values` to recalculate the values.
+        """
+        for metric_id_ in self._metric_ids(metric_id):
+            self._dirty_pathway_ids.setdefault(metric_id_, set()).add(pathway_id)
+
+    def invalidate_action(self, action_id: str, metric_id: str | None = None):
+        """
+        Mark the estimated values of the pathways ending with the action passed in, and of
+        their descendants, as outdated, for example because an effect of the action changed
+
+        :param metric_id: ID of the metric whose values are outdated, or None for all metrics
+        """
+        pathway_ids = self._get_pathway_index().pathway_ids_by_action_id.get(
+            action_id, []
+        )
+
+        for metric_id_ in self._metric_ids(metric_id):
+            self._dirty_pathway_ids.setdefault(metric_id_, set()).update(pathway_ids)
+
+    def invalidate_metric(self, metric_id: str):
+        """
+        Mark the estimated values of all pathways for the metric passed in as outdated
+        """
+        # Pathways whose parent does not exist are treated as roots as well
+        self._dirty_pathway_ids[metric_id] = {
+            pathway.id
+            for pathway in self.pathways_by_id.values()
+            if pathway.parent_id is None or pathway.parent_id not in self.pathways_by_id
+        }
+
+    def update_values(self):
+        """
+        Recalculate the estimated values of the pathways marked as outdated, and of their
+        descendants
+
+        Pathways are visited parents first, so each value is calculated once, from the
+        up to date value of its parent. The time this takes depends on the number of
+        pathways affected, not on the size of the project.
+        """
+        dirty_pathway_ids = self._dirty_pathway_ids
+        self._dirty_pathway_ids = {}
+
+        if len(dirty_pathway_ids) == 0:
             return
 
-        updated_pathways: set[str] = set()
-        for pathway in self.all_pathways:
-            self._update_pathway_value(pathway, metric, updated_pathways)
+        index = self._get_pathway_index()
 
-    def _update_pathway_value(
-        self, pathway: Pathway, metric: Metric, updated_pathway_ids: set[str]
+        for metric_id, pathway_ids in dirty_pathway_ids.items():
+            metric = self.get_metric(metric_id)
+            if metric is None:
+                continue
+
+            # Starting at the pathways closest to a root makes sure descendants of a dirty
+            # pathway are calculated after it, even if they were marked dirty themselves
+            pathways = sorted(
+                (
+                    pathway
+                    for pathway in map(self.get_pathway, pathway_ids)
+                    if pathway is not None
+                ),
+                key=lambda pathway: index.depth_by_id.get(pathway.id, 0),
+            )
+            updated_pathway_ids: set[str] = set()
+
+            for pathway in pathways:
+                if pathway.id not in updated_pathway_ids:
+                    self._update_subtree_values(
+                        pathway, metric, index, updated_pathway_ids
+                    )
+
+    def _update_subtree_values(
+        self,
+        pathway: Pathway,
+        metric: Metric,
+        index: "_PathwayIndex",
+        updated_pathway_ids: set[str],
     ):
-        pathway_action = self.get_action(pathway.action_id)
         parent = (
             None if pathway.parent_id is None else self.get_pathway(pathway.parent_id)
         )
+        stack = [(pathway, parent)]
+
+        while len(stack) > 0:
+            pathway, parent = stack.pop()
+            self._update_pathway_value(pathway, parent, metric)
+            updated_pathway_ids.add(pathway.id)
+
+            stack.extend(
+                (self.pathways_by_id[child_id], pathway)
+                for child_id in index.child_ids_by_id.get(pathway.id, [])
+            )
+
+    def update_pathway_values(self, metric_id: str):
+        """
+        Recalculate the estimated values of all pathways for the metric passed in
+        """
+        # Also rebuild the index, in case pathways were added or removed directly
+        self._pathway_index = None
+        self.invalidate_metric(metric_id)
+        self.update_values()
+
+    def _update_pathway_value(
+        self, pathway: Pathway, parent: Pathway | None, metric: Metric
+    ):
         current_value = pathway.metric_data.get(metric.id, None)
 
         # Initialize the value if there was none
@@ -288,29 +448,25 @@ class PathwaysProject:
 
         # If we have a non-estimate value, we don't need to update anything
         if current_value.state != MetricValueState.ESTIMATE:
-            updated_pathway_ids.add(pathway.id)
             return
 
         base_value: float = 0
         if parent is not None:
             parent_value = parent.metric_data.get(metric.id, None)
 
-            if (
-                parent.id not in updated_pathway_ids
-                and parent_value is not None
-                and parent_value.is_estimate
-            ):
-                self._update_pathway_value(parent, metric, updated_pathway_ids)
-
             if parent_value is not None:
                 base_value = parent_value.value
 
+        pathway_action = self.get_action(pathway.action_id)
         current_value.value = pathway_action.apply_effect(metric.id, base_value)
-        updated_pathway_ids.add(pathway.id)
 
     def delete_pathway(self, pathway_id: str) -> Pathway | None:
         pathway = self.pathways_by_id.pop(pathway_id, None)
-        self.pathway_ids.append(pathway_id)
+
+        if pathway is not None:
+            self.pathway_ids.remove(pathway_id)
+            self.notify_changed("pathway", pathway_id)
+
         return pathway
 
     def delete_pathways(self, pathway_ids: Iterable[str]):
@@ -318,20 +474,19 @@ class PathwaysProject:
         ids_to_delete.update(pathway_ids)
 
         # Delete any orphaned children
-        for pathway in self.all_pathways:
-            if pathway.id in ids_to_delete:
-                continue
-
-            for ancestor in self.get_ancestors(pathway):
-                if ancestor.id in ids_to_delete:
-                    ids_to_delete.add(pathway.id)
+        index = self._get_pathway_index()
+        for pathway_id in list(ids_to_delete):
+            ids_to_delete.update(index.descendant_ids(pathway_id))
 
         for pathway_id in ids_to_delete:
             self.delete_pathway(pathway_id)
 
     def get_children(self, pathway_id: str):
         return (
-            pathway for pathway in self.all_pathways if pathway.parent_id == pathway_id
+            self.pathways_by_id[child_id]
+            for child_id in self._get_pathway_index().child_ids_by_id.get(
+                pathway_id, []
+            )
         )
 
     def get_ancestors(self, pathway: Pathway):
@@ -355,6 +510,109 @@ class PathwaysProject:
                 current_pathway = None
 
 
+class _PathwayIndex:
+    """
+    Children, depth and pathways per action, by ID, of the pathways of a project
+
+    Pathways whose parent is not indexed are roots, with depth zero. The parent and action of
+    each pathway are stored as they were indexed, so a pathway can be updated after they
+    changed.
+    """
+
+    def __init__(self, pathways_by_id: dict[str, Pathway]):
+        # Collection of pathways indexed, used for detecting that it was replaced
+        self.pathways_by_id = pathways_by_id
+        self.child_ids_by_id: dict[str, list[str]] = {}
+        self.pathway_ids_by_action_id: dict[str, list[str]] = {}
+        self.depth_by_id: dict[str, int] = {}
+        self._parent_and_action_id_by_id: dict[str, tuple[str | None, str]] = {}
+
+        for pathway in pathways_by_id.values():
+            self._add(pathway)
+
+        for pathway_id, (parent_id, _) in self._parent_and_action_id_by_id.items():
+            if parent_id not in self._parent_and_action_id_by_id:
+                self._update_depths(pathway_id)
+
+    @property
+    def nr_pathways(self) -> int:
+        return len(self._parent_and_action_id_by_id)
+
+    def update(self, pathway_id: str, pathway: Pathway | None):
+        """
+        Update the index after the pathway with the ID passed in was added, changed, replaced
+        or removed
+
+        :param pathway: The pathway with the ID passed in, or None in case it was removed
+        """
+        if pathway is not None and self._parent_and_action_id_by_id.get(pathway_id) == (
+            pathway.parent_id,
+            pathway.action_id,
+        ):
+            return
+
+        if pathway_id in self._parent_and_action_id_by_id:
+            self._remove(pathway_id)
+
+        if pathway is not None:
+            self._add(pathway)
+            self._update_depths(pathway_id)
+
+    def _add(self, pathway: Pathway):
+        self._parent_and_action_id_by_id[pathway.id] = (
+            pathway.parent_id,
+            pathway.action_id,
+        )
+
+        if pathway.parent_id is not None:
+            self.child_ids_by_id.setdefault(pathway.parent_id, []).append(pathway.id)
+
+        self.pathway_ids_by_action_id.setdefault(pathway.action_id, []).append(
+            pathway.id
+        )
+
+    def _remove(self, pathway_id: str):
+        parent_id, action_id = self._parent_and_action_id_by_id.pop(pathway_id)
+
+        if parent_id is not None:
+            self.child_ids_by_id[parent_id].remove(pathway_id)
+
+        self.pathway_ids_by_action_id[action_id].remove(pathway_id)
+        self.depth_by_id.pop(pathway_id, None)
+
+        # Children of the pathway become roots, until it is added again
+        for child_id in self.child_ids_by_id.get(pathway_id, []):
+            self._update_depths(child_id)
+
+    def _update_depths(self, pathway_id: str):
+        """
+        Update the depth of the pathway passed in, and of its descendants
+        """
+        parent_id = self._parent_and_action_id_by_id[pathway_id][0]
+        depth = (
+            self.depth_by_id[parent_id] + 1
+            if parent_id is not None and parent_id in self._parent_and_action_id_by_id
+            else 0
+        )
+        stack = [(pathway_id, depth)]
+
+        while len(stack) > 0:
+            pathway_id, depth = stack.pop()
+            self.depth_by_id[pathway_id] = depth
+            stack.extend(
+                (child_id, depth + 1)
+                for child_id in self.child_ids_by_id.get(pathway_id, [])
+            )
+
+    def descendant_ids(self, pathway_id: str) -> Iterator[str]:
+        stack = list(self.child_ids_by_id.get(pathway_id, []))
+
+        while len(stack) > 0:
+            pathway_id = stack.pop()
+            yield pathway_id
+            stack.extend(self.child_ids_by_id.get(pathway_id, []))
+
+
 class PathwaysProjectEncoder(JSONEncoder):
     def default(self, o):
         return o.__dict__
@@ -78,7 +78,7 @@ class PlottingService:
             sequences.append((parent_action_node.action, action_node.action))
 
         # Mostly copied from plot_pathway_map.py
-        pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+        pathway_map = sequence_graph_to_pathway_map(sequence_graph, share_prefixes=True)
 
         verify_tipping_points(pathway_map, tipping_points)
 
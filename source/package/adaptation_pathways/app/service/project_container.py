@@ -0,0 +1,386 @@
+"""
+Storage of projects in a single file, whose sections can be read independently
+
+A project container is an SQLite database. The project's header, metrics, actions and the
+structure of the pathways are stored in a single record, which is read when the container is
+opened. Each scenario and the metric values of each pathway are stored in records of their own,
+which are only read and decoded when the project accesses them for the first time. The time it
+takes to open a project therefore depends on the number of pathways, not on the number of
+scenario years and metric values stored.
+
+The container is kept open until all records read on demand have been read, or until it is
+closed explicitly using :py:func:`close_container`. Records can be read from any thread.
+
+The contents of the records follow the schema used by :py:mod:`serialization`.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import typing
+import weakref
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+
+from ..model.metric import MetricValue
+from ..model.pathway import Pathway
+from ..model.pathways_project import PathwaysProject
+from ..model.scenario import Scenario
+from . import serialization
+
+
+container_version = 1
+
+_sqlite_header = b"SQLite format 3\0"
+
+_section_table_name = "section"
+_scenario_table_name = "scenario"
+_pathway_values_table_name = "pathway_values"
+
+
+def is_container(pathname: Path | str) -> bool:
+    """
+    Return whether the file passed in is a project container, instead of a text file
+    """
+    with open(pathname, "rb") as file:
+        return file.read(len(_sqlite_header)) == _sqlite_header
+
+
+def _create_tables(connection):
+    connection.execute(
+        f"""
+        CREATE TABLE {_section_table_name}
+        (
+            name TEXT NOT NULL,
+            content TEXT NOT NULL,
+
+            PRIMARY KEY (name)
+        )
+        """
+    )
+    connection.execute(
+        f"""
+        CREATE TABLE {_scenario_table_name}
+        (
+            position INTEGER NOT NULL,
+            scenario_id TEXT NOT NULL UNIQUE,
+            content TEXT NOT NULL,
+
+            PRIMARY KEY (position)
+        )
+        """
+    )
+    connection.execute(
+        f"""
+        CREATE TABLE {_pathway_values_table_name}
+        (
+            pathway_id TEXT NOT NULL,
+            content TEXT NOT NULL,
+
+            PRIMARY KEY (pathway_id)
+        )
+        """
+    )
+
+
+def _dumps(value: typing.Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_container(project: PathwaysProject, pathname: Path | str) -> None:
+    """
+    Save the project passed in to a container
+
+    Any existing file is replaced, once the new container has been written completely. Parts of
+    the project which have not been read yet from the container it was opened from, if any,
+    are read first.
+    """
+    value = serialization.project_to_value(project)
+
+    # All parts of the project have been read now. The container the project was read from
+    # may be the one replaced below.
+    close_container(project)
+
+    scenarios = value.pop("scenarios")
+    pathways = value.pop("pathways")
+
+    pathname = Path(pathname)
+    temporary_pathname = pathname.with_name(f".{pathname.name}.tmp")
+    temporary_pathname.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(temporary_pathname)
+
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+
+        with connection:
+            connection.execute(f"PRAGMA user_version = {container_version}")
+            _create_tables(connection)
+            connection.executemany(
+                f"INSERT INTO {_section_table_name} VALUES (?, ?)",
+                [
+                    ("header", _dumps(value)),
+                    (
+                        "pathways",
+                        _dumps(
+                            [
+                                [
+                                    pathway["id"],
+                                    pathway["action_id"],
+                                    pathway["parent_id"],
+                                ]
+                                for pathway in pathways
+                            ]
+                        ),
+                    ),
+                ],
+            )
+            connection.executemany(
+                f"INSERT INTO {_scenario_table_name} VALUES (?, ?, ?)",
+                (
+                    (position, scenario["id"], _dumps(scenario))
+                    for position, scenario in enumerate(scenarios)
+                ),
+            )
+            connection.executemany(
+                f"INSERT INTO {_pathway_values_table_name} VALUES (?, ?)",
+                (
+                    (pathway["id"], _dumps(pathway["values"]))
+                    for pathway in pathways
+                    if len(pathway["values"]) > 0
+                ),
+            )
+    finally:
+        connection.close()
+
+    os.replace(temporary_pathname, pathname)
+
+
+class _ContainerReader:
+    """
+    Read the records of a container on demand
+
+    The container is kept open until all records which are read on demand have been read or
+    discarded, or until it is closed. The app reads records from the threads its event handlers
+    run in, so the connection is shared between threads, one query at a time.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, nr_records: int) -> None:
+        self._connection: sqlite3.Connection | None = connection
+        self._nr_records_left = nr_records
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._close_if_done()
+
+    def _close_if_done(self) -> None:
+        if self._nr_records_left == 0 and self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _read(self, query: str, key: str) -> str | None:
+        with self._lock:
+            if self._connection is None:
+                raise RuntimeError("Project container is closed")
+
+            record = self._connection.execute(query, (key,)).fetchone()
+            self._nr_records_left -= 1
+            self._close_if_done()
+
+        return None if record is None else record[0]
+
+    def discard(self) -> None:
+        """
+        Account for a record which will not be read, because it was replaced or deleted
+        """
+        with self._lock:
+            self._nr_records_left -= 1
+            self._close_if_done()
+
+    def close(self) -> None:
+        with self._lock:
+            self._nr_records_left = 0
+            self._close_if_done()
+
+    def read_scenario(self, scenario_id: str) -> Scenario:
+        content = self._read(
+            f"SELECT content FROM {_scenario_table_name} WHERE scenario_id = ?",
+            scenario_id,
+        )
+        assert content is not None
+
+        return serialization.scenario_from_value(json.loads(content))
+
+    def read_pathway_values(self, pathway_id: str) -> dict[str, MetricValue]:
+        content = self._read(
+            f"SELECT content FROM {_pathway_values_table_name} WHERE pathway_id = ?",
+            pathway_id,
+        )
+
+        return (
+            {}
+            if content is None
+            else serialization.metric_values_from_value(json.loads(content))
+        )
+
+
+class LazyScenarios(MutableMapping[str, Scenario]):
+    """
+    Scenarios by ID, which are read from a container when accessed for the first time
+
+    Iterating over the IDs does not read the scenarios.
+    """
+
+    def __init__(self, reader: _ContainerReader, scenario_ids: list[str]) -> None:
+        self._reader = reader
+        self._scenario_by_id: dict[str, Scenario | None] = dict.fromkeys(scenario_ids)
+
+    def is_read(self, scenario_id: str) -> bool:
+        return self._scenario_by_id[scenario_id] is not None
+
+    def __getitem__(self, scenario_id: str) -> Scenario:
+        scenario = self._scenario_by_id[scenario_id]
+
+        if scenario is None:
+            scenario = self._reader.read_scenario(scenario_id)
+            self._scenario_by_id[scenario_id] = scenario
+
+        return scenario
+
+    def __setitem__(self, scenario_id: str, scenario: Scenario) -> None:
+        if scenario_id in self._scenario_by_id and not self.is_read(scenario_id):
+            self._reader.discard()
+
+        self._scenario_by_id[scenario_id] = scenario
+
+    def __delitem__(self, scenario_id: str) -> None:
+        if not self.is_read(scenario_id):
+            self._reader.discard()
+
+        del self._scenario_by_id[scenario_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scenario_by_id)
+
+    def __len__(self) -> int:
+        return len(self._scenario_by_id)
+
+
+class LazyPathway(Pathway):
+    """
+    Pathway whose metric values are read from a container when accessed for the first time
+    """
+
+    def __init__(
+        self,
+        reader: _ContainerReader,
+        pathway_id: str,
+        action_id: str,
+        parent_id: str | None = None,
+    ):
+        # The base class initializes the metric values, which must not discard the record
+        self._reader: _ContainerReader | None = None
+        super().__init__(action_id, parent_id)
+        self.id = pathway_id
+        self._reader = reader
+
+    @property  # type: ignore[override]
+    def metric_data(self) -> dict[str, MetricValue]:
+        if self._reader is not None:
+            self._metric_data = self._reader.read_pathway_values(self.id)
+            self._reader = None
+
+        return self._metric_data
+
+    @metric_data.setter
+    def metric_data(self, metric_data: dict[str, MetricValue]) -> None:
+        if self._reader is not None:
+            self._reader.discard()
+            self._reader = None
+
+        self._metric_data = metric_data
+
+    @property
+    def is_read(self) -> bool:
+        return self._reader is None
+
+
+def read_container(pathname: Path | str) -> PathwaysProject:
+    """
+    Open the container passed in and return the project stored in it
+
+    Only the header, metrics, actions and the structure of the pathways are read. Scenarios
+    and metric values of pathways are read when the project accesses them.
+
+    :raises ValueError: In case the file is not a project container of a supported version
+    """
+    pathname = Path(pathname)
+
+    if not pathname.exists():
+        raise ValueError(f"Project container {pathname} does not exist")
+
+    connection = sqlite3.connect(
+        f"file:{pathname}?mode=ro", uri=True, check_same_thread=False
+    )
+
+    try:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+
+        if version != container_version:
+            raise ValueError(
+                f"Version {version} of the project container format is not supported"
+            )
+
+        section_by_name = dict(
+            connection.execute(f"SELECT name, content FROM {_section_table_name}")
+        )
+        scenario_ids = [
+            record[0]
+            for record in connection.execute(
+                f"SELECT scenario_id FROM {_scenario_table_name} ORDER BY position"
+            )
+        ]
+        value = json.loads(section_by_name["header"])
+        pathways = json.loads(section_by_name["pathways"])
+        value["scenarios"] = []
+        value["pathways"] = []
+        project = serialization.project_from_value(value)
+    except (sqlite3.DatabaseError, KeyError) as exception:
+        connection.close()
+        raise ValueError(f"Invalid project container: {exception!r}") from exception
+    except ValueError:
+        connection.close()
+        raise
+
+    reader = _ContainerReader(connection, len(scenario_ids) + len(pathways))
+    project.scenarios_by_id = LazyScenarios(reader, scenario_ids)
+    project.pathways_by_id = {
+        pathway_id: LazyPathway(reader, pathway_id, action_id, parent_id)
+        for pathway_id, action_id, parent_id in pathways
+    }
+    _reader_by_project[project] = reader
+
+    return project
+
+
+# Readers of the containers projects were read from, for closing them explicitly
+_reader_by_project: "weakref.WeakKeyDictionary[PathwaysProject, _ContainerReader]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def close_container(project: PathwaysProject) -> None:
+    """
+    Close the container the project passed in was read from, if it is still open
+
+    Call this when the project is not used anymore. Otherwise, the container is kept open
+    until all parts of the project read on demand have been read, which may never happen when
+    some of them were deleted. Parts of the project which have not been read yet cannot be read
+    afterwards.
+    """
+    reader = _reader_by_project.pop(project, None)
+
+    if reader is not None:
+        reader.close()
@@ -0,0 +1,365 @@
+"""
+Saving of the edits made to a project by appending them to a journal
+
+A journal is a text file stored next to the project file, the snapshot. Each line contains a
+JSON record. The first record identifies the snapshot the journal belongs to, by the hash of
+its contents. Each following record contains the current state of an object which was created
+or changed, or the ID of an object which was deleted. Saving the edits made since the previous
+save therefore takes time proportional to the number of objects edited, not to the size of the
+project.
+
+Compacting the journal writes the whole project to the snapshot and starts a new, empty
+journal. This is done when the journal contains many records, and when saving explicitly.
+
+After a crash, the project is recovered by reading the snapshot and replaying the journal.
+Incomplete records, written while crashing, are skipped.
+"""
+
+import hashlib
+import json
+import os
+import typing
+from pathlib import Path
+
+from ..model.pathways_project import PathwaysProject
+from . import project_container, serialization
+from .project_service import ProjectService
+
+
+journal_format_name = "adaptation_pathways.project_journal"
+journal_format_version = 1
+
+default_max_nr_records = 1000
+
+# Per kind of object: the names of the project's attributes containing the objects by ID and
+# the list of their IDs, and the functions for converting an object to and from a value
+_collection_by_kind: dict[str, tuple[str, str, typing.Callable, typing.Callable]] = {
+    "condition": (
+        "conditions_by_id",
+        "condition_ids",
+        serialization.metric_to_value,
+        serialization.metric_from_value,
+    ),
+    "criteria": (
+        "criteria_by_id",
+        "criteria_ids",
+        serialization.metric_to_value,
+        serialization.metric_from_value,
+    ),
+    "scenario": (
+        "scenarios_by_id",
+        "scenario_ids",
+        serialization.scenario_to_value,
+        serialization.scenario_from_value,
+    ),
+    "action": (
+        "actions_by_id",
+        "action_ids",
+        serialization.action_to_value,
+        serialization.action_from_value,
+    ),
+    "pathway": (
+        "pathways_by_id",
+        "pathway_ids",
+        serialization.pathway_to_value,
+        serialization.pathway_from_value,
+    ),
+}
+
+
+def journal_pathname(pathname: Path | str) -> Path:
+    """
+    Return the name of the journal belonging to the snapshot passed in
+    """
+    pathname = Path(pathname)
+
+    return pathname.with_name(f"{pathname.name}.journal")
+
+
+def _file_digest(pathname: Path) -> str:
+    digest = hashlib.sha256()
+
+    with open(pathname, "rb") as file:
+        for chunk in iter(lambda: file.read(2**20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _dumps(value: typing.Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _read_journal(pathname: Path) -> tuple[list[dict[str, typing.Any]], int] | None:
+    """
+    Read the records from the journal belonging to the snapshot passed in
+
+    :return: The records, excluding the first one, and the size of the part of the journal
+        containing complete records, or None in case there is no journal belonging to the
+        snapshot
+    """
+    journal_pathname_ = journal_pathname(pathname)
+
+    if not journal_pathname_.exists() or not pathname.exists():
+        return None
+
+    with open(journal_pathname_, "rb") as file:
+        lines = file.read().split(b"\n")
+
+    records = []
+    nr_bytes = 0
+
+    # The last line is empty, or contains a record which was not written completely
+    for line in lines[:-1]:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break
+
+        nr_bytes += len(line) + 1
+
+    if (
+        len(records) == 0
+        or records[0].get("format") != journal_format_name
+        or records[0].get("version") != journal_format_version
+        or records[0].get("snapshot") != _file_digest(pathname)
+    ):
+        # The journal belongs to another version of the snapshot, or is damaged
+        return None
+
+    return records[1:], nr_bytes
+
+
+def _replay(project: PathwaysProject, record: dict[str, typing.Any]) -> str:
+    """
+    Apply the record passed in to the project
+
+    :return: ID of the object created, changed or deleted
+    """
+    kind = record["kind"]
+
+    if kind == "project":
+        serialization.update_project_header(project, record["value"])
+        return project.id
+
+    by_id_name, ids_name, _, from_value = _collection_by_kind[kind]
+    objects_by_id = getattr(project, by_id_name)
+    object_ids = getattr(project, ids_name)
+
+    if "value" in record:
+        object_ = from_value(record["value"])
+        object_id = object_.id
+        objects_by_id[object_id] = object_
+
+        if object_id not in object_ids:
+            object_ids.append(object_id)
+    else:
+        object_id = record["id"]
+        objects_by_id.pop(object_id, None)
+
+        if object_id in object_ids:
+            object_ids.remove(object_id)
+
+    project.notify_changed(kind, object_id)
+
+    return object_id
+
+
+def _invalidate(project: PathwaysProject, kind: str, object_id: str) -> None:
+    """
+    Mark the estimated values of pathways affected by replaying a record as outdated
+    """
+    if kind == "pathway":
+        if object_id in project.pathways_by_id:
+            project.invalidate_pathway(object_id)
+        else:
+            # Children of a deleted pathway which are not deleted themselves become roots
+            for child in project.get_children(object_id):
+                project.invalidate_pathway(child.id)
+    elif kind == "action":
+        if object_id in project.actions_by_id:
+            project.invalidate_action(object_id)
+    elif kind in ("condition", "criteria"):
+        if project.get_metric(object_id) is not None:
+            project.invalidate_metric(object_id)
+
+
+def recover(pathname: Path | str) -> PathwaysProject:
+    """
+    Read the project from the snapshot passed in, and replay the edits saved in its journal
+
+    A journal which does not belong to the snapshot, because it was left behind by an
+    interrupted compaction or the snapshot was replaced, is ignored. After replaying the edits,
+    only the estimated metric values of the pathways affected by them are recalculated.
+
+    :raises ValueError: In case the snapshot does not contain a project
+    """
+    pathname = Path(pathname)
+    project = ProjectService.from_file(pathname)
+    journal = _read_journal(pathname)
+
+    if journal is not None and len(journal[0]) > 0:
+        # Kind and ID of the objects replayed, in the order of the first record
+        changes: dict[tuple[str, str], None] = {}
+
+        try:
+            for record in journal[0]:
+                changes[(record["kind"], _replay(project, record))] = None
+        except (KeyError, TypeError, ValueError) as exception:
+            raise ValueError(f"Invalid journal record: {exception!r}") from exception
+
+        for kind, object_id in changes:
+            _invalidate(project, kind, object_id)
+
+        project.update_values()
+
+    return project
+
+
+class ProjectJournal:
+    """
+    Journal recording the edits made to a project, for saving them incrementally
+
+    :param project: Project to record edits of. Edits are recorded by listening to the
+        changes the project notifies about.
+    :param pathname: Name of the snapshot. The journal is stored next to it.
+    :param container: Whether to write the snapshot as a project container, or as JSON
+    :param max_nr_records: Maximum number of records in the journal. When saving edits
+        results in more records, the journal is compacted.
+
+    In case the snapshot already has a journal, recorded edits are appended to it. Otherwise,
+    the first save compacts the journal.
+    """
+
+    def __init__(
+        self,
+        project: PathwaysProject,
+        pathname: Path | str,
+        *,
+        container: bool = True,
+        max_nr_records: int = default_max_nr_records,
+    ) -> None:
+        self._project = project
+        self._pathname = Path(pathname)
+        self._container = container
+        self._max_nr_records = max_nr_records
+
+        # Kind and ID of the objects changed since the last save, in the order of the first
+        # change
+        self._changes: dict[tuple[str, str], None] = {}
+        self._nr_records: int | None = None
+
+        journal = _read_journal(self._pathname)
+
+        if journal is not None:
+            records, nr_bytes = journal
+            self._nr_records = len(records)
+
+            # Remove an incomplete record, written while crashing
+            os.truncate(journal_pathname(self._pathname), nr_bytes)
+
+        project.change_listeners.append(self._record_change)
+
+    @property
+    def pathname(self) -> Path:
+        return self._pathname
+
+    @property
+    def has_changes(self) -> bool:
+        return len(self._changes) > 0
+
+    def _record_change(self, kind: str, object_id: str) -> None:
+        self._changes[(kind, object_id)] = None
+
+    def close(self) -> None:
+        """
+        Stop recording edits. Edits recorded but not saved yet are discarded.
+        """
+        self._project.change_listeners.remove(self._record_change)
+
+    def save(self) -> None:
+        """
+        Save the edits recorded since the previous save
+
+        The records are appended to the journal, and flushed to disk. In case this results in
+        a journal containing too many records, the journal is compacted.
+        """
+        if not self.has_changes:
+            return
+
+        if self._nr_records is None:
+            self.compact()
+            return
+
+        records = [
+            {
+                "kind": "project",
+                "value": serialization.project_header_to_value(self._project),
+            }
+        ]
+
+        for kind, object_id in self._changes:
+            if kind == "project":
+                # Information about the project itself is part of each save
+                continue
+
+            by_id_name, _, to_value, _ = _collection_by_kind[kind]
+            object_ = getattr(self._project, by_id_name).get(object_id, None)
+
+            records.append(
+                {"kind": kind, "id": object_id}
+                if object_ is None
+                else {"kind": kind, "value": to_value(object_)}
+            )
+
+        with open(journal_pathname(self._pathname), "a", encoding="utf-8") as file:
+            file.write("".join(f"{_dumps(record)}\n" for record in records))
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._changes.clear()
+        self._nr_records += len(records)
+
+        if self._nr_records > self._max_nr_records:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Write the whole project to the snapshot, and start a new, empty journal
+
+        The snapshot and the journal are each replaced once written completely. A journal left
+        behind when this is interrupted in between does not belong to the new snapshot, and is
+        ignored.
+        """
+        if self._container:
+            project_container.write_container(self._project, self._pathname)
+        else:
+            temporary_pathname = self._pathname.with_name(f".{self._pathname.name}.tmp")
+            temporary_pathname.write_text(
+                ProjectService.to_json(self._project), encoding="utf-8"
+            )
+            os.replace(temporary_pathname, self._pathname)
+
+        journal_pathname_ = journal_pathname(self._pathname)
+        temporary_pathname = journal_pathname_.with_name(
+            f".{journal_pathname_.name}.tmp"
+        )
+
+        with open(temporary_pathname, "w", encoding="utf-8") as file:
+            file.write(
+                _dumps(
+                    {
+                        "format": journal_format_name,
+                        "version": journal_format_version,
+                        "snapshot": _file_digest(self._pathname),
+                    }
+                )
+                + "\n"
+            )
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_pathname, journal_pathname_)
+
+        self._changes.clear()
+        self._nr_records = 0
@@ -1,20 +1,56 @@
 import base64
-
-import jsonpickle
+import json
+from pathlib import Path
 
 from ..model.pathways_project import PathwaysProject
+from . import project_container, project_stream, serialization
+
+
+data_url_prefix = "data:text/plain;base64,"
 
 
 class ProjectService:
     @staticmethod
     def to_json(project: PathwaysProject) -> str:
-        text: str = jsonpickle.encode(project)
-        return text
+        return json.dumps(
+            serialization.project_to_value(project),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
 
     @staticmethod
     def from_json(project_json: str) -> PathwaysProject:
-        project = jsonpickle.decode(project_json)
-        return project
+        """
+        Read a project saved by the current or an earlier version of the app
+
+        :raises ValueError: In case the text does not contain a project
+        """
+        value = json.loads(project_json)
+
+        if serialization.is_legacy_value(value):
+            return serialization.project_from_legacy_value(value)
+
+        return serialization.project_from_value(value)
+
+    @staticmethod
+    def to_container(project: PathwaysProject, pathname: Path | str):
+        project_container.write_container(project, pathname)
+
+    @staticmethod
+    def from_file(pathname: Path | str) -> PathwaysProject:
+        """
+        Read a project from a container or from a JSON file
+
+        Projects stored in a container are read lazily: scenarios and metric values of
+        pathways are read when used for the first time.
+
+        :raises ValueError: In case the file does not contain a project
+        """
+        if project_container.is_container(pathname):
+            return project_container.read_container(pathname)
+
+        with open(pathname, encoding="utf-8") as file:
+            return ProjectService.from_json(file.read())
 
     @staticmethod
     def to_data_url(project: PathwaysProject) -> str:
@@ -22,4 +58,29 @@ class ProjectService:
         text_bytes = text.encode("utf-8")
         text_64_bytes = base64.b64encode(text_bytes)
         text_64_str = text_64_bytes.decode("utf-8")
-        return f"data:text/plain;base64,{text_64_str}"
+        return f"{data_url_prefix}{text_64_str}"
+
+    @staticmethod
+    def to_compressed_data_url(project: PathwaysProject) -> str:
+        """
+        Return a data URL containing the compressed project
+
+        Use :py:func:`project_stream.iter_data_url` instead to obtain the URL in chunks,
+        without storing the uncompressed text.
+        """
+        return "".join(project_stream.iter_data_url(project))
+
+    @staticmethod
+    def from_data_url(data_url: str) -> PathwaysProject:
+        """
+        Read a project from a data URL returned by :py:meth:`to_data_url` or
+        :py:meth:`to_compressed_data_url`
+
+        :raises ValueError: In case the URL does not contain a project
+        """
+        if data_url.startswith(data_url_prefix):
+            text_64_str = data_url[len(data_url_prefix) :]
+            text_bytes = base64.b64decode(text_64_str, validate=True)
+            return ProjectService.from_json(text_bytes.decode("utf-8"))
+
+        return project_stream.decode([data_url])
@@ -0,0 +1,378 @@
+"""
+Conversion of projects to and from compressed, base64-encoded text, in chunks of bounded size
+
+Projects are converted to JSON, following the schema used by :py:mod:`serialization`, which is
+compressed using deflate (zlib format) and encoded using base64. The JSON text is never stored
+as a whole: it is compressed and encoded while it is being generated. Decoding works the other
+way around, on chunks of text passed in one at a time. The decompressed text is parsed while it
+arrives, one item of the project's lists at a time, so it is not stored as a whole either.
+
+This is used by the web app, which passes projects between Python and the browser in messages.
+The browser decompresses and compresses the data using its ``DecompressionStream`` and
+``CompressionStream`` classes.
+"""
+
+import base64
+import codecs
+import json
+import re
+import typing
+import zlib
+from collections.abc import Iterator
+
+from ..model.pathways_project import PathwaysProject
+from . import serialization
+
+
+data_url_prefix = "data:application/zlib;base64,"
+
+default_chunk_size = 2**16
+default_compression_level = 1
+
+
+# Reusing an encoder is faster than calling json.dumps with these arguments
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_dumps = _encoder.encode
+
+
+def _iter_json(value: dict[str, typing.Any]) -> Iterator[str]:
+    """
+    Yield the JSON text of the project value passed in, in pieces
+
+    Each list in the value is yielded per item. Each piece is converted at once, which is much
+    faster than using the incremental JSON encoder.
+    """
+    separator = "{"
+
+    for key, item in value.items():
+        yield f"{separator}{_dumps(key)}:"
+        separator = ","
+
+        if isinstance(item, list):
+            item_separator = "["
+
+            for list_item in item:
+                yield f"{item_separator}{_dumps(list_item)}"
+                item_separator = ","
+
+            yield "[]" if item_separator == "[" else "]"
+        else:
+            yield _dumps(item)
+
+    yield "{}" if separator == "{" else "}"
+
+
+def iter_compressed(
+    project: PathwaysProject,
+    *,
+    chunk_size: int = default_chunk_size,
+    compression_level: int = default_compression_level,
+) -> Iterator[bytes]:
+    """
+    Convert the project passed in to compressed JSON, and yield it in chunks
+
+    :param chunk_size: Size of the chunks, in bytes. Only the last chunk can be smaller.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, not {chunk_size}")
+
+    compressor = zlib.compressobj(compression_level)
+    buffer = bytearray()
+
+    def flush_buffer() -> Iterator[bytes]:
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+
+    pieces: list[str] = []
+    nr_characters = 0
+
+    # Compressing pieces in batches is much faster than compressing them one by one
+    for piece in _iter_json(serialization.project_to_value(project)):
+        pieces.append(piece)
+        nr_characters += len(piece)
+
+        if nr_characters >= chunk_size:
+            buffer += compressor.compress("".join(pieces).encode("utf-8"))
+            pieces.clear()
+            nr_characters = 0
+            yield from flush_buffer()
+
+    buffer += compressor.compress("".join(pieces).encode("utf-8"))
+    buffer += compressor.flush()
+    yield from flush_buffer()
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+def iter_encoded(
+    project: PathwaysProject,
+    *,
+    chunk_size: int = default_chunk_size,
+    compression_level: int = default_compression_level,
+) -> Iterator[str]:
+    """
+    Convert the project passed in to compressed JSON, encoded using base64, and yield it in
+    chunks
+
+    :param chunk_size: Maximum size of the chunks of compressed data encoded, in bytes. It is
+        rounded down to a multiple of three, so each chunk, except the last one, is encoded
+        without padding. Each chunk can be decoded on its own, and the concatenation of the
+        chunks is valid base64 as well.
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+
+    for chunk in iter_compressed(
+        project, chunk_size=chunk_size, compression_level=compression_level
+    ):
+        yield base64.b64encode(chunk).decode("ascii")
+
+
+def iter_data_url(
+    project: PathwaysProject,
+    *,
+    chunk_size: int = default_chunk_size,
+    compression_level: int = default_compression_level,
+) -> Iterator[str]:
+    """
+    Yield the data URL of the project passed in, in chunks
+
+    The first chunk is the prefix of the URL. The other chunks are the ones yielded by
+    :py:func:`iter_encoded`.
+    """
+    yield data_url_prefix
+    yield from iter_encoded(
+        project, chunk_size=chunk_size, compression_level=compression_level
+    )
+
+
+_non_whitespace = re.compile(r"[^ \t\n\r]")
+_value_terminators = frozenset(" \t\n\r,:]}")
+
+
+class _IncompleteText(Exception):
+    """
+    Raised when the text parsed so far ends before the next token or value is complete
+    """
+
+
+class _ObjectParser:
+    """
+    Incremental parser of a JSON object
+
+    Text is passed in piece by piece. Each value of the object is parsed once its text is
+    complete, and the text is discarded afterwards. Items of a list are parsed one at a time.
+    The memory used is therefore proportional to the size of the values parsed, plus the size of
+    the largest list item or other value, not to the size of the text.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._pending_pieces: list[str] = []
+        self._nr_pending_characters = 0
+        # Number of characters the text must have before parsing is retried, after it turned
+        # out to be incomplete. Retrying only once the text has doubled keeps parsing large
+        # values linear in their size.
+        self._min_nr_characters = 0
+        self._state = "begin"
+        self._key = ""
+        self._list: list[typing.Any] = []
+        self.value: dict[str, typing.Any] = {}
+
+    def feed(self, text: str) -> None:
+        self._pending_pieces.append(text)
+        self._nr_pending_characters += len(text)
+
+        if len(self._text) + self._nr_pending_characters >= self._min_nr_characters:
+            self._parse_text()
+
+    def finish(self) -> None:
+        """
+        :raises ValueError: In case the text does not contain a complete object
+        """
+        self._parse_text()
+
+        if self._state != "end":
+            raise ValueError("Project is incomplete or invalid")
+
+        if self._skip_whitespace(0)[1] != "":
+            raise ValueError("Project is followed by other text")
+
+    def _parse_text(self) -> None:
+        self._text += "".join(self._pending_pieces)
+        self._pending_pieces.clear()
+        self._nr_pending_characters = 0
+        position = 0
+
+        try:
+            while self._state != "end":
+                position = self._parse(position)
+        except _IncompleteText:
+            self._min_nr_characters = 2 * (len(self._text) - position)
+        else:
+            self._min_nr_characters = 0
+
+        self._text = self._text[position:]
+
+    def _skip_whitespace(self, position: int) -> tuple[int, str]:
+        """
+        :return: Position of the next token, and its first character, or an empty string in
+            case the text ends before it
+        """
+        match = _non_whitespace.search(self._text, position)
+
+        if match is None:
+            return len(self._text), ""
+
+        return match.start(), match.group()
+
+    def _expect(self, position: int, characters: str) -> tuple[int, str]:
+        position, character = self._skip_whitespace(position)
+
+        if character == "":
+            raise _IncompleteText()
+
+        if character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r} at position {position} of the project, "
+                f"not {character!r}"
+            )
+
+        return position + 1, character
+
+    def _decode(self, position: int) -> tuple[typing.Any, int]:
+        position, _ = self._skip_whitespace(position)
+
+        try:
+            value, end = self._decoder.raw_decode(self._text, position)
+        except json.JSONDecodeError as exception:
+            raise _IncompleteText() from exception
+
+        # A number may continue in the next piece of text. Inside an object each value is
+        # followed by whitespace or another token.
+        if end == len(self._text) or self._text[end] not in _value_terminators:
+            raise _IncompleteText()
+
+        return value, end
+
+    def _parse(self, position: int) -> int:
+        if self._state == "begin":
+            position, _ = self._expect(position, "{")
+            self._state = "first_key"
+        elif self._state in ("first_key", "key"):
+            position, character = self._skip_whitespace(position)
+
+            if self._state == "first_key" and character == "}":
+                self._state = "end"
+                return position + 1
+
+            key, position = self._decode(position)
+
+            if not isinstance(key, str):
+                raise ValueError("Keys of the project must be strings")
+
+            position, _ = self._expect(position, ":")
+            self._key = key
+            self._state = "value"
+        elif self._state == "value":
+            position, character = self._skip_whitespace(position)
+
+            if character == "[":
+                self._list = []
+                self.value[self._key] = self._list
+                self._state = "first_item"
+                position += 1
+            else:
+                self.value[self._key], position = self._decode(position)
+                self._state = "separator"
+        elif self._state in ("first_item", "item"):
+            position, character = self._skip_whitespace(position)
+
+            if self._state == "first_item" and character == "]":
+                self._state = "separator"
+                return position + 1
+
+            item, position = self._decode(position)
+            self._list.append(item)
+            self._state = "item_separator"
+        elif self._state == "item_separator":
+            position, character = self._expect(position, ",]")
+            self._state = "item" if character == "," else "separator"
+        elif self._state == "separator":
+            position, character = self._expect(position, ",}")
+            self._state = "key" if character == "," else "end"
+
+        return position
+
+
+class ProjectDecoder:
+    """
+    Decoder for projects converted by :py:func:`iter_encoded` or :py:func:`iter_data_url`
+
+    Pass the chunks to :py:meth:`feed`, in order, and call :py:meth:`finish` to obtain the
+    project. Each chunk must be valid base64 on its own. Chunks are decoded, decompressed and
+    parsed when passed in. Apart from the project's values, only the text of a single list item
+    or other value is kept, not the whole text.
+    """
+
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._parser = _ObjectParser()
+        self._is_first_chunk = True
+
+    def feed(self, chunk: str) -> None:
+        """
+        Decode, decompress and parse the chunk passed in
+
+        :raises ValueError: In case the chunk is not valid base64, does not contain compressed
+            data, or does not contain part of a JSON object
+        """
+        if self._is_first_chunk:
+            self._is_first_chunk = False
+
+            if chunk.startswith("data:"):
+                chunk = chunk.partition(",")[2]
+
+        try:
+            self._parser.feed(
+                self._text_decoder.decode(
+                    self._decompressor.decompress(
+                        base64.b64decode(chunk, validate=True)
+                    )
+                )
+            )
+        except zlib.error as exception:
+            raise ValueError(f"Invalid compressed project: {exception}") from exception
+
+    def finish(self) -> PathwaysProject:
+        """
+        Return the project decoded from the chunks passed in
+
+        :raises ValueError: In case the chunks do not contain a complete project
+        """
+        if not self._decompressor.eof:
+            raise ValueError("Compressed project is incomplete")
+
+        self._parser.feed(self._text_decoder.decode(b"", final=True))
+        self._parser.finish()
+        value = self._parser.value
+
+        if serialization.is_legacy_value(value):
+            return serialization.project_from_legacy_value(value)
+
+        return serialization.project_from_value(value)
+
+
+def decode(chunks: typing.Iterable[str]) -> PathwaysProject:
+    """
+    Decode a project from the chunks passed in
+    """
+    decoder = ProjectDecoder()
+
+    for chunk in chunks:
+        decoder.feed(chunk)
+
+    return decoder.finish()
@@ -0,0 +1,430 @@
+"""
+Conversion of projects to and from JSON-compatible values, following a versioned schema
+
+A project is converted to a dictionary containing only strings, numbers, booleans, None, lists
+and dictionaries. Objects referring to other objects do so by ID. Enumerations are stored by
+name. The dictionary contains the name of the format and the version of the schema, so future
+versions of the app can detect and convert older files.
+
+Projects saved by earlier versions of the app were converted using jsonpickle. These can still
+be read, without depending on jsonpickle. Only the classes of the project model are
+instantiated while doing so.
+"""
+
+import typing
+
+from ..model.action import Action
+from ..model.metric import (
+    Metric,
+    MetricEffect,
+    MetricOperation,
+    MetricUnit,
+    MetricValue,
+    MetricValueState,
+)
+from ..model.pathway import Pathway
+from ..model.pathways_project import PathwaysProject
+from ..model.scenario import Scenario, YearDataPoint
+
+
+format_name = "adaptation_pathways.project"
+format_version = 1
+
+_metric_value_state_by_name = {state.name: state for state in MetricValueState}
+_metric_operation_by_name = {operation.name: operation for operation in MetricOperation}
+
+
+def unit_to_value(unit: MetricUnit | str) -> dict[str, typing.Any] | str:
+    if isinstance(unit, str):
+        return unit
+
+    return {
+        "name": unit.name,
+        "symbol": unit.symbol,
+        "short_name": unit.short_name,
+        "symbol_plural": unit.symbol_plural,
+        "place_after_value": unit.place_after_value,
+        "value_format": unit.value_format,
+    }
+
+
+def unit_from_value(value: dict[str, typing.Any] | str) -> MetricUnit | str:
+    if isinstance(value, str):
+        return value
+
+    return MetricUnit(**value)
+
+
+def metric_to_value(metric: Metric) -> dict[str, typing.Any]:
+    return {
+        "id": metric.id,
+        "name": metric.name,
+        "unit": unit_to_value(metric.unit_or_default),
+    }
+
+
+def metric_from_value(value: dict[str, typing.Any]) -> Metric:
+    return Metric(value["id"], value["name"], unit_from_value(value["unit"]))
+
+
+def metric_values_to_value(
+    metric_data: dict[str, MetricValue],
+) -> dict[str, list[typing.Any]]:
+    """
+    Per metric ID, the value and the name of its state
+    """
+    return {
+        metric_id: [metric_value.value, metric_value.state.name]
+        for metric_id, metric_value in metric_data.items()
+    }
+
+
+def metric_values_from_value(
+    value: dict[str, list[typing.Any]],
+) -> dict[str, MetricValue]:
+    return {
+        metric_id: MetricValue(metric_value, _metric_value_state_by_name[state_name])
+        for metric_id, (metric_value, state_name) in value.items()
+    }
+
+
+def action_to_value(action: Action) -> dict[str, typing.Any]:
+    return {
+        "id": action.id,
+        "name": action.name,
+        "color": action.color,
+        "icon": action.icon,
+        "effects": {
+            metric_id: [effect.value, effect.operation.name]
+            for metric_id, effect in action.metric_data.items()
+        },
+    }
+
+
+def action_from_value(value: dict[str, typing.Any]) -> Action:
+    return Action(
+        value["id"],
+        value["name"],
+        value["color"],
+        value["icon"],
+        {
+            metric_id: MetricEffect(
+                effect_value, _metric_operation_by_name[operation_name]
+            )
+            for metric_id, (effect_value, operation_name) in value["effects"].items()
+        },
+    )
+
+
+def scenario_to_value(scenario: Scenario) -> dict[str, typing.Any]:
+    return {
+        "id": scenario.id,
+        "name": scenario.name,
+        "years": [
+            [year_data.year, metric_values_to_value(year_data.metric_data)]
+            for year_data in scenario.yearly_data
+        ],
+    }
+
+
+def scenario_from_value(value: dict[str, typing.Any]) -> Scenario:
+    scenario = Scenario(value["id"], value["name"])
+
+    for year, metric_data in value["years"]:
+        year_data = YearDataPoint(year)
+        year_data.metric_data = metric_values_from_value(metric_data)
+        scenario.yearly_data.append(year_data)
+
+    return scenario
+
+
+def pathway_to_value(pathway: Pathway) -> dict[str, typing.Any]:
+    return {
+        "id": pathway.id,
+        "action_id": pathway.action_id,
+        "parent_id": pathway.parent_id,
+        "values": metric_values_to_value(pathway.metric_data),
+    }
+
+
+def pathway_from_value(value: dict[str, typing.Any]) -> Pathway:
+    pathway = Pathway(value["action_id"], value["parent_id"])
+    pathway.id = value["id"]
+    pathway.metric_data = metric_values_from_value(value["values"])
+
+    return pathway
+
+
+def project_header_to_value(project: PathwaysProject) -> dict[str, typing.Any]:
+    """
+    Convert the information about the project itself, excluding its collections of objects
+    and the lists of their IDs, to a dictionary
+    """
+    # pylint: disable=protected-access
+    return {
+        "id": project.id,
+        "name": project.name,
+        "organization": project.organization,
+        "start_year": project.start_year,
+        "end_year": project.end_year,
+        "current_id": project._current_id,
+        "root_action_id": project.root_action_id,
+        "root_pathway_id": project.root_pathway_id,
+        "values_scenario_id": project.values_scenario_id,
+        "graph_metric_id": project.graph_metric_id,
+        "graph_scenario_id": project.graph_scenario_id,
+        "graph_is_time": project.graph_is_time,
+    }
+
+
+def update_project_header(
+    project: PathwaysProject, value: dict[str, typing.Any]
+) -> None:
+    """
+    Update the information about the project itself, using a dictionary created by
+    :py:func:`project_header_to_value`
+    """
+    # pylint: disable=protected-access
+    project.id = value["id"]
+    project.name = value["name"]
+    project.organization = value["organization"]
+    project.start_year = value["start_year"]
+    project.end_year = value["end_year"]
+    project._current_id = value["current_id"]
+    project.root_action_id = value["root_action_id"]
+    project.root_pathway_id = value["root_pathway_id"]
+    project.values_scenario_id = value["values_scenario_id"]
+    project.graph_metric_id = value["graph_metric_id"]
+    project.graph_scenario_id = value["graph_scenario_id"]
+    project.graph_is_time = value["graph_is_time"]
+
+
+def project_to_value(project: PathwaysProject) -> dict[str, typing.Any]:
+    """
+    Convert the project passed in to a dictionary following the current version of the schema
+
+    Collections of objects are stored as lists, in the order of the dictionaries by ID. The
+    lists of IDs determining the order in which objects are shown are stored separately.
+    """
+    return {
+        "format": format_name,
+        "version": format_version,
+        **project_header_to_value(project),
+        "conditions": [
+            metric_to_value(metric) for metric in project.conditions_by_id.values()
+        ],
+        "condition_ids": project.condition_ids,
+        "criteria": [
+            metric_to_value(metric) for metric in project.criteria_by_id.values()
+        ],
+        "criteria_ids": project.criteria_ids,
+        "scenarios": [
+            scenario_to_value(scenario) for scenario in project.scenarios_by_id.values()
+        ],
+        "scenario_ids": project.scenario_ids,
+        "actions": [
+            action_to_value(action) for action in project.actions_by_id.values()
+        ],
+        "action_ids": project.action_ids,
+        "pathways": [
+            pathway_to_value(pathway) for pathway in project.pathways_by_id.values()
+        ],
+        "pathway_ids": project.pathway_ids,
+    }
+
+
+def project_from_value(value: dict[str, typing.Any]) -> PathwaysProject:
+    """
+    Convert the dictionary passed in to a project
+
+    :raises ValueError: In case the dictionary does not follow a supported version of the
+        schema
+    """
+    if not isinstance(value, dict) or value.get("format") != format_name:
+        raise ValueError("Value does not contain a pathways project")
+
+    version = value.get("version")
+
+    if not isinstance(version, int) or not 1 <= version <= format_version:
+        raise ValueError(f"Version {version} of the project format is not supported")
+
+    try:
+        project = PathwaysProject(
+            project_id=value["id"],
+            name=value["name"],
+            organization=value["organization"],
+            start_year=value["start_year"],
+            end_year=value["end_year"],
+            conditions_by_id={
+                metric.id: metric
+                for metric in map(metric_from_value, value["conditions"])
+            },
+            condition_ids=value["condition_ids"],
+            criteria_by_id={
+                metric.id: metric
+                for metric in map(metric_from_value, value["criteria"])
+            },
+            criteria_ids=value["criteria_ids"],
+            actions_by_id={
+                action.id: action for action in map(action_from_value, value["actions"])
+            },
+            action_ids=value["action_ids"],
+            scenarios_by_id={
+                scenario.id: scenario
+                for scenario in map(scenario_from_value, value["scenarios"])
+            },
+            scenario_ids=value["scenario_ids"],
+            pathways_by_id={
+                pathway.id: pathway
+                for pathway in map(pathway_from_value, value["pathways"])
+            },
+            pathway_ids=value["pathway_ids"],
+            root_action_id=value["root_action_id"],
+            root_pathway_id=value["root_pathway_id"],
+            values_scenario_id=value["values_scenario_id"],
+            graph_metric_id=value["graph_metric_id"],
+            graph_scenario_id=value["graph_scenario_id"],
+            graph_is_time=value["graph_is_time"],
+        )
+        project._current_id = value["current_id"]  # pylint: disable=protected-access
+    except (KeyError, TypeError, ValueError) as exception:
+        raise ValueError(f"Invalid project: {exception!r}") from exception
+
+    return project
+
+
+# Classes which may be instantiated when reading legacy projects, by their unqualified name.
+# The module part of the names stored by jsonpickle depends on how the app imported the model.
+_legacy_class_by_name: dict[str, type] = {
+    class_.__name__: class_
+    for class_ in (
+        Action,
+        Metric,
+        MetricEffect,
+        MetricUnit,
+        MetricValue,
+        Pathway,
+        PathwaysProject,
+        Scenario,
+        YearDataPoint,
+    )
+}
+_legacy_enum_by_name: dict[str, type] = {
+    enum.__name__: enum for enum in (MetricOperation, MetricValueState)
+}
+
+
+def is_legacy_value(value: typing.Any) -> bool:
+    """
+    Return whether the value passed in is a project converted using jsonpickle
+    """
+    return isinstance(value, dict) and "py/object" in value
+
+
+class _LegacyDecoder:
+    """
+    Restore the objects in a value created by jsonpickle
+
+    jsonpickle replaces the second and later occurrences of an object by a reference to its
+    index in the order in which lists, dictionaries and objects are visited. Enumeration
+    members are singletons, so most of them are stored as references. The same order is used
+    here to resolve them.
+    """
+
+    def __init__(self) -> None:
+        self.objects: list[typing.Any] = []
+
+    def restore(self, value: typing.Any) -> typing.Any:
+        # pylint: disable=too-many-return-statements
+        if isinstance(value, list):
+            result: list[typing.Any] = []
+            self.objects.append(result)
+            result.extend(self.restore(element) for element in value)
+            return result
+
+        if not isinstance(value, dict):
+            return value
+
+        if "py/id" in value:
+            return self.objects[value["py/id"]]
+
+        if "py/tuple" in value:
+            return tuple(self.restore(element) for element in value["py/tuple"])
+
+        if "py/object" in value:
+            return self._restore_object(value)
+
+        if "py/reduce" in value:
+            return self._restore_enum(value)
+
+        if any(key.startswith("py/") for key in value):
+            raise ValueError(f"Unsupported jsonpickle value: {sorted(value)}")
+
+        result_dict: dict[str, typing.Any] = {}
+        self.objects.append(result_dict)
+
+        for key, element in value.items():
+            result_dict[key] = self.restore(element)
+
+        return result_dict
+
+    def _restore_object(self, value: dict[str, typing.Any]) -> typing.Any:
+        class_name = value["py/object"].rpartition(".")[2]
+
+        if class_name not in _legacy_class_by_name:
+            raise ValueError(
+                f"Unsupported class in legacy project: {value['py/object']}"
+            )
+
+        class_ = _legacy_class_by_name[class_name]
+        instance: typing.Any = (
+            # Attributes added to projects after the file was saved get their default value
+            PathwaysProject("", "", "", 0, 0)
+            if class_ is PathwaysProject
+            else object.__new__(class_)
+        )
+        self.objects.append(instance)
+        instance.__dict__.update(
+            {
+                key: self.restore(element)
+                for key, element in value.items()
+                if key != "py/object"
+            }
+        )
+
+        return instance
+
+    def _restore_enum(self, value: dict[str, typing.Any]) -> typing.Any:
+        index = len(self.objects)
+        self.objects.append(None)
+
+        try:
+            type_, arguments = value["py/reduce"][:2]
+            enum = _legacy_enum_by_name[type_["py/type"].rpartition(".")[2]]
+        except (KeyError, TypeError, ValueError) as exception:
+            raise ValueError(
+                f"Unsupported jsonpickle value: {value['py/reduce']!r}"
+            ) from exception
+
+        member = enum(*self.restore(arguments))
+        self.objects[index] = member
+
+        return member
+
+
+def project_from_legacy_value(value: dict[str, typing.Any]) -> PathwaysProject:
+    """
+    Convert the dictionary passed in, created by jsonpickle, to a project
+
+    :raises ValueError: In case the dictionary contains something else than a project, or
+        objects of classes not part of the project model
+    """
+    try:
+        project = _LegacyDecoder().restore(value)
+    except (AttributeError, IndexError, KeyError, TypeError) as exception:
+        raise ValueError(f"Invalid legacy project: {exception!r}") from exception
+
+    if not isinstance(project, PathwaysProject):
+        raise ValueError("Value does not contain a pathways project")
+
+    return project
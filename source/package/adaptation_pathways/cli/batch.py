@@ -0,0 +1,137 @@
+"""
+This module contains code shared between the command-line utilities for converting many
+datasets at once
+"""
+
+import collections
+import concurrent.futures
+import functools
+import glob
+import os
+import sys
+import typing
+
+import docopt
+
+
+def input_pathnames(input_pathname: str, pattern: str) -> list[str]:
+    """
+    :param input_pathname: Name of a directory, or a glob pattern
+    :param pattern: Pattern of the names of the files to select in case a directory is passed in
+    :return: Sorted names of the files selected
+    """
+    if os.path.isdir(input_pathname):
+        input_pathname = os.path.join(glob.escape(input_pathname), pattern)
+
+    return sorted(
+        pathname for pathname in glob.glob(input_pathname) if os.path.isfile(pathname)
+    )
+
+
+def parse_nr_workers(nr_workers: str | None) -> int | None:
+    """
+    Parse the value of the --workers option
+
+    :raises docopt.DocoptExit: In case the value is not a positive integer. This prints the
+        usage and exits.
+    """
+    if nr_workers is None:
+        return None
+
+    try:
+        result = int(nr_workers)
+    except ValueError:
+        result = 0
+
+    if result < 1:
+        raise docopt.DocoptExit(
+            f"Number of workers must be a positive integer, not {nr_workers}"
+        )
+
+    return result
+
+
+def _call(function: typing.Callable, arguments: tuple) -> str | None:
+    # Errors are returned instead of raised, so the other conversions continue
+    try:
+        function(*arguments)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return f"{type(error).__name__}: {error}"
+
+    return None
+
+
+def convert_many(
+    function: typing.Callable,
+    arguments: list[tuple],
+    *,
+    nr_workers: int | None = None,
+    verb: str = "Converted",
+) -> int:
+    """
+    Call the function passed in once for each tuple of arguments, print a summary and return
+    an exit status
+
+    :param function: Function to call. It must be defined at module level, so it can be
+        passed to worker processes. Its first argument must be the name of the input, and its
+        second argument the name of the output.
+    :param arguments: Per call the arguments to pass in
+    :param nr_workers: Number of worker processes to use. By default the number of CPUs is
+        used. When one, all calls are performed in the current process.
+    :param verb: Verb to use in the summary
+    :return: 0 in case all calls succeeded, 1 in case at least one call failed or nothing
+        was converted
+
+    Calls continue after errors. The errors are printed to standard error, per input, after
+    all calls have finished.
+
+    :raises ValueError: In case multiple inputs would be converted to the same output. Nothing
+        is converted then.
+    """
+    if nr_workers is None:
+        nr_workers = os.cpu_count() or 1
+
+    if nr_workers < 1:
+        raise ValueError(f"Number of workers must be positive, not {nr_workers}")
+
+    input_pathnames_by_output: dict[str, list[str]] = collections.defaultdict(list)
+
+    for arguments_ in arguments:
+        input_pathnames_by_output[os.path.normpath(arguments_[1])].append(arguments_[0])
+
+    duplicates = [
+        f"{output_pathname} ({', '.join(input_pathnames_)})"
+        for output_pathname, input_pathnames_ in input_pathnames_by_output.items()
+        if len(input_pathnames_) > 1
+    ]
+
+    if len(duplicates) > 0:
+        raise ValueError(
+            f"Multiple inputs would be converted to the same output: {', '.join(duplicates)}"
+        )
+
+    call = functools.partial(_call, function)
+
+    if nr_workers == 1 or len(arguments) <= 1:
+        errors = list(map(call, arguments))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(nr_workers) as executor:
+            # Passing multiple calls to a worker at once reduces the communication overhead
+            chunk_size = max(1, len(arguments) // (4 * nr_workers))
+            errors = list(executor.map(call, arguments, chunksize=chunk_size))
+
+    nr_failed = 0
+
+    for arguments_, error in zip(arguments, errors):
+        if error is not None:
+            sys.stderr.write(f"{arguments_[0]}: {error}\n")
+            nr_failed += 1
+
+    summary = f"{verb} {len(arguments) - nr_failed} of {len(arguments)} datasets"
+
+    if nr_failed > 0:
+        summary += f" ({nr_failed} failed)"
+
+    sys.stdout.write(f"{summary}\n")
+
+    return 0 if nr_failed == 0 and len(arguments) > 0 else 1
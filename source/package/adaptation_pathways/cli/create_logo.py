@@ -38,7 +38,7 @@ def create_logo(plot_pathname: str) -> int:
         actions,
     )
     sequence_graph = SequenceGraph(sequences)
-    pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+    pathway_map = sequence_graph_to_pathway_map(sequence_graph, share_prefixes=True)
 
     _, axes = plt.subplots(layout="constrained")
     init_axes(axes)
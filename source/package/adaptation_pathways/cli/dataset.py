@@ -0,0 +1,78 @@
+"""
+This module contains code shared between the command-line utilities for reading datasets and
+converting them into graphs, optionally using a
+:py:class:`adaptation_pathways.io.cache.Cache`
+"""
+
+import functools
+
+from ..graph import (
+    PathwayGraph,
+    PathwayMap,
+    SequenceGraph,
+    pathway_graph_to_pathway_map,
+    sequence_graph_to_pathway_graph,
+    sequence_graph_to_pathway_map,
+    verify_tipping_points,
+)
+from ..io import read_dataset
+from ..io.cache import Cache, dataset_key
+from ..io.store import Dataset
+
+
+def _read_pathway_map(basename_pathname: str) -> tuple[Dataset, PathwayMap]:
+    dataset = read_dataset(basename_pathname)
+    sequence_graph = SequenceGraph(dataset[1])
+    pathway_map = sequence_graph_to_pathway_map(sequence_graph, share_prefixes=True)
+
+    verify_tipping_points(pathway_map, dataset[2])
+
+    return dataset, pathway_map
+
+
+def _read_graphs(
+    basename_pathname: str,
+) -> tuple[Dataset, SequenceGraph, PathwayGraph, PathwayMap]:
+    dataset = read_dataset(basename_pathname)
+    sequence_graph = SequenceGraph(dataset[1])
+    pathway_graph = sequence_graph_to_pathway_graph(sequence_graph)
+    pathway_map = pathway_graph_to_pathway_map(pathway_graph)
+
+    return dataset, sequence_graph, pathway_graph, pathway_map
+
+
+def read_pathway_map(
+    basename_pathname: str, cache_pathname: str | None = None
+) -> tuple[Dataset, PathwayMap]:
+    """
+    Read a dataset and convert it into a pathway map with shared prefixes, whose tipping
+    points are verified
+
+    :param cache_pathname: Name of the directory to cache the results in. By default no cache
+        is used.
+    """
+    if cache_pathname is None:
+        return _read_pathway_map(basename_pathname)
+
+    return Cache(cache_pathname).load_or_create(
+        dataset_key(basename_pathname, "pathway_map"),
+        functools.partial(_read_pathway_map, basename_pathname),
+    )
+
+
+def read_graphs(
+    basename_pathname: str, cache_pathname: str | None = None
+) -> tuple[Dataset, SequenceGraph, PathwayGraph, PathwayMap]:
+    """
+    Read a dataset and convert it into a sequence graph, pathway graph and pathway map
+
+    :param cache_pathname: Name of the directory to cache the results in. By default no cache
+        is used.
+    """
+    if cache_pathname is None:
+        return _read_graphs(basename_pathname)
+
+    return Cache(cache_pathname).load_or_create(
+        dataset_key(basename_pathname, "graphs"),
+        functools.partial(_read_graphs, basename_pathname),
+    )
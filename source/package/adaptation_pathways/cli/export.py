@@ -6,12 +6,14 @@ import docopt
 
 from ..io import binary, text
 from ..version import __version__ as version
+from .batch import convert_many, input_pathnames, parse_nr_workers
 from .main import main_function
 
 
-@main_function
-def export(dataset_pathname: str, basename_pathname: str) -> int:
-
+def export_dataset(dataset_pathname: str, basename_pathname: str) -> None:
+    """
+    Export the binary formatted dataset passed in to a text formatted dataset
+    """
     actions, sequences, tipping_point_by_action, colour_by_action_name = (
         binary.read_dataset(Path(dataset_pathname))
     )
@@ -24,9 +26,40 @@ def export(dataset_pathname: str, basename_pathname: str) -> int:
         basename_pathname,
     )
 
+
+@main_function
+def export(dataset_pathname: str, basename_pathname: str) -> int:
+
+    export_dataset(dataset_pathname, basename_pathname)
+
     return 0
 
 
+@main_function
+def export_many(
+    input_pathname: str, directory_pathname: str, nr_workers: int | None = None
+) -> int:
+
+    dataset_pathnames = input_pathnames(
+        input_pathname, f"*{binary.default_database_path_suffix}"
+    )
+
+    os.makedirs(directory_pathname, exist_ok=True)
+
+    return convert_many(
+        export_dataset,
+        [
+            (
+                dataset_pathname,
+                os.path.join(directory_pathname, Path(dataset_pathname).stem),
+            )
+            for dataset_pathname in dataset_pathnames
+        ],
+        nr_workers=nr_workers,
+        verb="Exported",
+    )
+
+
 def main() -> int:
     command = os.path.basename(sys.argv[0])
     usage = f"""\
@@ -34,16 +67,28 @@ Import text files to dataset
 
 Usage:
     {command} <dataset> <basename>
+    {command} --batch [--workers=<workers>] <input> <directory>
 
 Arguments:
     dataset            Pathname of dataset to export from
     basename           Name, without postfix and extension of group of files
                        to export to. Any existing output files will be
                        overwritten.
+    input              Name of directory containing datasets to export from,
+                       or glob pattern selecting the datasets to export from
+    directory          Name of directory to export groups of files to. Any
+                       existing output files will be overwritten.
 
 Options:
     -h --help          Show this screen and exit
     --version          Show version and exit
+    --batch            Export many datasets at once, using multiple
+                       processes. Errors do not stop the export of other
+                       datasets. A summary is printed at the end. The exit
+                       status is zero when all exports succeeded.
+    --workers=<workers>
+                       Number of processes to use. The default is the
+                       number of CPUs.
 
 Example:
     {command} serial.apw serial
@@ -54,9 +99,25 @@ This example exports information to the following files:
   (required)
 - serial-tipping_point.txt → Contains tipping points for each action edition
   (optional)
+
+Batch examples:
+    {command} --batch datasets archive
+    {command} --batch --workers=4 "datasets/serial*.apw" archive
 """
     arguments = sys.argv[1:]
     arguments = docopt.docopt(usage, arguments, version=version)
+
+    if arguments["--batch"]:  # type: ignore
+        input_pathname = arguments["<input>"]  # type: ignore
+        directory_pathname = arguments["<directory>"]  # type: ignore
+        nr_workers = parse_nr_workers(arguments["--workers"])  # type: ignore
+
+        return export_many(
+            input_pathname,
+            directory_pathname,
+            nr_workers,
+        )
+
     dataset_pathname = arguments["<dataset>"]  # type: ignore
     basename_pathname = arguments["<basename>"]  # type: ignore
 
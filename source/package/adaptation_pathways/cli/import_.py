@@ -6,12 +6,17 @@ import docopt
 
 from ..io import binary, text
 from ..version import __version__ as version
+from .batch import convert_many, input_pathnames, parse_nr_workers
 from .main import main_function
 
 
-@main_function
-def import_(basename_pathname: str, dataset_pathname: str) -> int:
+_actions_postfix = "-action.txt"
 
+
+def import_dataset(basename_pathname: str, dataset_pathname: str) -> None:
+    """
+    Import the text formatted dataset passed in to a binary formatted dataset
+    """
     actions, sequences, tipping_point_by_action, colour_by_action_name = (
         text.read_dataset(basename_pathname)
     )
@@ -22,11 +27,50 @@ def import_(basename_pathname: str, dataset_pathname: str) -> int:
         tipping_point_by_action,
         colour_by_action_name,
         Path(dataset_pathname),
+        bulk=True,
     )
 
+
+@main_function
+def import_(basename_pathname: str, dataset_pathname: str) -> int:
+
+    import_dataset(basename_pathname, dataset_pathname)
+
     return 0
 
 
+@main_function
+def import_many(
+    input_pathname: str, directory_pathname: str, nr_workers: int | None = None
+) -> int:
+
+    # Each text formatted dataset is selected by its file containing actions
+    basename_pathnames = [
+        pathname.removesuffix(_actions_postfix)
+        for pathname in input_pathnames(input_pathname, f"*{_actions_postfix}")
+        if pathname.endswith(_actions_postfix)
+    ]
+
+    os.makedirs(directory_pathname, exist_ok=True)
+
+    return convert_many(
+        import_dataset,
+        [
+            (
+                basename_pathname,
+                os.path.join(
+                    directory_pathname,
+                    f"{os.path.basename(basename_pathname)}"
+                    f"{binary.default_database_path_suffix}",
+                ),
+            )
+            for basename_pathname in basename_pathnames
+        ],
+        nr_workers=nr_workers,
+        verb="Imported",
+    )
+
+
 def main() -> int:
     command = os.path.basename(sys.argv[0])
     usage = f"""\
@@ -34,16 +78,29 @@ Import text files to dataset
 
 Usage:
     {command} <basename> <dataset>
+    {command} --batch [--workers=<workers>] <input> <directory>
 
 Arguments:
     basename           Name, without postfix and extension of group of files
                        to import from
     dataset            Pathname of dataset to import to. If the dataset
                        already exists, it will be overwritten.
+    input              Name of directory containing groups of files to import
+                       from, or glob pattern selecting the files containing
+                       actions of the groups of files to import from
+    directory          Name of directory to import datasets to. Existing
+                       datasets will be overwritten.
 
 Options:
     -h --help          Show this screen and exit
     --version          Show version and exit
+    --batch            Import many groups of files at once, using multiple
+                       processes. Errors do not stop the import of other
+                       groups of files. A summary is printed at the end. The
+                       exit status is zero when all imports succeeded.
+    --workers=<workers>
+                       Number of processes to use. The default is the
+                       number of CPUs.
 
 Example:
     {command} serial serial.apw
@@ -57,9 +114,25 @@ This example imports information from the following files:
 
 Information about how information in these file should be formatted can be
 found in the documentation.
+
+Batch examples:
+    {command} --batch archive datasets
+    {command} --batch --workers=4 "archive/serial*-action.txt" datasets
 """
     arguments = sys.argv[1:]
     arguments = docopt.docopt(usage, arguments, version=version)
+
+    if arguments["--batch"]:  # type: ignore
+        input_pathname = arguments["<input>"]  # type: ignore
+        directory_pathname = arguments["<directory>"]  # type: ignore
+        nr_workers = parse_nr_workers(arguments["--workers"])  # type: ignore
+
+        return import_many(
+            input_pathname,
+            directory_pathname,
+            nr_workers,
+        )
+
     basename_pathname = arguments["<basename>"]  # type: ignore
     dataset_pathname = arguments["<dataset>"]  # type: ignore
 
@@ -8,11 +8,11 @@ import matplotlib.pyplot as plt
 import adaptation_pathways as ap
 
 from ..graph import PathwayGraph, PathwayMap, SequenceGraph
-from ..io import read_dataset
 from ..plot.pathway_graph import plot_default_pathway_graph
 from ..plot.pathway_map import plot_default_pathway_map
 from ..plot.sequence_graph import plot_default_sequence_graph
 from ..plot.util import init_axes, save_plot
+from .dataset import read_graphs
 from .main import main_function
 
 
@@ -36,13 +36,17 @@ def plot_pathway_map(graph: PathwayMap, axes, arguments, pathname):
 
 @main_function
 def plot_graphs(
-    basename_pathname: str, plots_prefix_pathname: str, output_format: str
+    basename_pathname: str,
+    plots_prefix_pathname: str,
+    output_format: str,
+    cache_pathname: str | None = None,
 ) -> int:
 
-    # pylint: disable-next=unused-variable
-    actions, sequences, tipping_point_by_action, colour_by_action_name = read_dataset(
-        basename_pathname
+    dataset, sequence_graph, pathway_graph, pathway_map = read_graphs(
+        basename_pathname, cache_pathname
     )
+    # pylint: disable-next=unused-variable
+    actions, sequences, tipping_point_by_action, colour_by_action_name = dataset
 
     _, axes = plt.subplots(layout="constrained")
     init_axes(axes)
@@ -54,21 +58,18 @@ def plot_graphs(
         "colour_by_action_name": colour_by_action_name,
     }
 
-    sequence_graph = SequenceGraph(sequences)
     plot_pathname = os.path.join(
         plots_prefix_pathname, f"{basename}-sequence_graph.{output_format}"
     )
     arguments["title"] = "Sequence graph"
     plot_sequence_graph(sequence_graph, axes, arguments, plot_pathname)
 
-    pathway_graph = ap.graph.sequence_graph_to_pathway_graph(sequence_graph)
     plot_pathname = os.path.join(
         plots_prefix_pathname, f"{basename}-pathway_graph.{output_format}"
     )
     arguments["title"] = "Pathway graph"
     plot_pathway_graph(pathway_graph, axes, arguments, plot_pathname)
 
-    pathway_map = ap.graph.pathway_graph_to_pathway_map(pathway_graph)
     plot_pathname = os.path.join(
         plots_prefix_pathname, f"{basename}-pathway_map.{output_format}"
     )
@@ -84,7 +85,7 @@ def main() -> int:
 Plot sequence and pathway graphs
 
 Usage:
-    {command} [--format=<format>] <basename> <prefix>
+    {command} [--format=<format>] [--cache=<directory>] <basename> <prefix>
 
 Arguments:
     basename           Either, the name without postfix and extension of text
@@ -97,6 +98,10 @@ Arguments:
 Options:
     -h --help          Show this screen and exit
     --version          Show version and exit
+    --cache=<directory>
+                       Cache the dataset and graphs in this directory.
+                       Plotting an unchanged dataset again does not require
+                       reading and converting it again.
     --format=<format>  Output format for plots [default: pdf]
 
 Example:
@@ -108,5 +113,8 @@ Example:
     basename_pathname = arguments["<basename>"]  # type: ignore
     plots_prefix_pathname = arguments["<prefix>"]  # type: ignore
     output_format = arguments["--format"]  # type: ignore
+    cache_pathname = arguments["--cache"]  # type: ignore
 
-    return plot_graphs(basename_pathname, plots_prefix_pathname, output_format)
+    return plot_graphs(
+        basename_pathname, plots_prefix_pathname, output_format, cache_pathname
+    )
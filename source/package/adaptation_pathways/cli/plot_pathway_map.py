@@ -5,11 +5,10 @@ import typing
 import docopt
 import matplotlib.pyplot as plt
 
-from ..graph import SequenceGraph, sequence_graph_to_pathway_map, verify_tipping_points
-from ..io import read_dataset
 from ..plot.pathway_map import plot_classic_pathway_map
 from ..plot.util import init_axes, save_plot
 from ..version import __version__ as version
+from .dataset import read_pathway_map
 from .main import main_function
 
 
@@ -20,17 +19,11 @@ def plot_map(
     *,
     arguments,
     legend_arguments,
+    cache_pathname: str | None = None,
 ) -> int:
 
-    # pylint: disable-next=unused-variable
-    _, sequences, tipping_point_by_action, colour_by_action_name = read_dataset(
-        basename_pathname
-    )
-
-    sequence_graph = SequenceGraph(sequences)
-    pathway_map = sequence_graph_to_pathway_map(sequence_graph)
-
-    verify_tipping_points(pathway_map, tipping_point_by_action)
+    dataset, pathway_map = read_pathway_map(basename_pathname, cache_pathname)
+    _, _, tipping_point_by_action, colour_by_action_name = dataset
 
     _, axes = plt.subplots(layout="constrained")
     init_axes(axes)
@@ -83,7 +76,8 @@ Plot pathway map
 
 Usage:
     {command} [--title=<title>] [--x_label=<label>] [--show_legend]
-        [--overshoot] [--spread=<spread>] <basename> <plot>
+        [--overshoot] [--spread=<spread>] [--cache=<directory>]
+        <basename> <plot>
 
 Arguments:
     basename           Either, the name without postfix and extension of text
@@ -96,6 +90,10 @@ Arguments:
 Options:
     -h --help          Show this screen and exit
     --version          Show version and exit
+    --cache=<directory>
+                       Cache the dataset and pathway map in this directory.
+                       Plotting an unchanged dataset again does not require
+                       reading and converting it again.
     --overshoot        Show tipping points as overshoots, extending a little
                        bit beyond the actual point
     --show_legend      Show legend
@@ -151,4 +149,5 @@ Examples:
         plot_pathname,
         arguments=plot_arguments,
         legend_arguments=legend_arguments,
+        cache_pathname=arguments["--cache"],
     )
@@ -0,0 +1,69 @@
+import os.path
+import sys
+
+import docopt
+
+from ..graph import SequenceGraph
+from ..io import read_dataset
+from ..version import __version__ as version
+from .main import main_function
+
+
+@main_function
+def print_statistics(basename_pathname: str) -> int:
+
+    actions, sequences, _, _ = read_dataset(basename_pathname)
+
+    sequence_graph = SequenceGraph(sequences)
+    statistics = sequence_graph.path_statistics()
+    nr_occurrences_by_action_name = sequence_graph.nr_occurrences_by_action_name(
+        statistics
+    )
+
+    print(f"Number of actions: {len(actions)}")
+    print(f"Number of sequences: {sequence_graph.nr_sequences()}")
+    print(f"Number of pathways: {statistics.nr_paths}")
+
+    # The depth of a path is its number of sequences, which is one less than its number of actions
+    print("Number of pathways by number of actions:")
+
+    for depth, nr_paths in statistics.nr_paths_by_depth.items():
+        print(f"    {depth + 1}: {nr_paths}")
+
+    print("Number of occurrences in pathways by action:")
+
+    for action_name, nr_occurrences in nr_occurrences_by_action_name.items():
+        print(f"    {action_name}: {nr_occurrences}")
+
+    return 0
+
+
+def main() -> int:
+    command = os.path.basename(sys.argv[0])
+    usage = f"""\
+Print statistics about the pathways in a dataset
+
+Usage:
+    {command} <basename>
+
+Arguments:
+    basename           Either, the name without postfix and extension of text
+                       file(s) to read information from, or the name of a
+                       binary file to read information from.
+
+Options:
+    -h --help          Show this screen and exit
+    --version          Show version and exit
+
+The statistics are calculated without enumerating the pathways, so this
+command is also useful for datasets containing a very large number of
+pathways.
+
+Examples:
+    {command} serial
+    {command} serial.apw
+"""
+    arguments = docopt.docopt(usage, sys.argv[1:], version=version)
+    basename_pathname = arguments["<basename>"]
+
+    return print_statistics(basename_pathname)
@@ -0,0 +1,406 @@
+import array
+import typing
+
+import networkx as nx
+import numpy as np
+
+
+class _NodeView:
+    """
+    Read-only view on the nodes of a :class:`CompactDiGraph`, in insertion order
+    """
+
+    def __init__(self, graph: "CompactDiGraph") -> None:
+        self._graph = graph
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self._graph._nodes)
+
+    def __len__(self) -> int:
+        return len(self._graph._nodes)
+
+    def __contains__(self, node: typing.Any) -> bool:
+        return node in self._graph._id_by_node
+
+    def __call__(self) -> "_NodeView":
+        return self
+
+
+class _EdgeView:
+    """
+    Read-only view on the edges of a :class:`CompactDiGraph`
+
+    Edges are ordered by the insertion order of their from-node, and then by the insertion order of the
+    edge itself. This is the same order in which a ``networkx.DiGraph`` returns its edges.
+    """
+
+    def __init__(self, graph: "CompactDiGraph") -> None:
+        self._graph = graph
+
+    def __iter__(self) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        nodes = self._graph._nodes
+        sources, targets = self._graph.edge_ids()
+
+        for source_id, target_id in zip(sources.tolist(), targets.tolist()):
+            yield nodes[source_id], nodes[target_id]
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+    def __call__(self) -> "_EdgeView":
+        return self
+
+
+class CompactDiGraph:
+    """
+    Array-backed directed graph
+
+    This class implements the subset of the ``networkx.DiGraph`` API used by the
+    :class:`DirectedGraph` classes. Instead of storing nested dictionaries per node, each node is
+    associated with an integer ID, and the edges are stored in compressed sparse row (CSR) format:
+    per node an offset into an array of successor IDs, and the same for predecessor IDs. A side table
+    maps IDs to node instances.
+
+    Edges added are collected in a buffer. Queries about a single node combine the CSR arrays with
+    an index of the buffered edges, which is only created when needed. The buffer is merged into
+    the CSR arrays once it contains more edges than the arrays, or when a query about all edges is
+    performed. Adding edges and querying nodes can therefore be interleaved at an amortized cost
+    which does not depend on the size of the graph. Adding the same edge more than once has no
+    effect, like with ``networkx.DiGraph``.
+
+    Use this class for very large graphs, where the memory used by ``networkx.DiGraph`` becomes
+    an issue.
+    """
+
+    # Minimum number of buffered edges before they are merged into the CSR arrays
+    _min_nr_pending_edges = 2**16
+
+    _nodes: list[typing.Any]
+    _id_by_node: dict[typing.Any, int]
+
+    # Edges added since the CSR arrays were last built
+    _pending_sources: array.array
+    _pending_targets: array.array
+
+    # Per node ID the IDs of the successors and predecessors added since the CSR arrays were last
+    # built, or None if this index has not been created yet
+    _pending_successor_ids: dict[int, list[int]] | None
+    _pending_predecessor_ids: dict[int, list[int]] | None
+
+    _successor_offsets: np.ndarray
+    _successor_ids: np.ndarray
+    _predecessor_offsets: np.ndarray
+    _predecessor_ids: np.ndarray
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._nodes = []
+        self._id_by_node = {}
+        self._pending_sources = array.array("i")
+        self._pending_targets = array.array("i")
+        self._pending_successor_ids = None
+        self._pending_predecessor_ids = None
+        self._successor_offsets = np.zeros(1, dtype=np.int64)
+        self._successor_ids = np.zeros(0, dtype=np.int32)
+        self._predecessor_offsets = np.zeros(1, dtype=np.int64)
+        self._predecessor_ids = np.zeros(0, dtype=np.int32)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # The index of the pending edges is recreated when needed
+        state = self.__dict__.copy()
+        state["_pending_successor_ids"] = None
+        state["_pending_predecessor_ids"] = None
+
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__dict__.update(
+            {
+                "_version": 0,
+                "_pending_successor_ids": None,
+                "_pending_predecessor_ids": None,
+                **state,
+            }
+        )
+
+    def __contains__(self, node: typing.Any) -> bool:
+        return node in self._id_by_node
+
+    @property
+    def version(self) -> int:
+        """
+        :return: Number which changes each time a node or edge is added
+
+        Use it to find out whether information derived from the graph is out of date.
+        """
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _node_id(self, node: typing.Any) -> int:
+        try:
+            return self._id_by_node[node]
+        except KeyError as exception:
+            raise nx.NetworkXError(
+                f"The node {node} is not in the graph."
+            ) from exception
+
+    def _add_node(self, node: typing.Any) -> int:
+        node_id = self._id_by_node.get(node)
+
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._id_by_node[node] = node_id
+            self._nodes.append(node)
+            self._version += 1
+
+        return node_id
+
+    def add_node(self, node: typing.Any) -> None:
+        self._add_node(node)
+
+    def add_edge(self, from_node: typing.Any, to_node: typing.Any) -> None:
+        from_id = self._add_node(from_node)
+        to_id = self._add_node(to_node)
+        self._pending_sources.append(from_id)
+        self._pending_targets.append(to_id)
+        self._version += 1
+
+        if self._pending_successor_ids is not None:
+            self._index_pending_edge(from_id, to_id)
+
+    def add_edges_from(
+        self, edges: typing.Iterable[tuple[typing.Any, typing.Any]]
+    ) -> None:
+        for from_node, to_node in edges:
+            self.add_edge(from_node, to_node)
+
+    def _build(self) -> None:
+        """
+        Merge the pending edges into the CSR arrays
+        """
+        nr_nodes = len(self._nodes)
+        sources, targets = self._built_edge_ids()
+        sources = np.concatenate(
+            [sources, np.frombuffer(self._pending_sources, dtype=np.int32)]
+        )
+        targets = np.concatenate(
+            [targets, np.frombuffer(self._pending_targets, dtype=np.int32)]
+        )
+        self._pending_sources = array.array("i")
+        self._pending_targets = array.array("i")
+        self._pending_successor_ids = None
+        self._pending_predecessor_ids = None
+
+        # Remove duplicate edges, keeping the first occurrence
+        keys = sources.astype(np.int64) * nr_nodes + targets
+        _, first_idxs = np.unique(keys, return_index=True)
+        first_idxs.sort()
+        sources = sources[first_idxs]
+        targets = targets[first_idxs]
+
+        # Stable sorts keep the edges with the same from-node (to-node) in insertion order
+        self._successor_ids = targets[np.argsort(sources, kind="stable")]
+        self._successor_offsets = np.zeros(nr_nodes + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(sources, minlength=nr_nodes), out=self._successor_offsets[1:]
+        )
+
+        self._predecessor_ids = sources[np.argsort(targets, kind="stable")]
+        self._predecessor_offsets = np.zeros(nr_nodes + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(targets, minlength=nr_nodes),
+            out=self._predecessor_offsets[1:],
+        )
+
+    def _built_edge_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        nr_nodes = len(self._successor_offsets) - 1
+        sources = np.repeat(
+            np.arange(nr_nodes, dtype=np.int32), np.diff(self._successor_offsets)
+        )
+
+        return sources, self._successor_ids
+
+    def _ensure_built(self) -> None:
+        # The CSR arrays are out of date when edges or nodes were added since the last build
+        if (
+            len(self._pending_sources) > 0
+            or len(self._successor_offsets) != len(self._nodes) + 1
+        ):
+            self._build()
+
+    def _ensure_indexed(self) -> None:
+        """
+        Make sure pending edges can be found per node
+
+        The pending edges are merged into the CSR arrays if there are many of them. Otherwise, they
+        are indexed per node, if this was not done yet.
+        """
+        nr_pending_edges = len(self._pending_sources)
+
+        if nr_pending_edges > max(self._min_nr_pending_edges, self._successor_ids.size):
+            self._build()
+        elif self._pending_successor_ids is None:
+            self._pending_successor_ids = {}
+            self._pending_predecessor_ids = {}
+
+            for from_id, to_id in zip(self._pending_sources, self._pending_targets):
+                self._index_pending_edge(from_id, to_id)
+
+    def _index_pending_edge(self, from_id: int, to_id: int) -> None:
+        assert self._pending_successor_ids is not None
+        assert self._pending_predecessor_ids is not None
+        pending_successor_ids = self._pending_successor_ids.setdefault(from_id, [])
+
+        # Skip duplicate edges, like when building the CSR arrays
+        if to_id in pending_successor_ids or to_id in self._built_successor_ids_of(
+            from_id
+        ):
+            return
+
+        pending_successor_ids.append(to_id)
+        self._pending_predecessor_ids.setdefault(to_id, []).append(from_id)
+
+    def edge_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :return: Arrays with the IDs of the from-nodes and to-nodes of all edges
+
+        The ID of a node is its position in :attr:`nodes`.
+        """
+        self._ensure_built()
+        return self._built_edge_ids()
+
+    def node_id(self, node: typing.Any) -> int:
+        """
+        :return: ID of the node passed in
+        """
+        return self._node_id(node)
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> _EdgeView:
+        return _EdgeView(self)
+
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    def number_of_edges(self) -> int:
+        self._ensure_built()
+        return self._successor_ids.size
+
+    def _built_successor_ids_of(self, node_id: int) -> list[int]:
+        if node_id >= len(self._successor_offsets) - 1:
+            return []
+
+        return self._successor_ids[
+            self._successor_offsets[node_id] : self._successor_offsets[node_id + 1]
+        ].tolist()
+
+    def _built_predecessor_ids_of(self, node_id: int) -> list[int]:
+        if node_id >= len(self._predecessor_offsets) - 1:
+            return []
+
+        return self._predecessor_ids[
+            self._predecessor_offsets[node_id] : self._predecessor_offsets[node_id + 1]
+        ].tolist()
+
+    def _successor_ids_of(self, node_id: int) -> list[int]:
+        """
+        :return: IDs of the successors of the node passed in, including the ones added since the
+            CSR arrays were last built
+        """
+        if len(self._pending_sources) > 0:
+            self._ensure_indexed()
+
+        ids = self._built_successor_ids_of(node_id)
+
+        if self._pending_successor_ids is not None:
+            ids += self._pending_successor_ids.get(node_id, [])
+
+        return ids
+
+    def _predecessor_ids_of(self, node_id: int) -> list[int]:
+        """
+        :return: IDs of the predecessors of the node passed in, including the ones added since
+            the CSR arrays were last built
+        """
+        if len(self._pending_sources) > 0:
+            self._ensure_indexed()
+
+        ids = self._built_predecessor_ids_of(node_id)
+
+        if self._pending_predecessor_ids is not None:
+            ids += self._pending_predecessor_ids.get(node_id, [])
+
+        return ids
+
+    def successors(self, node: typing.Any) -> typing.Iterator[typing.Any]:
+        nodes = self._nodes
+
+        return (nodes[idx] for idx in self._successor_ids_of(self._node_id(node)))
+
+    def predecessors(self, node: typing.Any) -> typing.Iterator[typing.Any]:
+        nodes = self._nodes
+
+        return (nodes[idx] for idx in self._predecessor_ids_of(self._node_id(node)))
+
+    def out_degree(self, node: typing.Any = None):
+        """
+        :return: Out-degree of the node passed in, or (node, out-degree) tuples for all nodes
+        """
+        if node is not None:
+            return len(self._successor_ids_of(self._node_id(node)))
+
+        self._ensure_built()
+        degrees = np.diff(self._successor_offsets)
+
+        return list(zip(self._nodes, degrees.tolist()))
+
+    def in_degree(self, node: typing.Any = None):
+        """
+        :return: In-degree of the node passed in, or (node, in-degree) tuples for all nodes
+        """
+        if node is not None:
+            return len(self._predecessor_ids_of(self._node_id(node)))
+
+        self._ensure_built()
+        degrees = np.diff(self._predecessor_offsets)
+
+        return list(zip(self._nodes, degrees.tolist()))
+
+    def descendants(self, node: typing.Any) -> list[typing.Any]:
+        """
+        :return: Nodes reachable from the node passed in, excluding the node itself, in insertion
+            order
+        """
+        node_id = self._node_id(node)
+        visited = {node_id}
+        stack = [node_id]
+
+        while stack:
+            from_id = stack.pop()
+
+            for to_id in self._successor_ids_of(from_id):
+                if to_id not in visited:
+                    visited.add(to_id)
+                    stack.append(to_id)
+
+        visited.remove(node_id)
+        nodes = self._nodes
+
+        # IDs are assigned in insertion order
+        return [nodes[idx] for idx in sorted(visited)]
+
+    def to_networkx(self) -> nx.DiGraph:
+        """
+        :return: A ``networkx.DiGraph`` with the same nodes and edges, in the same order
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._nodes)
+        graph.add_edges_from(self.edges)
+
+        return graph
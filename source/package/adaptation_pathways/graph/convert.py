@@ -1,3 +1,5 @@
+import typing
+
 from .node import ActionBegin, ActionEnd, ActionPeriod
 from .node.action import Action as ActionNode
 from .pathway_graph import ActionConversion, PathwayGraph
@@ -5,68 +7,194 @@ from .pathway_map import PathwayMap
 from .sequence_graph import SequenceGraph
 
 
-def sequence_graph_to_pathway_graph(sequence_graph: SequenceGraph) -> PathwayGraph:
+# Number of action periods added in between calls to the progress function
+_progress_interval = 10000
+
+
+def sequence_graph_to_pathway_graph(
+    sequence_graph: SequenceGraph,
+    *,
+    max_nr_action_periods: int | None = None,
+    progress: typing.Callable[[int], None] | None = None,
+) -> PathwayGraph:
     """
     Convert a sequence graph to a pathway graph
+
+    :param max_nr_action_periods: Maximum number of action periods to add to the pathway graph.
+        By default there is no maximum.
+    :param progress: Function to call regularly with the number of action periods added so far.
+        It is also called once the conversion is finished.
+    :raises ValueError: In case the pathway graph would contain more action periods than
+        allowed, or in case the sequence graph contains a cycle
+
+    The pathway graph is compact if the sequence graph is.
+
+    Each path through the sequence graph ends up as a separate path in the pathway graph. In case
+    paths in the sequence graph converge, the sequence graph is much smaller than the pathway
+    graph: the number of action periods can grow exponentially with the number of converging
+    actions. Use :meth:`SequenceGraph.path_statistics
+    <adaptation_pathways.graph.directed_graph.DirectedGraph.path_statistics>` to find out the size
+    of the pathway graph up front, and ``max_nr_action_periods`` to guard against pathway graphs
+    that are too large. Sequence graphs containing a cycle would result in an infinitely large
+    pathway graph, and are rejected.
     """
+    pathway_graph = PathwayGraph(compact=sequence_graph.is_compact)
+    nr_action_periods = 0
 
-    def visit_graph(
-        sequence_graph: SequenceGraph,
-        pathway_graph: PathwayGraph,
-        from_action: ActionNode,
-        new_from_action: ActionPeriod,
-    ) -> None:
-        for to_action in sequence_graph.to_actions(from_action):
-            new_to_action = ActionPeriod(to_action.action)
-            pathway_graph.add_conversion(new_from_action, new_to_action)
-            visit_graph(sequence_graph, pathway_graph, to_action, new_to_action)
+    if sequence_graph.nr_actions() > 0:
+        # The to-actions of actions which are reached through multiple paths are looked up once
+        to_actions_by_action: dict[ActionNode, list[ActionNode]] = {}
 
-    pathway_graph = PathwayGraph()
+        def to_actions(from_action: ActionNode) -> list[ActionNode]:
+            if from_action not in to_actions_by_action:
+                to_actions_by_action[from_action] = sequence_graph.to_actions(
+                    from_action
+                )
+
+            return to_actions_by_action[from_action]
 
-    if sequence_graph.nr_actions() > 0:
         from_action = sequence_graph.root_node
         assert isinstance(from_action, ActionNode), from_action
         new_from_action = ActionPeriod(from_action.action)
+        nr_action_periods = 1
+
+        # Depth-first, adding conversions in the same order as a recursive visit would. The
+        # actions of the sequence graph on the current path are tracked, to detect cycles.
+        stack = [(from_action, new_from_action, iter(to_actions(from_action)))]
+        actions_on_path = {from_action}
+
+        while stack:
+            from_action, new_from_action, to_actions_ = stack[-1]
+            to_action = next(to_actions_, None)
+
+            if to_action is None:
+                stack.pop()
+                actions_on_path.remove(from_action)
+                continue
+
+            if to_action in actions_on_path:
+                raise ValueError(
+                    f"The sequence graph contains a cycle, through action {to_action}"
+                )
+
+            if (
+                max_nr_action_periods is not None
+                and nr_action_periods >= max_nr_action_periods
+            ):
+                raise ValueError(
+                    "The pathway graph contains more action periods than the maximum allowed "
+                    f"({max_nr_action_periods})"
+                )
 
-        visit_graph(sequence_graph, pathway_graph, from_action, new_from_action)
+            new_to_action = ActionPeriod(to_action.action)
+            pathway_graph.add_conversion(new_from_action, new_to_action)
+            nr_action_periods += 1
+
+            if progress is not None and nr_action_periods % _progress_interval == 0:
+                progress(nr_action_periods)
+
+            stack.append((to_action, new_to_action, iter(to_actions(to_action))))
+            actions_on_path.add(to_action)
+
+        if pathway_graph.nr_nodes() == 0:
+            # A sequence graph without sequences results in an empty pathway graph
+            nr_action_periods = 0
+
+    if progress is not None:
+        progress(nr_action_periods)
 
     return pathway_graph
 
 
-def pathway_graph_to_pathway_map(pathway_graph: PathwayGraph) -> PathwayMap:
-    """
-    Convert a pathway graph to a pathway map
-    """
-    pathway_map = PathwayMap()
+def _add_pathways(pathway_graph: PathwayGraph, pathway_map: PathwayMap) -> None:
+    # For each individual path, add a graph to the pathway map
+    for path in pathway_graph.iter_paths():
+        action_period = path[0]
+        begin = ActionBegin(action_period.action)
+        end = ActionEnd(action_period.action)
+        pathway_map.add_period(begin, end)
+
+        for action_conversion_idx in range(1, len(path), 2):
+            action_conversion = path[action_conversion_idx]
+            action_period = path[action_conversion_idx + 1]
+            assert isinstance(action_conversion, ActionConversion)
+            assert isinstance(action_period, ActionPeriod)
 
-    if pathway_graph.nr_nodes() > 0:
-        # For each individual path, add a graph to the pathway map
-        for path in pathway_graph.all_paths():
-            action_period = path[0]
             begin = ActionBegin(action_period.action)
+            pathway_map.add_conversion(end, begin)
             end = ActionEnd(action_period.action)
             pathway_map.add_period(begin, end)
 
-            for action_conversion_idx in range(1, len(path), 2):
-                action_conversion = path[action_conversion_idx]
-                action_period = path[action_conversion_idx + 1]
-                assert isinstance(action_conversion, ActionConversion)
-                assert isinstance(action_period, ActionPeriod)
 
-                begin = ActionBegin(action_period.action)
-                pathway_map.add_conversion(end, begin)
-                end = ActionEnd(action_period.action)
-                pathway_map.add_period(begin, end)
+def _add_shared_pathways(pathway_graph: PathwayGraph, pathway_map: PathwayMap) -> None:
+    # Add a single graph to the pathway map, with one begin / end pair per action period in the
+    # pathway graph. Nodes are added depth-first, in the same order as they would be added per
+    # individual path, skipping the prefixes already added.
+    action_period = pathway_graph.root_node
+    begin = ActionBegin(action_period.action)
+    end = ActionEnd(action_period.action)
+    pathway_map.add_period(begin, end)
+
+    stack = [(end, iter(pathway_graph.to_conversions(action_period)))]
+
+    while stack:
+        from_end, action_conversions = stack[-1]
+        action_conversion = next(action_conversions, None)
+
+        if action_conversion is None:
+            stack.pop()
+            continue
+
+        action_period = pathway_graph.to_action_period(action_conversion)
+
+        begin = ActionBegin(action_period.action)
+        pathway_map.add_conversion(from_end, begin)
+        end = ActionEnd(action_period.action)
+        pathway_map.add_period(begin, end)
+
+        stack.append((end, iter(pathway_graph.to_conversions(action_period))))
+
+
+def pathway_graph_to_pathway_map(
+    pathway_graph: PathwayGraph, *, share_prefixes: bool = False
+) -> PathwayMap:
+    """
+    Convert a pathway graph to a pathway map
+
+    :param share_prefixes: Whether pathways starting with the same sequence of actions share
+        the nodes representing these actions. By default each pathway is represented by its own
+        nodes, and the pathway map contains one root node per pathway.
+
+    The pathway map is compact if the pathway graph is.
+
+    The number of nodes in a pathway map without shared prefixes is proportional to the number
+    of pathways times their length. With shared prefixes it is proportional to the number of
+    nodes in the pathway graph. The paths in both pathway maps are the same, and so is their
+    :mod:`classic <adaptation_pathways.plot.pathway_map.classic>` layout. Use shared prefixes for
+    large pathway maps. The :mod:`default <adaptation_pathways.plot.pathway_map.default>` layout
+    positions each pathway on its own row, and requires a pathway map without shared prefixes.
+    """
+    pathway_map = PathwayMap(compact=pathway_graph.is_compact)
+
+    if pathway_graph.nr_nodes() > 0:
+        if share_prefixes:
+            _add_shared_pathways(pathway_graph, pathway_map)
+        else:
+            _add_pathways(pathway_graph, pathway_map)
 
-    # print(pathway_map)
     return pathway_map
 
 
-def sequence_graph_to_pathway_map(sequence_graph: SequenceGraph) -> PathwayMap:
+def sequence_graph_to_pathway_map(
+    sequence_graph: SequenceGraph, *, share_prefixes: bool = False
+) -> PathwayMap:
     """
     Convert a sequence graph to a pathway map
 
     This function calls :func:`sequence_graph_to_pathway_graph` and
-    :func:`pathway_graph_to_pathway_map` in turn.
+    :func:`pathway_graph_to_pathway_map` in turn. See the latter for the meaning of
+    ``share_prefixes``.
     """
-    return pathway_graph_to_pathway_map(sequence_graph_to_pathway_graph(sequence_graph))
+    return pathway_graph_to_pathway_map(
+        sequence_graph_to_pathway_graph(sequence_graph), share_prefixes=share_prefixes
+    )
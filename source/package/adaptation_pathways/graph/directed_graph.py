@@ -1,30 +1,96 @@
+import dataclasses
+import itertools
 import typing
 
 import networkx as nx
+import numpy as np
+
+from .compact_graph import CompactDiGraph
+
+
+@dataclasses.dataclass
+class PathStatistics:
+    """
+    Statistics about the paths from root nodes to leaf nodes in a directed acyclic graph
+
+    :param nr_paths: Number of paths
+    :param nr_paths_by_depth: Number of paths per depth. The depth of a path is its number of
+        edges.
+    :param nr_paths_by_node: Number of paths each node is part of
+    """
+
+    nr_paths: int
+    nr_paths_by_depth: dict[int, int]
+    nr_paths_by_node: dict[typing.Any, int]
 
 
 class DirectedGraph:
     """
     Base class for specialized directed graphs.
+
+    :param compact: Whether to store the graph in a :class:`CompactDiGraph` instead of in a
+        ``networkx.DiGraph``. Compact graphs use much less memory, which is useful for very large
+        graphs. The API of the graph is the same in both cases.
     """
 
-    _graph: nx.DiGraph
+    _graph: nx.DiGraph | CompactDiGraph
+
+    # In case of a compact graph, the networkx copy returned last by the graph property, and the
+    # version of the compact graph it was created from
+    _networkx_graph: tuple[int, nx.DiGraph] | None
 
-    def __init__(self) -> None:
-        self._graph = nx.DiGraph()
+    # In case of a networkx graph, the position of the nodes in the order in which they were
+    # added. Nodes are never removed, so positions of nodes added later are appended.
+    _position_by_node: dict[typing.Any, int]
+
+    def __init__(self, *, compact: bool = False) -> None:
+        self._graph = CompactDiGraph() if compact else nx.DiGraph()
+        self._networkx_graph = None
+        self._position_by_node = {}
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # The networkx copy of a compact graph and the node positions are recreated when needed
+        state = self.__dict__.copy()
+        state["_networkx_graph"] = None
+        state["_position_by_node"] = {}
+
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__dict__.update(
+            {"_networkx_graph": None, "_position_by_node": {}, **state}
+        )
 
     def __str__(self) -> str:
-        return "\n".join(nx.generate_network_text(self._graph))
+        return "\n".join(nx.generate_network_text(self.graph))
 
     @property
     def graph(self) -> nx.DiGraph:
         """
         :return: The layered directed graph instance
 
-        Try not to use it -- it should be an implementation detail as much as possible.
+        Try not to use it -- it should be an implementation detail as much as possible. In case
+        of a compact graph, a ``networkx.DiGraph`` copy of the graph is returned. The copy is
+        reused until the graph changes, so it must not be changed.
         """
+        if isinstance(self._graph, CompactDiGraph):
+            if (
+                self._networkx_graph is None
+                or self._networkx_graph[0] != self._graph.version
+            ):
+                self._networkx_graph = (self._graph.version, self._graph.to_networkx())
+
+            return self._networkx_graph[1]
+
         return self._graph
 
+    @property
+    def is_compact(self) -> bool:
+        """
+        :return: Whether the graph is stored in a :class:`CompactDiGraph`
+        """
+        return isinstance(self._graph, CompactDiGraph)
+
     # def is_empty(self) -> bool:
     #     """
     #     :return: Whether or not the tree is empty
@@ -35,36 +101,79 @@ class DirectedGraph:
         """
         :return: Number of nodes
         """
-        return len(self._graph.nodes)
+        return self._graph.number_of_nodes()
 
     def nr_edges(self) -> int:
         """
         :return: Number of edges
         """
-        return len(self._graph.edges)
+        return self._graph.number_of_edges()
+
+    def edge_ids(self) -> tuple[list[typing.Any], np.ndarray, np.ndarray]:
+        """
+        :return: Collection of all nodes, and arrays with the IDs of the from-nodes and to-nodes
+            of all edges
+
+        The ID of a node is its position in the collection of nodes returned. Use this function
+        for calculations which can be performed on all edges at once.
+        """
+        if isinstance(self._graph, CompactDiGraph):
+            from_ids, to_ids = self._graph.edge_ids()
+            return list(self._graph.nodes), from_ids, to_ids
+
+        nodes = list(self._graph.nodes)
+        id_by_node = {node: idx for idx, node in enumerate(nodes)}
+        nr_to_nodes = []
+        to_ids_: list[int] = []
+
+        # Edges are grouped by from-node, in the same order as the nodes
+        for _, to_nodes in self._graph.adjacency():
+            nr_to_nodes.append(len(to_nodes))
+            to_ids_.extend(map(id_by_node.__getitem__, to_nodes))
+
+        from_ids = np.repeat(np.arange(len(nodes), dtype=np.int32), nr_to_nodes)
+        to_ids = np.array(to_ids_, dtype=np.int32)
+
+        return nodes, from_ids, to_ids
 
     def all_to_nodes(self, from_node):
-        # Use shortest_path to find all nodes reachable from the node passed in
-        graph = self._graph.subgraph(nx.shortest_path(self._graph, from_node))
+        """
+        :return: Collection of nodes reachable from the node passed in, excluding the node
+            itself, in the order in which they were added to the graph
+        """
+        if isinstance(self._graph, CompactDiGraph):
+            return self._graph.descendants(from_node)
 
-        # Remove the from_node itself before returning the result
-        result = list(graph.nodes)
-        result.remove(from_node)
+        position_by_node = self._position_by_node
 
-        return result
+        if len(position_by_node) != self._graph.number_of_nodes():
+            position_by_node.update(
+                (node, position)
+                for position, node in enumerate(
+                    itertools.islice(self._graph.nodes, len(position_by_node), None),
+                    start=len(position_by_node),
+                )
+            )
+
+        return sorted(
+            nx.descendants(self._graph, from_node), key=position_by_node.__getitem__
+        )
 
     def to_nodes(self, from_node) -> list[typing.Any]:
         """
         :return: Collection of nodes that start at the node passed in
         """
-        return list(self._graph.adj[from_node])
+        return list(self._graph.successors(from_node))
 
     def from_nodes(self, to_node):
         """
         :return: Collection of nodes that end at the node passed in
+
+        The graph maintains an index of predecessors per node, which is updated whenever an edge
+        is added. Looking up the from-nodes is therefore proportional to the in-degree of the
+        node passed in, not to the number of nodes in the graph.
         """
-        # TODO Can this be done more efficiently?
-        return [node for node in self._graph.nodes() if to_node in self.to_nodes(node)]
+        return list(self._graph.predecessors(to_node))
 
     def leaf_nodes(self) -> typing.Iterable[typing.Any]:
         """
@@ -72,23 +181,163 @@ class DirectedGraph:
         """
         return [
             node
-            for node in self._graph.nodes()
-            if self._graph.in_degree(node) != 0 and self._graph.out_degree(node) == 0
+            for (node, in_degree), (_, out_degree) in zip(
+                self._graph.in_degree(), self._graph.out_degree()
+            )
+            if in_degree != 0 and out_degree == 0
         ]
 
-    def all_paths(self) -> list[list[typing.Any]]:
-        result = []
+    def iter_paths(
+        self, *, max_nr_paths: int | None = None, max_depth: int | None = None
+    ) -> typing.Iterator[list[typing.Any]]:
+        """
+        Iterate over all paths from root nodes to leaf nodes
 
-        if self.nr_nodes() > 0:
-            graph = self._graph
+        :param max_nr_paths: Maximum number of paths to yield. By default all paths are yielded.
+        :param max_depth: Maximum number of edges in a path. Longer paths are skipped and the
+            search does not continue beyond this depth. By default paths of any depth are yielded.
+
+        Paths are generated lazily, depth-first, following the order in which edges were added.
+        Only the current path is kept in memory. Use this function instead of :meth:`all_paths`
+        when the number of paths can be very large.
+        """
+        if max_nr_paths is not None and max_nr_paths <= 0:
+            return
 
-            root_nodes = [
-                node for node, degree in self._graph.in_degree() if degree == 0
-            ]
-            leaf_nodes = self.leaf_nodes()
+        nr_paths = 0
+        root_nodes = [node for node, degree in self._graph.in_degree() if degree == 0]
 
-            for root_node in root_nodes:
-                cutoff = None
-                result += nx.all_simple_paths(graph, root_node, leaf_nodes, cutoff)
+        for root_node in root_nodes:
+            path = [root_node]
+            on_path = {root_node}
+            stack = [iter(self.to_nodes(root_node))]
 
-        return result
+            while stack:
+                to_node = next(stack[-1], None)
+
+                if to_node is None:
+                    stack.pop()
+                    on_path.discard(path.pop())
+                    continue
+
+                if to_node in on_path:
+                    continue
+
+                if max_depth is not None and len(path) > max_depth:
+                    continue
+
+                path.append(to_node)
+                to_nodes = self.to_nodes(to_node)
+
+                if len(to_nodes) == 0:
+                    yield list(path)
+                    nr_paths += 1
+
+                    if max_nr_paths is not None and nr_paths >= max_nr_paths:
+                        return
+
+                    path.pop()
+                else:
+                    on_path.add(to_node)
+                    stack.append(iter(to_nodes))
+
+    def topological_order(self) -> list[typing.Any]:
+        """
+        :return: Collection of all nodes, ordered such that each node comes before the nodes it
+            has edges to
+        :raises ValueError: In case the graph contains a cycle
+        """
+        nr_from_nodes = dict(self._graph.in_degree())
+        nodes = [node for node, degree in nr_from_nodes.items() if degree == 0]
+
+        # Nodes are appended while iterating over the list
+        for node in nodes:
+            for to_node in self._graph.successors(node):
+                nr_from_nodes[to_node] -= 1
+
+                if nr_from_nodes[to_node] == 0:
+                    nodes.append(to_node)
+
+        if len(nodes) != len(nr_from_nodes):
+            raise ValueError("Graph contains a cycle")
+
+        return nodes
+
+    def path_statistics(self) -> PathStatistics:
+        """
+        :return: Statistics about all paths from root nodes to leaf nodes
+        :raises ValueError: In case the graph contains a cycle
+
+        The statistics are calculated without enumerating the paths, by visiting the nodes in
+        topological order and accumulating the number of paths reaching each node. The number of
+        paths can be much larger than the number of nodes and edges. The time it takes is linear
+        in the number of nodes and edges, times the number of different depths at which a node can
+        be reached. In a tree, each node can only be reached at a single depth.
+
+        The paths counted are the ones yielded by :meth:`iter_paths`.
+        """
+        nodes = self.topological_order()
+        to_nodes_by_node = {node: self.to_nodes(node) for node in nodes}
+
+        # Per node the number of paths from any root node to it, per depth
+        nr_paths_by_depth_by_node: dict[typing.Any, dict[int, int]] = {}
+        nr_paths_to_node: dict[typing.Any, int] = {}
+        nr_paths_by_depth: dict[int, int] = {}
+        root_nodes: set[typing.Any] = set()
+
+        for node in nodes:
+            if node in nr_paths_by_depth_by_node:
+                nr_paths_by_depth_ = nr_paths_by_depth_by_node.pop(node)
+            else:
+                root_nodes.add(node)
+                nr_paths_by_depth_ = {0: 1}
+
+            nr_paths_to_node[node] = sum(nr_paths_by_depth_.values())
+            to_nodes = to_nodes_by_node[node]
+
+            if len(to_nodes) == 0 and node not in root_nodes:
+                for depth, nr_paths in nr_paths_by_depth_.items():
+                    nr_paths_by_depth[depth] = (
+                        nr_paths_by_depth.get(depth, 0) + nr_paths
+                    )
+
+            for to_node in to_nodes:
+                to_node_nr_paths_by_depth = nr_paths_by_depth_by_node.setdefault(
+                    to_node, {}
+                )
+
+                for depth, nr_paths in nr_paths_by_depth_.items():
+                    to_node_nr_paths_by_depth[depth + 1] = (
+                        to_node_nr_paths_by_depth.get(depth + 1, 0) + nr_paths
+                    )
+
+        # Per node the number of paths from it to any leaf node. Isolated nodes are not part of
+        # any path.
+        nr_paths_from_node: dict[typing.Any, int] = {}
+
+        for node in reversed(nodes):
+            to_nodes = to_nodes_by_node[node]
+
+            if len(to_nodes) == 0:
+                nr_paths_from_node[node] = 0 if node in root_nodes else 1
+            else:
+                nr_paths_from_node[node] = sum(
+                    nr_paths_from_node[to_node] for to_node in to_nodes
+                )
+
+        return PathStatistics(
+            nr_paths=sum(nr_paths_by_depth.values()),
+            nr_paths_by_depth=dict(sorted(nr_paths_by_depth.items())),
+            nr_paths_by_node={
+                node: nr_paths_to_node[node] * nr_paths_from_node[node]
+                for node in nodes
+            },
+        )
+
+    def all_paths(self) -> list[list[typing.Any]]:
+        """
+        :return: Collection of all paths from root nodes to leaf nodes
+
+        See :meth:`iter_paths`.
+        """
+        return list(self.iter_paths())
@@ -13,12 +13,17 @@ class ActionBegin(Node):
     See also: :class:`PathwayMap`
     """
 
+    __slots__ = ("_action",)
+
     _action: Action
 
     def __init__(self, action: Action) -> None:
-        super().__init__(f"[{action.name}")
+        super().__init__()
         self._action = action
 
+    def _format_label(self) -> str:
+        return f"[{self._action.name}"
+
     def __repr__(self) -> str:
         return f'ActionBegin("{self._action}")'
 
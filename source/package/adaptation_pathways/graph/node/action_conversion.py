@@ -13,15 +13,23 @@ class ActionConversion(Node):
     See also: :class:`PathwayMap`
     """
 
+    __slots__ = ("_from_action_period", "_to_action_period")
+
+    _from_action_period: ActionPeriod
+    _to_action_period: ActionPeriod
+
     def __init__(
         self, from_action_period: ActionPeriod, to_action_period: ActionPeriod
     ) -> None:
-        super().__init__(f"{from_action_period} | {to_action_period}")
+        super().__init__()
         self._from_action_period = from_action_period
         self._to_action_period = to_action_period
 
+    def _format_label(self) -> str:
+        return f"{self._from_action_period} | {self._to_action_period}"
+
     def __repr__(self) -> str:
-        return f'ActionConversion("{self._label}")'
+        return f'ActionConversion("{self.label}")'
 
     @property
     def from_action_period(self) -> ActionPeriod:
@@ -1,23 +1,62 @@
+import typing
+
+
 class Node:
     """
     Base class for specialized node types
 
     Nodes are nodes in a graph.
 
-    :param label: Label of the node
+    :param label: Label of the node. Specialized node types don't pass in a label, but format
+        it from their attributes the first time it is needed.
+
+    Node classes define ``__slots__``, because graphs can contain very many nodes. Nodes are
+    pickled as a dictionary of attribute values, like instances of classes without slots. The
+    label is only included once it has been formatted.
     """
 
-    _label: str
+    __slots__ = ("_label",)
+
+    _label: str | None
 
-    def __init__(self, label: str) -> None:
+    def __init__(self, label: str | None = None) -> None:
         self._label = label
 
     def __str__(self) -> str:
-        return self._label
+        return self.label
 
     def __repr__(self) -> str:
-        return f'Node("{self._label}")'
+        return f'Node("{self.label}")'
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = {
+            name: getattr(self, name)
+            for class_ in type(self).__mro__
+            for name in class_.__dict__.get("__slots__", ())
+        }
+
+        if state["_label"] is None:
+            del state["_label"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self._label = None
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _format_label(self) -> str:
+        """
+        Return the label of the node, formatted from its attributes
+
+        Specialized node types override this. Nodes created without a label have an empty one.
+        """
+        return ""
 
     @property
     def label(self) -> str:
+        if self._label is None:
+            self._label = self._format_label()
+
         return self._label
@@ -27,11 +27,11 @@ class PathwayGraph(RootedGraph):
 
     def to_conversions(self, from_conversion: ActionPeriod) -> list[ActionConversion]:
         assert isinstance(from_conversion, ActionPeriod), type(from_conversion)
-        return list(self._graph.adj[from_conversion])
+        return list(self._graph.successors(from_conversion))
 
     def to_action_period(self, conversion: ActionConversion) -> ActionPeriod:
         assert isinstance(conversion, ActionConversion), type(conversion)
-        actions = list(self._graph.adj[conversion])
+        actions = list(self._graph.successors(conversion))
         assert len(actions) == 1
         assert isinstance(actions[0], ActionPeriod), type(actions[0])
         return actions[0]
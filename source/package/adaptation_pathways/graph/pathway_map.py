@@ -1,3 +1,7 @@
+import typing
+
+import numpy as np
+
 from .. import alias
 from ..action import Action
 from ..action_combination import ActionCombination
@@ -9,25 +13,93 @@ class PathwayMap(MultiRootedGraph):
     """
     A PathwayMap represents a collection of adaptation pathways. These pathways are encoded
     in a directed rooted graph in which the nodes represent...
+
+    Collections derived from the graph, like the root nodes and all action begins, are
+    calculated once and cached. Adding periods and conversions invalidates the cache. The
+    collections returned are copies, which can be changed by the caller.
+
+    Indexes of the action begin nodes by action name and of the action end nodes by action
+    instance are updated each time a period or conversion is added.
     """
 
+    # Incremented each time the graph changes
+    _version: int
+
+    # Derived collections, valid for graph version _cache_version
+    _cache: dict[str, typing.Any]
+    _cache_version: int
+
+    # Nodes in the order in which they were added. Dictionaries are used as ordered sets.
+    _action_begins_by_action_name: dict[str, dict[ActionBegin, None]]
+    _action_ends_by_action: dict[Action, dict[ActionEnd, None]]
+
+    def __init__(self, *, compact: bool = False) -> None:
+        super().__init__(compact=compact)
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+        self._action_begins_by_action_name = {}
+        self._action_ends_by_action = {}
+
+    def _index(self, begin: ActionBegin, end: ActionEnd) -> None:
+        begins = self._action_begins_by_action_name.setdefault(begin.action.name, {})
+        begins[begin] = None
+        ends = self._action_ends_by_action.setdefault(end.action, {})
+        ends[end] = None
+
+    def _valid_cache(self) -> dict[str, typing.Any]:
+        if self._cache_version != self._version:
+            self._cache.clear()
+            self._cache_version = self._version
+
+        return self._cache
+
     def add_period(self, begin: ActionBegin, end: ActionEnd) -> None:
         assert isinstance(begin, ActionBegin)
         assert isinstance(end, ActionEnd)
-        self.graph.add_edge(begin, end)
+        self._graph.add_edge(begin, end)
+        self._index(begin, end)
+        self._version += 1
 
     def add_conversion(self, end: ActionEnd, begin: ActionBegin) -> None:
         assert isinstance(end, ActionEnd)
         assert isinstance(begin, ActionBegin)
-        self.graph.add_edge(end, begin)
+        self._graph.add_edge(end, begin)
+        self._index(begin, end)
+        self._version += 1
+
+    @property
+    def root_nodes(self):
+        cache = self._valid_cache()
+
+        if "root_nodes" not in cache:
+            cache["root_nodes"] = super().root_nodes
+
+        return list(cache["root_nodes"])
+
+    def leaf_nodes(self) -> list[ActionEnd]:
+        cache = self._valid_cache()
+
+        if "leaf_nodes" not in cache:
+            cache["leaf_nodes"] = super().leaf_nodes()
+
+        return list(cache["leaf_nodes"])
+
+    def all_paths(self) -> list[list[ActionBegin | ActionEnd]]:
+        cache = self._valid_cache()
+
+        if "all_paths" not in cache:
+            cache["all_paths"] = super().all_paths()
+
+        return [list(path) for path in cache["all_paths"]]
 
     def action_begins(self, end: ActionEnd) -> list[ActionBegin]:
         assert isinstance(end, ActionEnd)
-        return list(self.graph.adj[end])
+        return list(self._graph.successors(end))
 
     def action_end(self, begin: ActionBegin) -> ActionEnd:
         assert isinstance(begin, ActionBegin)
-        ends = list(self.graph.adj[begin])
+        ends = list(self._graph.successors(begin))
         assert len(ends) == 1
         return ends[0]
 
@@ -38,60 +110,76 @@ class PathwayMap(MultiRootedGraph):
         return self.all_to_nodes(begin)
 
     def all_action_begins(self) -> list[ActionBegin]:
-        result = []
+        cache = self._valid_cache()
 
-        for root_node in self.root_nodes:
-            assert isinstance(root_node, ActionBegin)
+        if "all_action_begins" not in cache:
+            result = []
 
-            result.append(root_node)
+            for root_node in self.root_nodes:
+                assert isinstance(root_node, ActionBegin)
 
-            for node in self.all_to_nodes(root_node):
-                if isinstance(node, ActionBegin):
-                    result.append(node)
+                result.append(root_node)
 
-        return result
+                for node in self.all_to_nodes(root_node):
+                    if isinstance(node, ActionBegin):
+                        result.append(node)
+
+            cache["all_action_begins"] = result
+
+        return list(cache["all_action_begins"])
 
     def all_action_ends(self) -> list[ActionEnd]:
-        result = []
+        cache = self._valid_cache()
 
-        for root_node in self.root_nodes:
-            assert isinstance(root_node, ActionBegin)
+        if "all_action_ends" not in cache:
+            result = []
 
-            for node in self.all_to_nodes(root_node):
-                if isinstance(node, ActionEnd):
-                    result.append(node)
+            for root_node in self.root_nodes:
+                assert isinstance(root_node, ActionBegin)
 
-        return result
+                for node in self.all_to_nodes(root_node):
+                    if isinstance(node, ActionEnd):
+                        result.append(node)
+
+            cache["all_action_ends"] = result
+
+        return list(cache["all_action_ends"])
 
     def actions(self) -> list[Action]:
-        return (
-            list(dict.fromkeys(begin.action for begin in self.all_action_begins()))
-            if self.nr_nodes() > 0
-            else []
-        )
+        cache = self._valid_cache()
+
+        if "actions" not in cache:
+            cache["actions"] = (
+                list(dict.fromkeys(begin.action for begin in self.all_action_begins()))
+                if self.nr_nodes() > 0
+                else []
+            )
+
+        return list(cache["actions"])
 
     def continued_actions(self, action_combination: ActionCombination) -> list[Action]:
         """
         Return the actions that are continued by the ``action_combination``, if any
+
+        Each action is returned once, also when the action combination continues it in multiple
+        pathways. The result therefore does not depend on whether pathways share nodes. An
+        action combination continuing a single action in multiple pathways still continues a
+        single action, which the classic layout positions at the same row as that action.
         """
         result = []
+        action_names = {action.name for action in action_combination.actions}
 
-        # Find node in map containing the action combination passed in
+        # Find nodes in map containing the action combination passed in
+        for action_begin in self._action_begins_by_action_name.get(
+            action_combination.name, {}
+        ):
+            for action_end in self._graph.predecessors(action_begin):
+                assert isinstance(action_end, ActionEnd)
 
-        action_begin: ActionBegin | None = None
+                if action_end.action.name in action_names:
+                    result.append(action_end.action)
 
-        for action_begin in self.all_action_begins():
-            if action_begin.action.name == action_combination.name:
-                # Current action begin contains the action combination
-
-                for action_end, _ in self.graph.in_edges(action_begin):
-                    assert isinstance(action_end, ActionEnd)
-                    if action_end.action.name in [
-                        action.name for action in action_combination.actions
-                    ]:
-                        result.append(action_end.action)
-
-        return result
+        return list(dict.fromkeys(result))
 
     def action_ends_by_action(self, action: Action) -> list[ActionEnd]:
         """
@@ -101,11 +189,7 @@ class PathwayMap(MultiRootedGraph):
             the action
         """
         assert isinstance(action, Action), type(action)
-        result = []
-
-        for node in self.graph.nodes:
-            if isinstance(node, ActionEnd) and node.action == action:
-                result.append(node)
+        result = list(self._action_ends_by_action.get(action, {}))
 
         if len(result) == 0:
             raise LookupError(f"Action {action} is not part of the pathway map")
@@ -113,6 +197,54 @@ class PathwayMap(MultiRootedGraph):
         return result
 
 
+def tipping_point_violations(
+    pathway_map: PathwayMap, tipping_point_by_action: alias.TippingPointByAction
+) -> list[tuple[Action, Action]]:
+    """
+    Return all pairs of consecutive actions whose tipping points are not strictly increasing
+
+    :raises KeyError: In case tipping_point_by_action does not contain tipping points for all actions
+    :return: Collection of (from action, to action) tuples. Each pair of actions is returned once.
+
+    Each conversion in the pathway map is checked once, also when it is part of multiple
+    pathways. The checks are performed on all conversions at once.
+    """
+    nodes, from_ids, to_ids = pathway_map.edge_ids()
+
+    if len(nodes) == 0:
+        return []
+
+    # Per node the tipping point of the associated action. Begin and end nodes of the same
+    # period are associated with the same action.
+    tipping_points = np.fromiter(
+        (tipping_point_by_action[node.action] for node in nodes),
+        dtype=np.float64,
+        count=len(nodes),
+    )
+    is_action_end = np.fromiter(
+        (isinstance(node, ActionEnd) for node in nodes), dtype=bool, count=len(nodes)
+    )
+
+    # Conversions start at an end node. The tipping point of the action converted to must be
+    # larger than the one of the action converted from.
+    is_violation = is_action_end[from_ids] & ~(
+        tipping_points[from_ids] < tipping_points[to_ids]
+    )
+
+    violations: dict[tuple[int, int], tuple[Action, Action]] = {}
+
+    for from_id, to_id in zip(
+        from_ids[is_violation].tolist(), to_ids[is_violation].tolist()
+    ):
+        from_action = nodes[from_id].action
+        to_action = nodes[to_id].action
+        violations.setdefault(
+            (id(from_action), id(to_action)), (from_action, to_action)
+        )
+
+    return list(violations.values())
+
+
 def verify_tipping_points(
     pathway_map: PathwayMap, tipping_point_by_action: alias.TippingPointByAction
 ) -> None:
@@ -120,25 +252,20 @@ def verify_tipping_points(
     Verify all tipping points in the pathway map passed in are correctly set
 
     :raises KeyError: In case tipping_point_by_action does not contain tipping points for all actions
-    :raises ValueError: In case not all tipping points are strictly increasing along a sequence of actions
+    :raises ValueError: In case not all tipping points are strictly increasing along a sequence of
+        actions. The message mentions all violations, see :func:`tipping_point_violations`.
     """
-    for path in pathway_map.all_paths():
-        action_ends = list(path[1::2])
-        tipping_points = [
-            tipping_point_by_action[action_end.action] for action_end in action_ends
-        ]
-
-        if len(action_ends) > 1:
-            for tipping_point_idx in range(len(tipping_points) - 1):
-                tipping_point_from = tipping_points[tipping_point_idx]
-                tipping_point_to = tipping_points[tipping_point_idx + 1]
-
-                if not tipping_point_from < tipping_point_to:
-                    raise ValueError(
-                        f"Given the sequences of actions, the tipping point of action "
-                        f"{action_ends[tipping_point_idx + 1].action} ({tipping_point_to}) "
-                        f"must be equal or larger than {tipping_point_from}"
-                    )
+    violations = tipping_point_violations(pathway_map, tipping_point_by_action)
+
+    if len(violations) > 0:
+        raise ValueError(
+            "\n".join(
+                f"Given the sequences of actions, the tipping point of action "
+                f"{to_action} ({tipping_point_by_action[to_action]}) "
+                f"must be equal or larger than {tipping_point_by_action[from_action]}"
+                for from_action, to_action in violations
+            )
+        )
 
 
 def tipping_point_range(
@@ -1,4 +1,7 @@
+import typing
+
 from ..action import Action
+from .directed_graph import PathStatistics
 from .node.action import Action as ActionNode
 from .rooted_graph import RootedGraph
 
@@ -9,23 +12,24 @@ class SequenceGraph(RootedGraph):
     and each edge the fact that one action follows another one.
     """
 
-    def __init__(self, sequences: list[tuple[Action, Action]] | None = None) -> None:
+    def __init__(
+        self,
+        sequences: list[tuple[Action, Action]] | None = None,
+        *,
+        compact: bool = False,
+    ) -> None:
         """
         Create a sequence graph, based on a collection of sequences
 
         Each of the actions in the sequences passed in is associated with a node in the graph.
         The same action is associated with the same node.
+
+        See :class:`DirectedGraph` for the meaning of ``compact``.
         """
-        super().__init__()
+        super().__init__(compact=compact)
 
         if sequences is not None:
-            node_by_action: dict[Action, ActionNode] = {}
-
-            for from_action, to_action in sequences:
-                self.add_sequence(
-                    node_by_action.setdefault(from_action, ActionNode(from_action)),
-                    node_by_action.setdefault(to_action, ActionNode(to_action)),
-                )
+            self.add_sequence_batches([sequences])
 
     def add_action(self, action: ActionNode) -> None:
         """
@@ -50,7 +54,36 @@ class SequenceGraph(RootedGraph):
 
         :param actions: List of tuples of ``from_action`` and ``to_action``
         """
-        return self._graph.add_edges_from(actions)
+        self._graph.add_edges_from(actions)
+
+    def add_sequence_batches(
+        self, batches: typing.Iterable[list[tuple[Action, Action]]]
+    ) -> None:
+        """
+        Add batches of sequences of actions
+
+        :param batches: Iterable of collections of sequences, like the ones passed into the
+            constructor
+
+        The batches are consumed one at a time. Each of the actions in the sequences is
+        associated with a node in the graph. The same action is associated with the same node,
+        also when it occurs in different batches, or was already added to the graph before. Use
+        this function to create a graph from a generator of batches, like
+        :py:func:`adaptation_pathways.io.text.iter_sequences`, without holding all sequences in
+        memory, or to extend an existing graph.
+        """
+        node_by_action: dict[Action, ActionNode] = {
+            node.action: node
+            for node in self._graph.nodes
+            if isinstance(node, ActionNode)
+        }
+
+        for sequences in batches:
+            for from_action, to_action in sequences:
+                self.add_sequence(
+                    node_by_action.setdefault(from_action, ActionNode(from_action)),
+                    node_by_action.setdefault(to_action, ActionNode(to_action)),
+                )
 
     def nr_actions(self) -> int:
         """
@@ -90,7 +123,30 @@ class SequenceGraph(RootedGraph):
         """
         :return: Number of sequences
         """
-        return len(self._graph.edges)
+        return self._graph.number_of_edges()
 
     def all_to_actions(self, from_action: ActionNode) -> list[ActionNode]:
         return self.all_to_nodes(from_action)
+
+    def nr_occurrences_by_action_name(
+        self, statistics: PathStatistics | None = None
+    ) -> dict[str, int]:
+        """
+        :param statistics: Path statistics of this graph, as returned by :meth:`path_statistics`.
+            If not passed in, they are calculated.
+        :return: Per action name the number of times the action occurs in all pathways
+
+        An action occurring in multiple sequences is counted once for each pathway it is part of.
+        """
+        if statistics is None:
+            statistics = self.path_statistics()
+
+        nr_occurrences_by_action_name: dict[str, int] = {}
+
+        for node, nr_paths in statistics.nr_paths_by_node.items():
+            name = node.action.name
+            nr_occurrences_by_action_name[name] = (
+                nr_occurrences_by_action_name.get(name, 0) + nr_paths
+            )
+
+        return nr_occurrences_by_action_name
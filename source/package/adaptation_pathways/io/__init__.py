@@ -4,6 +4,9 @@ Two formats are supported: text and binary. The text format is useful to edit by
 multiple files are needed to store all information, which may be inconvenient. The binary format
 is useful because only a single file is used to store all information. Using the :ref:`import and
 export command-line utilities <import_export>`, the formats can be translated into each other.
+
+For analyses, datasets can also be stored in a columnar format, as arrays which are
+memory-mapped when read. See :py:mod:`adaptation_pathways.io.columnar`.
 """
 
 from .dataset import read_dataset
@@ -1,11 +1,14 @@
 import copy
+import dataclasses
+import itertools
 import sqlite3
+import typing
 from pathlib import Path
 
 from ..action import Action
 from ..action_combination import ActionCombination
 from ..alias import Actions, Sequences, TippingPointByAction
-from ..plot.alias import ColourByActionName
+from ..plot.alias import Colour, ColourByActionName
 from ..plot.colour import default_node_colour, hex_to_rgba, rgba_to_hex
 
 
@@ -17,6 +20,43 @@ _plot_table_name = "plot"
 default_database_path_suffix = ".apw"
 
 
+@dataclasses.dataclass
+class DatasetChanges:
+    """
+    Changes made to a dataset by :py:func:`update_dataset`
+
+    :param added_actions: Names of actions added
+    :param removed_actions: Names of actions removed
+    :param changed_combinations: Names of existing action combinations whose combined actions
+        changed
+    :param changed_colours: Names of existing actions whose colour changed
+    :param added_sequences: Names of the from-action and to-action of sequences added
+    :param removed_sequences: Names of the from-action and to-action of sequences removed
+    :param changed_tipping_points: Name of the action, and the previous and new tipping point,
+        of sequences whose tipping point changed
+
+    The root sequence, relating the root action with itself, is treated like any other sequence.
+    """
+
+    added_actions: list[str] = dataclasses.field(default_factory=list)
+    removed_actions: list[str] = dataclasses.field(default_factory=list)
+    changed_combinations: list[str] = dataclasses.field(default_factory=list)
+    changed_colours: list[str] = dataclasses.field(default_factory=list)
+    added_sequences: list[tuple[str, str]] = dataclasses.field(default_factory=list)
+    removed_sequences: list[tuple[str, str]] = dataclasses.field(default_factory=list)
+    changed_tipping_points: list[tuple[str, float, float]] = dataclasses.field(
+        default_factory=list
+    )
+
+    def has_changes(self) -> bool:
+        """
+        :return: Whether anything changed
+        """
+        return any(
+            len(getattr(self, field.name)) > 0 for field in dataclasses.fields(self)
+        )
+
+
 def normalize_database_path(database_path: Path | str) -> Path:
     """
     Perform a number of updates to the path passed in
@@ -113,40 +153,18 @@ def _create_tables(connection):
     )
 
 
-def _insert_records(
-    connection,
-    actions: Actions,
-    sequences: Sequences,
-    tipping_point_by_action: TippingPointByAction,
-    colour_by_action_name: ColourByActionName,
-) -> None:
-    # pylint: disable=too-many-locals
-
-    action_id_by_name = {
-        action.name: action_id for action_id, action in enumerate(actions)
-    }
-    action_records = (
-        {"action_id": action_id_by_name[action.name], "name": action.name}
-        for action in actions
+def _create_indexes(connection):
+    # Covering index for looking up sequences by the editions they relate, without visiting the
+    # table itself
+    connection.execute(
+        f"""
+        CREATE INDEX {_sequence_table_name}_edition_index
+        ON {_sequence_table_name} (from_edition_id, to_edition_id)
+        """
     )
 
-    with connection:
-        connection.executemany(
-            f"""
-            INSERT INTO {_action_table_name}
-            (
-                action_id,
-                name
-            )
-            VALUES
-            (
-                :action_id,
-                :name
-            )
-            """,
-            action_records,
-        )
 
+def _edition_id_by_instance(sequences: Sequences) -> dict[Action, int]:
     # Sequences contain actions. Actions have a unique name. Actions with the same name are
     # the same action: they must have the same action_id. In the sequences, these actions must
     # be the same instance (have the same id()).
@@ -154,166 +172,184 @@ def _insert_records(
     # same action. They must be treated as being different editions. Actions with different
     # editions can be associated with different tipping points.
 
-    # All unique Action instances, by name
-    action_instances_by_name: dict[str, list[Action]] = {}
-
-    # All unique Action instances, is some order
-    action_instances: Actions = []
-
-    def add_action_instance(action):
-        if action.name not in action_instances_by_name:
-            action_instances_by_name[action.name] = [action]
-            action_instances.append(action)
-        elif action not in action_instances_by_name[action.name]:
-            action_instances_by_name[action.name].append(action)
-            action_instances.append(action)
+    # All unique Action instances, in some order, by the ID of their edition
+    edition_id_by_instance: dict[Action, int] = {}
 
     for sequence in sequences:
         for action in sequence:
             if isinstance(action, ActionCombination):
                 for combined_action in action.actions:
-                    add_action_instance(combined_action)
+                    edition_id_by_instance.setdefault(
+                        combined_action, len(edition_id_by_instance)
+                    )
+
+            edition_id_by_instance.setdefault(action, len(edition_id_by_instance))
+
+    return edition_id_by_instance
+
 
-            add_action_instance(action)
+def _root_action(
+    sequences: Sequences, tipping_point_by_action: TippingPointByAction
+) -> Action | None:
+    # The root action is the one action with a tipping point which is not a to-action
+    if len(sequences) == 0:
+        return None
 
-    # Action edition ID by instance, in some order
-    edition_id_by_instance = {
-        action: edition_id for edition_id, action in enumerate(action_instances)
+    to_actions = {sequence[1] for sequence in sequences}
+    root_actions = {
+        action for action in tipping_point_by_action if action not in to_actions
     }
+    assert (
+        len(root_actions) == 1
+    ), f"Expected a single root action, but found {root_actions}"
+
+    return root_actions.pop()
+
+
+def _insert_records(
+    connection,
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
+) -> None:
+    """
+    Insert the information passed in into the tables
+
+    All records are inserted in a single transaction.
+    """
+    # pylint: disable=too-many-locals
+
+    action_id_by_name = {
+        action.name: action_id for action_id, action in enumerate(actions)
+    }
+    action_records = (
+        (action_id_by_name[action.name], action.name) for action in actions
+    )
+
+    edition_id_by_instance = _edition_id_by_instance(sequences)
 
     edition_records = (
-        {
-            "action_id": action_id_by_name[action.name],
-            "edition_id": edition_id,
-        }
+        (action_id_by_name[action.name], edition_id)
         for action, edition_id in edition_id_by_instance.items()
     )
 
-    with connection:
-        connection.executemany(
-            f"""
-            INSERT INTO {_edition_table_name}
-            (
-                action_id,
-                edition_id
-            )
-            VALUES
+    sequence_records = [
+        (
+            sequence_id,
+            edition_id_by_instance[sequence[0]],
+            edition_id_by_instance[sequence[1]],
+            tipping_point_by_action[sequence[1]],
+        )
+        for sequence_id, sequence in enumerate(sequences, start=1)
+    ]
+
+    root_action = _root_action(sequences, tipping_point_by_action)
+
+    if root_action is not None:
+        sequence_records.insert(
+            0,
             (
-                :action_id,
-                :edition_id
-            )
-            """,
-            edition_records,
+                0,
+                edition_id_by_instance[root_action],
+                edition_id_by_instance[root_action],
+                tipping_point_by_action[root_action],
+            ),
         )
 
-    sequence_records = list(
-        {
-            "sequence_id": sequence_id,
-            "from_edition_id": edition_id_by_instance[sequence[0]],
-            "to_edition_id": edition_id_by_instance[sequence[1]],
-            "tipping_point": tipping_point_by_action[sequence[1]],
-        }
-        for sequence_id, sequence in enumerate(sequences, start=1)
+    # Action combination are actions that combine other actions. In the table we relate the id
+    # of the action combination with the id's of the actions that are combined. In principle
+    # any number (≥ 2) of actions can be combined into a single action combination.
+    action_combination_records = (
+        (action_id_by_name[action.name], action_id_by_name[combined_action.name])
+        for action in actions
+        if isinstance(action, ActionCombination)
+        for combined_action in action.actions
     )
 
-    if len(sequences) > 0:
-        root_actions = {
-            action
-            for action in tipping_point_by_action
-            if action not in [sequence[1] for sequence in sequences]
-        }
-        assert (
-            len(root_actions) == 1
-        ), f"Expected a single root action, but found {root_actions}"
-        root_action = root_actions.pop()
-
-        sequence_records = [
-            {
-                "sequence_id": 0,
-                "from_edition_id": edition_id_by_instance[root_action],
-                "to_edition_id": edition_id_by_instance[root_action],
-                "tipping_point": tipping_point_by_action[root_action],
-            }
-        ] + sequence_records
+    # Many actions share the same colour
+    hex_by_rgba = {
+        colour: rgba_to_hex(colour) for colour in set(colour_by_action_name.values())
+    }
+    plot_records = (
+        (
+            action_id_by_name[action.name],
+            hex_by_rgba[colour_by_action_name[action.name]],
+        )
+        for action in actions
+    )
 
     with connection:
+        connection.executemany(
+            f"""
+            INSERT INTO {_action_table_name} (action_id, name)
+            VALUES (?, ?)
+            """,
+            action_records,
+        )
+        connection.executemany(
+            f"""
+            INSERT INTO {_edition_table_name} (action_id, edition_id)
+            VALUES (?, ?)
+            """,
+            edition_records,
+        )
         connection.executemany(
             f"""
             INSERT INTO {_sequence_table_name}
-            (
-                sequence_id,
-                from_edition_id,
-                to_edition_id,
-                tipping_point
-            )
-            VALUES
-            (
-                :sequence_id,
-                :from_edition_id,
-                :to_edition_id,
-                :tipping_point
-            )
+            (sequence_id, from_edition_id, to_edition_id, tipping_point)
+            VALUES (?, ?, ?, ?)
             """,
             sequence_records,
         )
-
-    # Action combination are actions that combine other actions. In the table we relate the id
-    # of the action combination with the id's of the actions that are combined. In principle
-    # any number (≥ 2) of actions can be combined into a single action combination.
-    action_combination_records = []
-
-    for action in actions:
-        if isinstance(action, ActionCombination):
-            for combined_action in action.actions:
-                action_combination_records.append(
-                    {
-                        "action_id": action_id_by_name[action.name],
-                        "combined_action_id": action_id_by_name[combined_action.name],
-                    }
-                )
-
-    with connection:
         connection.executemany(
             f"""
-            INSERT INTO {_action_combination_table_name}
-            (
-                action_id,
-                combined_action_id
-            )
-            VALUES
-            (
-                :action_id,
-                :combined_action_id
-            )
+            INSERT INTO {_action_combination_table_name} (action_id, combined_action_id)
+            VALUES (?, ?)
             """,
             action_combination_records,
         )
-
-    plot_records = (
-        {
-            "action_id": action_id_by_name[action.name],
-            "colour": rgba_to_hex(colour_by_action_name[action.name]),
-        }
-        for action in actions
-    )
-
-    with connection:
         connection.executemany(
             f"""
-            INSERT INTO {_plot_table_name}
-            (
-                action_id,
-                colour
-            )
-            VALUES
-            (
-                :action_id,
-                :colour
-            )
+            INSERT INTO {_plot_table_name} (action_id, colour)
+            VALUES (?, ?)
             """,
             plot_records,
         )
 
+        # Creating indexes after inserting the records is faster than updating them while
+        # inserting
+        _create_indexes(connection)
+
+
+def _write_dataset(  # pylint: disable=too-many-arguments
+    connection,
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
+    *,
+    bulk: bool = False,
+) -> None:
+    """
+    Write the information passed in to the empty database the connection is connected to
+
+    See :py:func:`write_dataset`.
+    """
+    connection.execute("PRAGMA foreign_keys = 1")
+    connection.execute("PRAGMA ignore_check_constraints = 0")
+
+    if bulk:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+
+    # The tables are created in the same transaction in which the records are inserted
+    connection.execute("BEGIN")
+    _create_tables(connection)
+    _insert_records(
+        connection, actions, sequences, tipping_point_by_action, colour_by_action_name
+    )
+
 
 def write_dataset(  # pylint: disable=too-many-arguments
     actions: Actions,
@@ -323,9 +359,18 @@ def write_dataset(  # pylint: disable=too-many-arguments
     database_path: Path | str,
     *,
     overwrite: bool = True,
+    bulk: bool = False,
 ) -> None:
     """
     Save the information passed in to the database
+
+    :param overwrite: Whether to overwrite an existing database
+    :param bulk: Whether to turn off the rollback journal and synchronous writes while writing.
+        This makes writing large datasets faster, but the database may be corrupt when the
+        process or the machine crashes while writing. Since the database is always created from
+        scratch, this is only an issue when the previous contents must be kept in such a case.
+
+    All information is written in a single transaction.
     """
     assert len(colour_by_action_name) == len(
         actions
@@ -339,150 +384,875 @@ def write_dataset(  # pylint: disable=too-many-arguments
     database_path.unlink(missing_ok=True)
 
     connection = sqlite3.connect(database_path)
-    connection.execute("PRAGMA foreign_keys = 1")
-    connection.execute("PRAGMA ignore_check_constraints = 0")
-
-    _create_tables(connection)
-    _insert_records(
-        connection, actions, sequences, tipping_point_by_action, colour_by_action_name
+    _write_dataset(
+        connection,
+        actions,
+        sequences,
+        tipping_point_by_action,
+        colour_by_action_name,
+        bulk=bulk,
     )
     connection.close()
 
 
-def read_dataset(  # pylint: disable=too-many-locals
+# Editions are identified by the name of their action and the order in which editions of the
+# same action occur
+_EditionKey = tuple[str, int]
+
+
+def _edition_keys(names: typing.Iterable[str]) -> list[_EditionKey]:
+    # Key of each edition, given the name of the action of each edition, in edition order
+    nr_editions_by_name: dict[str, int] = {}
+    keys = []
+
+    for name in names:
+        ordinal = nr_editions_by_name.get(name, 0)
+        nr_editions_by_name[name] = ordinal + 1
+        keys.append((name, ordinal))
+
+    return keys
+
+
+def update_dataset(
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
     database_path: Path | str,
-) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+) -> DatasetChanges:
     """
-    Open the database and return the contents
+    Update an existing database to contain the information passed in
 
-    :return: Tuple of actions and sequences read
+    :return: The changes made
+    :raises RuntimeError: In case the database does not exist
+
+    Only the records that differ from the information passed in are inserted, updated or
+    deleted, in a single transaction. Reading the database afterwards results in the same
+    information as when it would have been written by :py:func:`write_dataset`, except for the
+    order of the actions and sequences: existing ones keep their position, and new ones are
+    added at the end.
+
+    Actions are identified by their name. Editions of an action are identified by the order in
+    which they occur in the sequences, and sequences by the editions they relate. Removing an
+    edition therefore may result in changes being reported for later editions of the same
+    action.
     """
+    assert len(colour_by_action_name) == len(
+        actions
+    ), f"{colour_by_action_name} ↔ {actions}"
+
     database_path = normalize_database_path(database_path)
 
-    connection = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+    if not database_path.exists():
+        raise RuntimeError(f"Database {database_path} does not exist")
+
+    connection = sqlite3.connect(database_path)
+
+    try:
+        return _update_dataset(
+            connection,
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+        )
+    finally:
+        connection.close()
+
+
+def _update_dataset(  # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    connection: sqlite3.Connection,
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
+) -> DatasetChanges:
+    changes = DatasetChanges()
     connection.execute("PRAGMA foreign_keys = 1")
+    connection.execute("PRAGMA ignore_check_constraints = 0")
 
-    # Use SQL for this
-    # https://github.com/Deltares-research/PathwaysGenerator/issues/20
+    # Information currently stored
+    action_id_by_name: dict[str, int] = dict(
+        connection.execute(f"SELECT name, action_id FROM {_action_table_name}")
+    )
+    action_name_by_id = {
+        action_id: name for name, action_id in action_id_by_name.items()
+    }
+    stored_colour_by_action_id: dict[int, str] = dict(
+        connection.execute(f"SELECT action_id, colour FROM {_plot_table_name}")
+    )
+    stored_combined_names_by_action_id: dict[int, list[str]] = {}
 
-    action_data = list(
+    for action_id, combined_action_id in connection.execute(
+        f"SELECT action_id, combined_action_id FROM {_action_combination_table_name}"
+    ):
+        stored_combined_names_by_action_id.setdefault(action_id, []).append(
+            action_name_by_id[combined_action_id]
+        )
+
+    stored_editions = list(
         connection.execute(
             f"""
-            SELECT action_id, name
-            FROM {_action_table_name}
+            SELECT edition_id, action_id
+            FROM {_edition_table_name}
+            ORDER BY edition_id
             """
         )
     )
+    edition_id_by_key = dict(
+        zip(
+            _edition_keys(
+                action_name_by_id[action_id] for _, action_id in stored_editions
+            ),
+            (edition_id for edition_id, _ in stored_editions),
+        )
+    )
+    edition_key_by_id = {
+        edition_id: key for key, edition_id in edition_id_by_key.items()
+    }
+    stored_sequence_by_keys: dict[
+        tuple[_EditionKey, _EditionKey], tuple[int, float]
+    ] = {
+        (edition_key_by_id[from_edition_id], edition_key_by_id[to_edition_id]): (
+            sequence_id,
+            tipping_point,
+        )
+        for sequence_id, from_edition_id, to_edition_id, tipping_point in connection.execute(
+            f"""
+            SELECT sequence_id, from_edition_id, to_edition_id, tipping_point
+            FROM {_sequence_table_name}
+            """
+        )
+    }
 
-    action_name_by_id = {}
+    # Information to store
+    edition_instances = list(_edition_id_by_instance(sequences))
+    edition_key_by_instance = dict(
+        zip(
+            edition_instances,
+            _edition_keys(action.name for action in edition_instances),
+        )
+    )
+    sequence_records = [
+        (sequence[0], sequence[1], tipping_point_by_action[sequence[1]])
+        for sequence in sequences
+    ]
+    root_action = _root_action(sequences, tipping_point_by_action)
 
-    for action_id, name in action_data:
-        action_name_by_id[action_id] = name
+    if root_action is not None:
+        sequence_records.insert(
+            0, (root_action, root_action, tipping_point_by_action[root_action])
+        )
 
-    action_combination_data = list(
-        connection.execute(
-            f"""
-            SELECT action_id, combined_action_id
-            FROM {_action_combination_table_name}
-            """
+    tipping_point_by_keys = {
+        (edition_key_by_instance[from_action], edition_key_by_instance[to_action]): (
+            tipping_point
         )
+        for from_action, to_action, tipping_point in sequence_records
+    }
+    hex_by_rgba = {
+        colour: rgba_to_hex(colour) for colour in set(colour_by_action_name.values())
+    }
+
+    # Differences
+    action_names = [action.name for action in actions]
+    changes.added_actions = [
+        name for name in action_names if name not in action_id_by_name
+    ]
+    changes.removed_actions = sorted(
+        set(action_id_by_name) - set(action_names), key=action_id_by_name.__getitem__
     )
-    combined_action_ids_by_action_id: dict[int, list[int]] = {}
+    combined_names_by_name = {
+        action.name: [combined_action.name for combined_action in action.actions]
+        for action in actions
+        if isinstance(action, ActionCombination)
+    }
+    changes.changed_combinations = [
+        name
+        for name in action_names
+        if name in action_id_by_name
+        and combined_names_by_name.get(name, [])
+        != stored_combined_names_by_action_id.get(action_id_by_name[name], [])
+    ]
+    changes.changed_colours = [
+        name
+        for name in action_names
+        if name in action_id_by_name
+        and hex_by_rgba[colour_by_action_name[name]]
+        != stored_colour_by_action_id.get(action_id_by_name[name])
+    ]
+    added_edition_keys = [
+        key for key in edition_key_by_instance.values() if key not in edition_id_by_key
+    ]
+    removed_edition_keys = set(edition_id_by_key) - set(
+        edition_key_by_instance.values()
+    )
+    added_sequence_keys = [
+        keys for keys in tipping_point_by_keys if keys not in stored_sequence_by_keys
+    ]
+    removed_sequence_keys = {
+        keys: None
+        for keys in stored_sequence_by_keys
+        if keys not in tipping_point_by_keys
+    }
+    changed_sequence_keys = {
+        keys: None
+        for keys, tipping_point in tipping_point_by_keys.items()
+        if keys in stored_sequence_by_keys
+        and stored_sequence_by_keys[keys][1] != tipping_point
+    }
+    changes.added_sequences = [
+        (from_key[0], to_key[0]) for from_key, to_key in added_sequence_keys
+    ]
+    changes.removed_sequences = [
+        (from_key[0], to_key[0]) for from_key, to_key in removed_sequence_keys
+    ]
+    changes.changed_tipping_points = [
+        (to_key[0], stored_sequence_by_keys[(from_key, to_key)][1], tipping_point)
+        for (from_key, to_key), tipping_point in tipping_point_by_keys.items()
+        if (from_key, to_key) in changed_sequence_keys
+    ]
 
-    for action_id, combined_action_id in action_combination_data:
-        combined_action_ids_by_action_id.setdefault(action_id, []).append(
-            combined_action_id
+    with connection:
+        # Remove records, in the reverse order of the dependencies between the tables
+        connection.executemany(
+            f"DELETE FROM {_sequence_table_name} WHERE sequence_id = ?",
+            ((stored_sequence_by_keys[keys][0],) for keys in removed_sequence_keys),
+        )
+        connection.executemany(
+            f"DELETE FROM {_edition_table_name} WHERE edition_id = ?",
+            ((edition_id_by_key[key],) for key in removed_edition_keys),
+        )
+        connection.executemany(
+            f"DELETE FROM {_action_combination_table_name} WHERE action_id = ?",
+            (
+                (action_id_by_name[name],)
+                for name in changes.changed_combinations + changes.removed_actions
+            ),
+        )
+        connection.executemany(
+            f"DELETE FROM {_plot_table_name} WHERE action_id = ?",
+            ((action_id_by_name[name],) for name in changes.removed_actions),
+        )
+        connection.executemany(
+            f"DELETE FROM {_action_table_name} WHERE action_id = ?",
+            ((action_id_by_name.pop(name),) for name in changes.removed_actions),
+        )
+
+        # Add records, in the order of the dependencies between the tables
+        next_action_id = max(action_id_by_name.values(), default=-1) + 1
+
+        for name in changes.added_actions:
+            action_id_by_name[name] = next_action_id
+            next_action_id += 1
+
+        connection.executemany(
+            f"INSERT INTO {_action_table_name} (action_id, name) VALUES (?, ?)",
+            ((action_id_by_name[name], name) for name in changes.added_actions),
+        )
+        connection.executemany(
+            f"INSERT INTO {_plot_table_name} (action_id, colour) VALUES (?, ?)",
+            (
+                (action_id_by_name[name], hex_by_rgba[colour_by_action_name[name]])
+                for name in changes.added_actions
+            ),
+        )
+        connection.executemany(
+            # Colours may be missing for existing actions
+            f"INSERT OR REPLACE INTO {_plot_table_name} (action_id, colour) VALUES (?, ?)",
+            (
+                (action_id_by_name[name], hex_by_rgba[colour_by_action_name[name]])
+                for name in changes.changed_colours
+            ),
+        )
+        connection.executemany(
+            f"""
+            INSERT INTO {_action_combination_table_name} (action_id, combined_action_id)
+            VALUES (?, ?)
+            """,
+            (
+                (action_id_by_name[name], action_id_by_name[combined_name])
+                for name in changes.changed_combinations
+                + [
+                    name
+                    for name in changes.added_actions
+                    if name in combined_names_by_name
+                ]
+                for combined_name in combined_names_by_name.get(name, [])
+            ),
+        )
+
+        next_edition_id = (
+            max(
+                (edition_id for edition_id, _ in stored_editions),
+                default=-1,
+            )
+            + 1
+        )
+
+        for key in removed_edition_keys:
+            del edition_id_by_key[key]
+
+        for key in added_edition_keys:
+            edition_id_by_key[key] = next_edition_id
+            next_edition_id += 1
+
+        connection.executemany(
+            f"INSERT INTO {_edition_table_name} (action_id, edition_id) VALUES (?, ?)",
+            (
+                (action_id_by_name[key[0]], edition_id_by_key[key])
+                for key in added_edition_keys
+            ),
         )
 
+        sequence_ids = {
+            stored_sequence_by_keys[keys][0]
+            for keys in stored_sequence_by_keys
+            if keys not in removed_sequence_keys
+        }
+        next_sequence_id = max(sequence_ids, default=0) + 1
+        sequence_records_to_insert = []
+
+        for from_key, to_key in added_sequence_keys:
+            if from_key == to_key and 0 not in sequence_ids:
+                # Root sequence
+                sequence_id = 0
+            else:
+                sequence_id = next_sequence_id
+                next_sequence_id += 1
+
+            sequence_ids.add(sequence_id)
+            sequence_records_to_insert.append(
+                (
+                    sequence_id,
+                    edition_id_by_key[from_key],
+                    edition_id_by_key[to_key],
+                    tipping_point_by_keys[(from_key, to_key)],
+                )
+            )
+
+        connection.executemany(
+            f"""
+            INSERT INTO {_sequence_table_name}
+            (sequence_id, from_edition_id, to_edition_id, tipping_point)
+            VALUES (?, ?, ?, ?)
+            """,
+            sequence_records_to_insert,
+        )
+        connection.executemany(
+            f"UPDATE {_sequence_table_name} SET tipping_point = ? WHERE sequence_id = ?",
+            (
+                (tipping_point_by_keys[keys], stored_sequence_by_keys[keys][0])
+                for keys in changed_sequence_keys
+            ),
+        )
+
+    return changes
+
+
+def _read_actions(
+    connection,
+    action_ids_query: str | None = None,
+    parameters: typing.Sequence | dict = (),
+) -> tuple[dict[int, Action], ColourByActionName]:
+    """
+    Read actions and their colours
+
+    :param action_ids_query: Query selecting the IDs of the actions to read. By default all
+        actions are read.
+    :param parameters: Parameters of the query
+    """
     action_by_id: dict[int, Action] = {}
+    colour_by_action_name: ColourByActionName = {}
+    condition = (
+        f"WHERE action_id IN ({action_ids_query})"
+        if action_ids_query is not None
+        else ""
+    )
+
+    # Many actions share the same colour
+    rgba_by_hex: dict[str, Colour] = {}
 
     # First add a regular action instance for all actions. This will keep the order as is.
-    for action_id, action_name in action_name_by_id.items():
+    for action_id, action_name, colour in connection.execute(
+        f"""
+        SELECT action_id, action.name, plot.colour
+        FROM {_action_table_name} AS action
+        LEFT JOIN {_plot_table_name} AS plot USING (action_id)
+        {condition}
+        ORDER BY action_id
+        """,
+        parameters,
+    ):
         action_by_id[action_id] = Action(action_name)
 
+        if colour is None:
+            colour_by_action_name[action_name] = default_node_colour()
+        else:
+            if colour not in rgba_by_hex:
+                rgba_by_hex[colour] = hex_to_rgba(colour)
+
+            colour_by_action_name[action_name] = rgba_by_hex[colour]
+
+    combined_action_ids_by_action_id: dict[int, list[int]] = {}
+
+    for action_id, combined_action_id in connection.execute(
+        f"""
+        SELECT action_id, combined_action_id
+        FROM {_action_combination_table_name}
+        {condition}
+        """,
+        parameters,
+    ):
+        combined_action_ids_by_action_id.setdefault(action_id, []).append(
+            combined_action_id
+        )
+
     # Now replace some of the actions by action combinations that combine regular actions
-    for action_id, action_name in action_name_by_id.items():
+    for action_id, action in action_by_id.items():
         if action_id in combined_action_ids_by_action_id:
             combined_actions = [
                 action_by_id[combined_action_id]
                 for combined_action_id in combined_action_ids_by_action_id[action_id]
             ]
-            action_by_id[action_id] = ActionCombination(action_name, combined_actions)
+            action_by_id[action_id] = ActionCombination(action.name, combined_actions)
+
+    return action_by_id, colour_by_action_name
+
+
+# Query selecting per sequence the editions and actions it relates, and the tipping point
+_sequence_records_query = f"""
+    SELECT
+        sequence.from_edition_id,
+        from_edition.action_id,
+        sequence.to_edition_id,
+        to_edition.action_id,
+        sequence.tipping_point
+    FROM {_sequence_table_name} AS sequence
+    JOIN {_edition_table_name} AS from_edition
+        ON from_edition.edition_id = sequence.from_edition_id
+    JOIN {_edition_table_name} AS to_edition
+        ON to_edition.edition_id = sequence.to_edition_id
+"""
+
+
+def _read_sequences(
+    sequence_records: typing.Iterable[tuple[int, int, int, int, float]],
+    action_by_id: dict[int, Action],
+) -> tuple[Sequences, TippingPointByAction]:
+    """
+    Create the sequences and tipping points corresponding with the records passed in
 
-    edition_data = list(
-        connection.execute(
-            f"""
-            SELECT action_id, edition_id
-            FROM {_edition_table_name}
-            """
-        )
-    )
+    :param sequence_records: Records as selected by ``_sequence_records_query``
+    """
+    # Each edition of an action is represented by its own copy of the action
+    action_instance_by_edition: dict[int, Action] = {}
+
+    sequences: Sequences = []
+    tipping_point_by_action: TippingPointByAction = {}
+    root_sequences = []
+
+    for (
+        from_edition_id,
+        from_action_id,
+        to_edition_id,
+        to_action_id,
+        tipping_point,
+    ) in sequence_records:
+        if from_edition_id not in action_instance_by_edition:
+            action_instance_by_edition[from_edition_id] = copy.copy(
+                action_by_id[from_action_id]
+            )
 
-    action_instance_by_edition: dict[tuple[str, int], Action] = {
-        edition_id: copy.copy(action_by_id[action_id])
-        for action_id, edition_id in edition_data
-    }
+        if to_edition_id not in action_instance_by_edition:
+            action_instance_by_edition[to_edition_id] = copy.copy(
+                action_by_id[to_action_id]
+            )
 
-    actions: Actions = list(action_by_id.values())
+        from_action = action_instance_by_edition[from_edition_id]
+        to_action = action_instance_by_edition[to_edition_id]
 
-    sequence_data = list(
-        connection.execute(
-            f"""
-            SELECT sequence_id, from_edition_id, to_edition_id, tipping_point
-            FROM {_sequence_table_name}
-            """
-        )
-    )
+        # One of the sequences relates the root action with itself. This is the one sequence
+        # which we must not add to the collection.
+        if from_action is to_action:
+            root_sequences.append((from_action, to_action))
+        else:
+            sequences.append((from_action, to_action))
 
-    sequences = [
-        (
-            action_instance_by_edition[sequence_record[1]],
-            action_instance_by_edition[sequence_record[2]],
-        )
-        for sequence_record in sequence_data
-    ]
+        tipping_point_by_action[to_action] = tipping_point
 
-    if len(sequences) > 0:
-        # One of the sequences relates the root action with itself. This is the one sequence which
-        # we must remove from the collection.
-        root_sequences = [
-            (sequence[0], sequence[1])
-            for sequence in sequences
-            if sequence[0] == sequence[1]
-        ]
+    if len(sequences) > 0 or len(root_sequences) > 0:
         assert len(root_sequences) == 1, f"{root_sequences}"
-        sequences.remove(root_sequences[0])
 
-    to_actions = {sequence[1] for sequence in sequences}
-    assert len(to_actions) == len(
-        sequences
+    assert len(tipping_point_by_action) == len(sequences) + len(
+        root_sequences
     ), "Detected sequences with converging actions which is not supported"
 
-    tipping_point_by_action = {
-        action_instance_by_edition[sequence_record[2]]: sequence_record[3]
-        for sequence_record in sequence_data
-    }
+    return sequences, tipping_point_by_action
 
-    plot_data = connection.execute(
-        f"""
-        SELECT action_id, colour
-        FROM {_plot_table_name}
-        """
-    )
 
-    colour_by_action_name = {
-        action_by_id[plot_record[0]].name: hex_to_rgba(plot_record[1])
-        for plot_record in plot_data
-    }
+def _read_dataset(
+    connection,
+) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+    """
+    Return the contents of the database the connection is connected to
+
+    See :py:func:`read_dataset`.
+    """
+    connection.execute("PRAGMA foreign_keys = 1")
 
-    for action in action_by_id.values():
-        if not action.name in colour_by_action_name:
-            colour_by_action_name[action.name] = default_node_colour()
+    # Records are returned as plain tuples
+    connection.row_factory = None
 
-    connection.close()
+    action_by_id, colour_by_action_name = _read_actions(connection)
+    actions: Actions = list(action_by_id.values())
+    sequences, tipping_point_by_action = _read_sequences(
+        connection.execute(f"{_sequence_records_query} ORDER BY sequence.sequence_id"),
+        action_by_id,
+    )
 
     assert len(colour_by_action_name) == len(
         actions
     ), f"{colour_by_action_name} ↔ {actions}"
 
     return actions, sequences, tipping_point_by_action, colour_by_action_name
+
+
+def read_dataset(
+    database_path: Path | str,
+) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+    """
+    Open the database and return the contents
+
+    :return: Tuple of actions and sequences read
+
+    Actions and their colours are read using a single query, and so are the sequences and
+    the editions of the actions they relate. Records are processed while iterating over the
+    query results, instead of collecting them first.
+    """
+    database_path = normalize_database_path(database_path)
+
+    connection = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+    dataset = _read_dataset(connection)
+    connection.close()
+
+    return dataset
+
+
+@dataclasses.dataclass(frozen=True)
+class SequenceRecord:
+    """
+    Information about a sequence stored in a database
+
+    :param from_edition_id: ID of the edition of the from-action
+    :param from_action_name: Name of the from-action
+    :param to_edition_id: ID of the edition of the to-action
+    :param to_action_name: Name of the to-action
+    :param tipping_point: Tipping point of the to-action
+    """
+
+    from_edition_id: int
+    from_action_name: str
+    to_edition_id: int
+    to_action_name: str
+    tipping_point: float
+
+
+# Query selecting per sequence the information stored in a SequenceRecord, excluding the root
+# sequence
+_sequence_info_query = f"""
+    SELECT
+        sequence.from_edition_id,
+        from_action.name,
+        sequence.to_edition_id,
+        to_action.name,
+        sequence.tipping_point
+    FROM {_sequence_table_name} AS sequence
+    JOIN {_edition_table_name} AS from_edition
+        ON from_edition.edition_id = sequence.from_edition_id
+    JOIN {_action_table_name} AS from_action
+        ON from_action.action_id = from_edition.action_id
+    JOIN {_edition_table_name} AS to_edition
+        ON to_edition.edition_id = sequence.to_edition_id
+    JOIN {_action_table_name} AS to_action
+        ON to_action.action_id = to_edition.action_id
+    WHERE sequence.from_edition_id != sequence.to_edition_id
+"""
+
+# Recursive query selecting the IDs of the edition passed in and of all editions reachable
+# from it
+_reachable_editions_query = f"""
+    WITH RECURSIVE reachable(edition_id) AS (
+        VALUES (:edition_id)
+        UNION
+        SELECT sequence.to_edition_id
+        FROM {_sequence_table_name} AS sequence
+        JOIN reachable ON sequence.from_edition_id = reachable.edition_id
+    )
+    SELECT edition_id FROM reachable
+"""
+
+
+class BinaryDataset:
+    """
+    Handle for querying a database without reading all of its contents
+
+    :param database_path: Path of an existing database
+
+    The database is opened read-only, and kept open until :py:meth:`close` is called, or until
+    the ``with`` block in which the dataset is used ends. Questions are answered using SQL
+    queries, and results are returned as plain values, without creating :py:class:`Action`
+    instances. Editions are identified by the IDs they have in the database. Use
+    :py:meth:`read_subtree` for reading a subset of the contents in the format returned by
+    :py:func:`read_dataset`.
+    """
+
+    def __init__(self, database_path: Path | str) -> None:
+        database_path = normalize_database_path(database_path)
+
+        if not database_path.exists():
+            raise RuntimeError(f"Database {database_path} does not exist")
+
+        self._connection = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+        self._connection.execute("PRAGMA foreign_keys = 1")
+
+    def __enter__(self) -> "BinaryDataset":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        self._connection.close()
+
+    def _records(self, condition: str, parameters: dict) -> list[SequenceRecord]:
+        return [
+            SequenceRecord(*record)
+            for record in self._connection.execute(
+                f"{_sequence_info_query} AND {condition} ORDER BY sequence.sequence_id",
+                parameters,
+            )
+        ]
+
+    def nr_actions(self) -> int:
+        """
+        :return: Number of actions
+        """
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM {_action_table_name}"
+        ).fetchone()[0]
+
+    def nr_sequences(self) -> int:
+        """
+        :return: Number of sequences, excluding the root sequence
+        """
+        return self._connection.execute(
+            f"""
+            SELECT COUNT(*)
+            FROM {_sequence_table_name}
+            WHERE from_edition_id != to_edition_id
+            """
+        ).fetchone()[0]
+
+    def action_names(self) -> list[str]:
+        """
+        :return: Names of all actions, in the order in which they were written
+        """
+        return [
+            name
+            for (name,) in self._connection.execute(
+                f"SELECT name FROM {_action_table_name} ORDER BY action_id"
+            )
+        ]
+
+    def action_name(self, edition_id: int) -> str:
+        """
+        :return: Name of the action of the edition passed in
+        :raises ValueError: In case the edition does not exist
+        """
+        record = self._connection.execute(
+            f"""
+            SELECT action.name
+            FROM {_edition_table_name} AS edition
+            JOIN {_action_table_name} AS action USING (action_id)
+            WHERE edition.edition_id = ?
+            """,
+            (edition_id,),
+        ).fetchone()
+
+        if record is None:
+            raise ValueError(f"Edition {edition_id} does not exist")
+
+        return record[0]
+
+    def editions(self, action_name: str) -> list[int]:
+        """
+        :return: IDs of the editions of the action passed in
+        """
+        return [
+            edition_id
+            for (edition_id,) in self._connection.execute(
+                f"""
+                SELECT edition.edition_id
+                FROM {_edition_table_name} AS edition
+                JOIN {_action_table_name} AS action USING (action_id)
+                WHERE action.name = ?
+                ORDER BY edition.edition_id
+                """,
+                (action_name,),
+            )
+        ]
+
+    def root_edition(self) -> int | None:
+        """
+        :return: ID of the edition of the root action, or None in case the dataset does not
+            contain sequences
+        """
+        record = self._connection.execute(
+            f"""
+            SELECT from_edition_id
+            FROM {_sequence_table_name}
+            WHERE from_edition_id = to_edition_id
+            """
+        ).fetchone()
+
+        return record[0] if record is not None else None
+
+    def tipping_point(self, edition_id: int) -> float | None:
+        """
+        :return: Tipping point of the edition passed in, or None in case the edition is not the
+            to-action of a sequence
+        """
+        record = self._connection.execute(
+            f"""
+            SELECT tipping_point
+            FROM {_sequence_table_name}
+            WHERE to_edition_id = ?
+            ORDER BY sequence_id
+            """,
+            (edition_id,),
+        ).fetchone()
+
+        return record[0] if record is not None else None
+
+    def tipping_point_range(self) -> tuple[float, float] | None:
+        """
+        :return: Minimum and maximum tipping point of all actions, including the root action,
+            or None in case the dataset does not contain sequences
+        """
+        record = self._connection.execute(
+            f"SELECT MIN(tipping_point), MAX(tipping_point) FROM {_sequence_table_name}"
+        ).fetchone()
+
+        return (record[0], record[1]) if record[0] is not None else None
+
+    def sequences_from(self, action_name: str) -> list[SequenceRecord]:
+        """
+        :return: Sequences starting from any edition of the action passed in
+        """
+        return self._records(
+            "from_action.name = :action_name", {"action_name": action_name}
+        )
+
+    def children(self, edition_id: int) -> list[SequenceRecord]:
+        """
+        :return: Sequences starting from the edition passed in
+        """
+        return self._records(
+            "sequence.from_edition_id = :edition_id", {"edition_id": edition_id}
+        )
+
+    def subtree(self, edition_id: int) -> list[SequenceRecord]:
+        """
+        :return: Sequences starting from the edition passed in, or from any of the editions
+            reachable from it
+
+        The editions are found using a single recursive query.
+        """
+        return self._records(
+            f"sequence.from_edition_id IN ({_reachable_editions_query})",
+            {"edition_id": edition_id},
+        )
+
+    def read_subtree(
+        self, edition_id: int
+    ) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+        """
+        Read the part of the dataset starting at the edition passed in
+
+        :return: Tuple of actions and sequences read, like :py:func:`read_dataset`
+        :raises ValueError: In case the edition does not exist
+
+        The edition passed in becomes the root action of the result. Only the actions occurring
+        in the subtree, and the actions they combine, are part of the result.
+        """
+        record = self._connection.execute(
+            f"SELECT action_id FROM {_edition_table_name} WHERE edition_id = ?",
+            (edition_id,),
+        ).fetchone()
+
+        if record is None:
+            raise ValueError(f"Edition {edition_id} does not exist")
+
+        root_action_id = record[0]
+        tipping_point = self.tipping_point(edition_id)
+        root_record = (
+            edition_id,
+            root_action_id,
+            edition_id,
+            root_action_id,
+            tipping_point if tipping_point is not None else 0,
+        )
+
+        # The reachable editions are used in multiple queries. Find them only once.
+        self._connection.execute(
+            "CREATE TEMP TABLE subtree_edition (edition_id INTEGER PRIMARY KEY)"
+        )
+
+        try:
+            self._connection.execute(
+                f"INSERT INTO subtree_edition {_reachable_editions_query}",
+                {"edition_id": edition_id},
+            )
+            action_ids_query = f"""
+                SELECT action_id
+                FROM {_edition_table_name}
+                WHERE edition_id IN (SELECT edition_id FROM subtree_edition)
+            """
+            action_by_id, colour_by_action_name = _read_actions(
+                self._connection,
+                f"""
+                {action_ids_query}
+                UNION
+                SELECT combined_action_id
+                FROM {_action_combination_table_name}
+                WHERE action_id IN ({action_ids_query})
+                """,
+            )
+            sequences, tipping_point_by_action = _read_sequences(
+                itertools.chain(
+                    [root_record],
+                    self._connection.execute(
+                        f"""
+                        {_sequence_records_query}
+                        JOIN subtree_edition
+                            ON subtree_edition.edition_id = sequence.from_edition_id
+                        WHERE sequence.from_edition_id != sequence.to_edition_id
+                        ORDER BY sequence.sequence_id
+                        """
+                    ),
+                ),
+                action_by_id,
+            )
+        finally:
+            self._connection.execute("DROP TABLE temp.subtree_edition")
+
+        return (
+            list(action_by_id.values()),
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+        )
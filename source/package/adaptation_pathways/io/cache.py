@@ -0,0 +1,233 @@
+"""
+This module contains code for caching datasets, and information derived from them, on disk
+
+Reading a large dataset and converting it into graphs takes time. A :py:class:`Cache` stores
+the results in a directory, keyed by a hash of the contents of the files read. As long as these
+files don't change, the results can be loaded from the cache instead of being recalculated.
+"""
+
+import contextlib
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+import typing
+from pathlib import Path
+
+from ..version import __version__
+from . import binary, text
+
+
+# Default maximum total size of the values in a cache, in bytes
+default_max_cache_size = 512 * 2**20
+
+T = typing.TypeVar("T")
+
+
+def dataset_paths(basename_pathname: str) -> list[Path]:
+    """
+    :return: Paths of the files :py:func:`read_dataset` reads the dataset passed in from
+    """
+    if binary.dataset_exists(basename_pathname):
+        return [binary.normalize_database_path(basename_pathname)]
+
+    return [
+        text.format_actions_path(basename_pathname),
+        text.format_sequences_path(basename_pathname),
+    ]
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+
+    try:
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(2**20), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        # Reading the dataset will fail and nothing will be cached
+        digest.update(b"\0missing")
+
+    return digest.digest()
+
+
+def dataset_key(basename_pathname: str, product: str) -> str:
+    """
+    :param basename_pathname: Name of the dataset, as passed to :py:func:`read_dataset`
+    :param product: Name of the information derived from the dataset
+    :return: Key of the information derived from the dataset passed in
+
+    The key is a hash of the contents of the files the dataset is read from, the name of the
+    product and the version of this package. The name and location of the files do not matter.
+    """
+    digest = hashlib.sha256(f"{__version__}\0{product}\0".encode())
+
+    for path in dataset_paths(basename_pathname):
+        digest.update(_file_digest(path))
+
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def _gc_disabled() -> typing.Iterator[None]:
+    # Unpickling graphs creates very many containers, each of which counts towards triggering
+    # a garbage collection. None of them are garbage. Collecting is postponed until done,
+    # which makes loading large graphs multiple times faster.
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class Cache:
+    """
+    Directory containing pickled values, by key
+
+    :param directory_path: Path of the directory. It is created if it does not exist yet.
+    :param max_size: Maximum total size of the cached values, in bytes. When storing a value
+        makes the cache grow beyond this size, the least recently used values are removed.
+
+    Values are pickled using protocol 5. Each value is stored in its own file, whose
+    modification time is updated each time the value is loaded. Multiple processes can use
+    the same cache.
+    """
+
+    _suffix = ".pickle"
+
+    def __init__(
+        self, directory_path: Path | str, *, max_size: int = default_max_cache_size
+    ) -> None:
+        if max_size < 0:
+            raise ValueError(
+                f"Maximum cache size must be zero or positive, not {max_size}"
+            )
+
+        self._directory_path = Path(directory_path)
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self._directory_path / f"{key}{self._suffix}"
+
+    def _paths(self) -> list[Path]:
+        return list(self._directory_path.glob(f"*{self._suffix}"))
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def __len__(self) -> int:
+        return len(self._paths())
+
+    def size(self) -> int:
+        """
+        :return: Total size of the cached values, in bytes
+        """
+        size = 0
+
+        for path in self._paths():
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+
+        return size
+
+    def load(self, key: str) -> typing.Any:
+        """
+        :return: Value stored under the key passed in
+        :raises KeyError: In case no value is stored under the key, or the value cannot be
+            unpickled anymore. In the latter case the value is removed from the cache.
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as file, _gc_disabled():
+                value = pickle.load(file)
+        except FileNotFoundError as exception:
+            raise KeyError(key) from exception
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            # Truncated file, or pickled instances of classes which have changed
+            path.unlink(missing_ok=True)
+            raise KeyError(key) from exception
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Removed by another process in the meantime
+            pass
+
+        return value
+
+    def store(self, key: str, value: typing.Any) -> None:
+        """
+        Store the value passed in under the key passed in, replacing any existing value
+
+        The value is written to a temporary file first, which replaces the existing one when
+        done. Other processes never see a partially written value.
+        """
+        path = self._path(key)
+        file_descriptor, temporary_pathname = tempfile.mkstemp(
+            dir=self._directory_path, suffix=".tmp"
+        )
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file, _gc_disabled():
+                pickle.dump(value, file, protocol=5)
+            os.replace(temporary_pathname, path)
+        except BaseException:
+            Path(temporary_pathname).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def load_or_create(self, key: str, create: typing.Callable[[], T]) -> T:
+        """
+        :return: Value stored under the key passed in. In case no value is stored yet, it is
+            created by calling *create*, and stored.
+        """
+        try:
+            return self.load(key)
+        except KeyError:
+            pass
+
+        # Called outside the except clause, so errors raised are not chained to the KeyError
+        value = create()
+        self.store(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove all values
+        """
+        for path in self._paths():
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used values until the total size is within the maximum size
+        """
+        entries = []
+
+        for path in self._paths():
+            try:
+                status = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((status.st_mtime_ns, status.st_size, path))
+
+        entries.sort()
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self._max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            size -= entry_size
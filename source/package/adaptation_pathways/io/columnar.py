@@ -0,0 +1,338 @@
+"""
+This module contains code for reading and writing information about adaptation pathways as
+columns of typed values
+
+A columnar dataset is a directory containing one NumPy ``.npy`` file per column. The columns
+follow the tables of the binary format: actions, editions of actions, sequences of editions and
+their tipping points. Columns are memory-mapped when read, so analyses can use the arrays
+without creating Python objects per action or per sequence.
+"""
+
+import dataclasses
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from ..action import Action
+from ..action_combination import ActionCombination
+from ..alias import Actions, Sequences, TippingPointByAction
+from ..plot.alias import ColourByActionName
+from . import binary
+
+
+default_dataset_path_suffix = ".apc"
+
+_column_names = (
+    "action_name",
+    "action_colour",
+    "combination_action_id",
+    "combination_combined_action_id",
+    "edition_action_id",
+    "sequence_from_edition_id",
+    "sequence_to_edition_id",
+    "sequence_tipping_point",
+)
+
+
+@dataclasses.dataclass
+class ColumnarDataset:
+    """
+    Information about adaptation pathways, stored as arrays
+
+    :param action_name: Per action its name. The ID of an action is its index.
+    :param action_colour: Per action its RGBA colour, as an array of shape (nr_actions, 4)
+    :param combination_action_id: Per combined action the ID of the action combination
+    :param combination_combined_action_id: Per combined action its ID
+    :param edition_action_id: Per edition the ID of its action. The ID of an edition is its
+        index.
+    :param sequence_from_edition_id: Per sequence the ID of the edition of the from-action
+    :param sequence_to_edition_id: Per sequence the ID of the edition of the to-action
+    :param sequence_tipping_point: Per sequence the tipping point of the to-action
+
+    Like in the binary format, the first sequence relates the root action with itself. Each
+    edition in a sequence is the to-edition of exactly one sequence.
+    """
+
+    action_name: np.ndarray
+    action_colour: np.ndarray
+    combination_action_id: np.ndarray
+    combination_combined_action_id: np.ndarray
+    edition_action_id: np.ndarray
+    sequence_from_edition_id: np.ndarray
+    sequence_to_edition_id: np.ndarray
+    sequence_tipping_point: np.ndarray
+
+    @property
+    def nr_actions(self) -> int:
+        return len(self.action_name)
+
+    @property
+    def nr_editions(self) -> int:
+        return len(self.edition_action_id)
+
+    @property
+    def nr_sequences(self) -> int:
+        """
+        :return: Number of sequences, excluding the one relating the root action with itself
+        """
+        return max(len(self.sequence_from_edition_id) - 1, 0)
+
+    def edition_tipping_point(self) -> np.ndarray:
+        """
+        :return: Per edition its tipping point. Editions which are not part of a sequence, like
+            the ones of actions combined by an action combination, have no tipping point (NaN).
+        """
+        tipping_points = np.full(self.nr_editions, np.nan, dtype=np.float64)
+        tipping_points[self.sequence_to_edition_id] = self.sequence_tipping_point
+
+        return tipping_points
+
+    def tipping_point_violations(self) -> np.ndarray:
+        """
+        :return: Indices of the sequences whose tipping point is not larger than the one of the
+            sequence they continue
+
+        This is the columnar equivalent of :py:func:`tipping_point_violations
+        <adaptation_pathways.graph.tipping_point_violations>`. All sequences are checked at
+        once.
+        """
+        from_tipping_points = self.edition_tipping_point()[
+            self.sequence_from_edition_id[1:]
+        ]
+
+        return (
+            np.flatnonzero(~(from_tipping_points < self.sequence_tipping_point[1:])) + 1
+        )
+
+
+def normalize_dataset_path(dataset_path: Path | str) -> Path:
+    """
+    Perform a number of updates to the path passed in
+
+    - If the type is string, convert it to a :class:`pathlib.Path`
+    - If the path does not already have a suffix, add the default one
+    """
+    if isinstance(dataset_path, str):
+        dataset_path = Path(dataset_path)
+
+    # Only add the default suffix if the path doesn't already have one
+    if len(dataset_path.suffix) == 0:
+        dataset_path = dataset_path.with_suffix(default_dataset_path_suffix)
+
+    return dataset_path
+
+
+def dataset_exists(dataset_path: Path | str) -> bool:
+    """
+    Return whether the dataset already exists
+    """
+    return normalize_dataset_path(dataset_path).is_dir()
+
+
+def to_columns(
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
+) -> ColumnarDataset:
+    """
+    Convert the information passed in to columns
+
+    Actions, editions and sequences are numbered the same way as in the binary format.
+    """
+    # pylint: disable=protected-access
+    action_id_by_name = {
+        action.name: action_id for action_id, action in enumerate(actions)
+    }
+    edition_id_by_instance = binary._edition_id_by_instance(sequences)
+    sequence_edition_ids = [
+        (edition_id_by_instance[sequence[0]], edition_id_by_instance[sequence[1]])
+        for sequence in sequences
+    ]
+    sequence_tipping_points = [
+        tipping_point_by_action[sequence[1]] for sequence in sequences
+    ]
+    root_action = binary._root_action(sequences, tipping_point_by_action)
+
+    if root_action is not None:
+        root_edition_id = edition_id_by_instance[root_action]
+        sequence_edition_ids.insert(0, (root_edition_id, root_edition_id))
+        sequence_tipping_points.insert(0, tipping_point_by_action[root_action])
+
+    combinations = [
+        (action_id_by_name[action.name], action_id_by_name[combined_action.name])
+        for action in actions
+        if isinstance(action, ActionCombination)
+        for combined_action in action.actions
+    ]
+
+    return ColumnarDataset(
+        action_name=np.array([action.name for action in actions], dtype=np.str_),
+        action_colour=np.array(
+            [colour_by_action_name[action.name] for action in actions],
+            dtype=np.float64,
+        ).reshape(-1, 4),
+        combination_action_id=np.array(
+            [combination[0] for combination in combinations], dtype=np.int32
+        ),
+        combination_combined_action_id=np.array(
+            [combination[1] for combination in combinations], dtype=np.int32
+        ),
+        edition_action_id=np.fromiter(
+            (action_id_by_name[action.name] for action in edition_id_by_instance),
+            dtype=np.int32,
+            count=len(edition_id_by_instance),
+        ),
+        sequence_from_edition_id=np.array(
+            [edition_ids[0] for edition_ids in sequence_edition_ids], dtype=np.int32
+        ),
+        sequence_to_edition_id=np.array(
+            [edition_ids[1] for edition_ids in sequence_edition_ids], dtype=np.int32
+        ),
+        sequence_tipping_point=np.array(sequence_tipping_points, dtype=np.float64),
+    )
+
+
+def from_columns(
+    columns: ColumnarDataset,
+) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+    """
+    Convert the columns passed in to actions, sequences, tipping points and colours, in the
+    format returned by :py:func:`binary.read_dataset`
+    """
+    action_by_id: dict[int, Action] = {
+        action_id: Action(name)
+        for action_id, name in enumerate(columns.action_name.tolist())
+    }
+    colour_by_action_name: ColourByActionName = {
+        action.name: tuple(colour)  # type: ignore
+        for action, colour in zip(action_by_id.values(), columns.action_colour.tolist())
+    }
+
+    combined_action_ids_by_action_id: dict[int, list[int]] = {}
+
+    for action_id, combined_action_id in zip(
+        columns.combination_action_id.tolist(),
+        columns.combination_combined_action_id.tolist(),
+    ):
+        combined_action_ids_by_action_id.setdefault(action_id, []).append(
+            combined_action_id
+        )
+
+    for action_id, combined_action_ids in combined_action_ids_by_action_id.items():
+        action_by_id[action_id] = ActionCombination(
+            action_by_id[action_id].name,
+            [
+                action_by_id[combined_action_id]
+                for combined_action_id in combined_action_ids
+            ],
+        )
+
+    edition_action_id = columns.edition_action_id.tolist()
+
+    # pylint: disable-next=protected-access
+    sequences, tipping_point_by_action = binary._read_sequences(
+        (
+            (
+                from_edition_id,
+                edition_action_id[from_edition_id],
+                to_edition_id,
+                edition_action_id[to_edition_id],
+                tipping_point,
+            )
+            for from_edition_id, to_edition_id, tipping_point in zip(
+                columns.sequence_from_edition_id.tolist(),
+                columns.sequence_to_edition_id.tolist(),
+                columns.sequence_tipping_point.tolist(),
+            )
+        ),
+        action_by_id,
+    )
+
+    return (
+        list(action_by_id.values()),
+        sequences,
+        tipping_point_by_action,
+        colour_by_action_name,
+    )
+
+
+def write_columns(
+    columns: ColumnarDataset, dataset_path: Path | str, *, overwrite: bool = True
+) -> None:
+    """
+    Save the columns passed in to the dataset
+
+    :param overwrite: Whether to overwrite an existing dataset
+    """
+    dataset_path = normalize_dataset_path(dataset_path)
+
+    if dataset_path.exists():
+        if not overwrite:
+            raise RuntimeError(f"Dataset {dataset_path} already exists")
+
+        shutil.rmtree(dataset_path)
+
+    dataset_path.mkdir(parents=True)
+
+    for name in _column_names:
+        np.save(dataset_path / f"{name}.npy", getattr(columns, name))
+
+
+def read_columns(dataset_path: Path | str, *, mmap: bool = True) -> ColumnarDataset:
+    """
+    Open the dataset and return the columns
+
+    :param mmap: Whether to memory-map the files instead of reading them. Memory-mapped
+        columns are read-only. Their contents are read from the files when accessed.
+    :raises RuntimeError: In case the dataset does not exist
+    """
+    dataset_path = normalize_dataset_path(dataset_path)
+
+    if not dataset_path.is_dir():
+        raise RuntimeError(f"Dataset {dataset_path} does not exist")
+
+    return ColumnarDataset(
+        **{
+            name: np.load(dataset_path / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in _column_names
+        }
+    )
+
+
+def write_dataset(  # pylint: disable=too-many-arguments
+    actions: Actions,
+    sequences: Sequences,
+    tipping_point_by_action: TippingPointByAction,
+    colour_by_action_name: ColourByActionName,
+    dataset_path: Path | str,
+    *,
+    overwrite: bool = True,
+) -> None:
+    """
+    Save the information passed in to the dataset
+
+    :param overwrite: Whether to overwrite an existing dataset
+    """
+    assert len(colour_by_action_name) == len(
+        actions
+    ), f"{colour_by_action_name} ↔ {actions}"
+
+    write_columns(
+        to_columns(actions, sequences, tipping_point_by_action, colour_by_action_name),
+        dataset_path,
+        overwrite=overwrite,
+    )
+
+
+def read_dataset(
+    dataset_path: Path | str,
+) -> tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]:
+    """
+    Open the dataset and return the contents
+
+    The result is the same as the one returned by :py:func:`binary.read_dataset` for the same
+    information.
+    """
+    return from_columns(read_columns(dataset_path))
@@ -0,0 +1,314 @@
+"""
+This module contains code for storing collections of named binary formatted datasets
+
+Two kinds of stores are supported: a directory containing one binary formatted file per dataset,
+and a single SQLite file containing all datasets. Reading and writing many datasets at once
+is cheaper than calling :py:func:`binary.read_dataset` or :py:func:`binary.write_dataset` for
+each of them, because connections are reused.
+"""
+
+import abc
+import collections
+import sqlite3
+import typing
+from pathlib import Path
+
+from ..alias import Actions, Sequences, TippingPointByAction
+from ..plot.alias import ColourByActionName
+from . import binary
+
+
+Dataset = tuple[Actions, Sequences, TippingPointByAction, ColourByActionName]
+
+
+class ConnectionPool:
+    """
+    Collection of read-only connections to SQLite databases, which are reused
+
+    :param max_nr_connections: Maximum number of connections to keep open. When more
+        connections are needed, the least recently used one is closed.
+    """
+
+    def __init__(self, max_nr_connections: int = 8) -> None:
+        if max_nr_connections <= 0:
+            raise ValueError(
+                f"Maximum number of connections must be positive, not {max_nr_connections}"
+            )
+
+        self._max_nr_connections = max_nr_connections
+        self._connection_by_path: collections.OrderedDict[Path, sqlite3.Connection] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._connection_by_path)
+
+    def connection(self, path: Path) -> sqlite3.Connection:
+        """
+        :return: Read-only connection to the database passed in
+        """
+        connection = self._connection_by_path.get(path)
+
+        if connection is None:
+            connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            self._connection_by_path[path] = connection
+
+            if len(self._connection_by_path) > self._max_nr_connections:
+                self._connection_by_path.popitem(last=False)[1].close()
+        else:
+            self._connection_by_path.move_to_end(path)
+
+        return connection
+
+    def discard(self, path: Path) -> None:
+        """
+        Close the connection to the database passed in, if it is open
+
+        Call this function before changing or removing the database.
+        """
+        connection = self._connection_by_path.pop(path, None)
+
+        if connection is not None:
+            connection.close()
+
+    def close(self) -> None:
+        """
+        Close all connections
+        """
+        for connection in self._connection_by_path.values():
+            connection.close()
+
+        self._connection_by_path.clear()
+
+
+class DatasetStore(abc.ABC):
+    """
+    Base class for collections of named binary formatted datasets
+
+    Stores can be used as context managers. The connections they use are closed when the
+    ``with`` block ends.
+    """
+
+    def __enter__(self) -> "DatasetStore":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Close the connections used by the store
+        """
+
+    @abc.abstractmethod
+    def names(self) -> list[str]:
+        """
+        :return: Sorted names of the datasets in the store
+        """
+
+    @abc.abstractmethod
+    def read_many(self, names: typing.Iterable[str]) -> dict[str, Dataset]:
+        """
+        :return: Contents of the datasets passed in, by name. Each dataset is returned in the
+            format returned by :py:func:`binary.read_dataset`.
+        :raises RuntimeError: In case a dataset does not exist
+        """
+
+    @abc.abstractmethod
+    def write_many(self, dataset_by_name: dict[str, Dataset]) -> None:
+        """
+        Write the datasets passed in, overwriting existing datasets with the same name
+
+        :param dataset_by_name: Contents of the datasets to write, by name. Each dataset must
+            be passed in in the format returned by :py:func:`binary.read_dataset`.
+        """
+
+    def read(self, name: str) -> Dataset:
+        """
+        :return: Contents of the dataset passed in
+        :raises RuntimeError: In case the dataset does not exist
+        """
+        return self.read_many([name])[name]
+
+    def write(self, name: str, dataset: Dataset) -> None:
+        """
+        Write the dataset passed in, overwriting an existing dataset with the same name
+        """
+        self.write_many({name: dataset})
+
+
+class DirectoryStore(DatasetStore):
+    """
+    Store containing one binary formatted file per dataset, in a directory
+
+    :param directory_path: Path of the directory. It is created if it does not exist yet.
+    :param max_nr_connections: Maximum number of read-only connections to keep open, see
+        :py:class:`ConnectionPool`
+
+    The name of a dataset is the name of its file, without the suffix. The files can be used
+    with all code supporting binary formatted files.
+    """
+
+    def __init__(self, directory_path: Path | str, max_nr_connections: int = 8) -> None:
+        self._directory_path = Path(directory_path)
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(max_nr_connections)
+
+    def _path(self, name: str) -> Path:
+        if len(name) == 0 or Path(name).name != name:
+            raise ValueError(f"Dataset name {name!r} cannot be used as a file name")
+
+        return self._directory_path / f"{name}{binary.default_database_path_suffix}"
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            return self._path(name).exists()
+        except ValueError:
+            # Names which cannot be used as a file name are never stored
+            return False
+
+    def names(self) -> list[str]:
+        return sorted(
+            path.stem
+            for path in self._directory_path.glob(
+                f"*{binary.default_database_path_suffix}"
+            )
+        )
+
+    def read_many(self, names: typing.Iterable[str]) -> dict[str, Dataset]:
+        dataset_by_name: dict[str, Dataset] = {}
+
+        for name in names:
+            path = self._path(name)
+
+            if not path.exists():
+                raise RuntimeError(f"Dataset {name} does not exist")
+
+            # pylint: disable-next=protected-access
+            dataset_by_name[name] = binary._read_dataset(self._pool.connection(path))
+
+        return dataset_by_name
+
+    def write_many(self, dataset_by_name: dict[str, Dataset]) -> None:
+        for name, (
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+        ) in dataset_by_name.items():
+            path = self._path(name)
+            self._pool.discard(path)
+            binary.write_dataset(
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+                path,
+            )
+
+
+class FileStore(DatasetStore):
+    """
+    Store containing all datasets in a single SQLite file
+
+    :param database_path: Path of the file. It is created if it does not exist yet.
+
+    Each dataset is stored as a serialized binary formatted database, in a table with one
+    record per dataset. Reading and writing many datasets is done using a single connection
+    and, in case of writing, a single transaction.
+    """
+
+    _table_name = "dataset"
+
+    # Maximum number of names to pass into a single query
+    _max_nr_names = 500
+
+    def __init__(self, database_path: Path | str) -> None:
+        self._connection = sqlite3.connect(database_path)
+
+        with self._connection:
+            self._connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self._table_name}
+                (
+                    name TEXT NOT NULL,
+                    content BLOB NOT NULL,
+
+                    PRIMARY KEY (name)
+                )
+                """
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __contains__(self, name: str) -> bool:
+        return (
+            self._connection.execute(
+                f"SELECT 1 FROM {self._table_name} WHERE name = ?", (name,)
+            ).fetchone()
+            is not None
+        )
+
+    def names(self) -> list[str]:
+        return [
+            name
+            for (name,) in self._connection.execute(
+                f"SELECT name FROM {self._table_name} ORDER BY name"
+            )
+        ]
+
+    def read_many(self, names: typing.Iterable[str]) -> dict[str, Dataset]:
+        names = list(dict.fromkeys(names))
+        dataset_by_name: dict[str, Dataset] = {}
+
+        for idx in range(0, len(names), self._max_nr_names):
+            names_ = names[idx : idx + self._max_nr_names]
+
+            for name, content in self._connection.execute(
+                f"""
+                SELECT name, content
+                FROM {self._table_name}
+                WHERE name IN ({", ".join("?" * len(names_))})
+                """,
+                names_,
+            ):
+                connection = sqlite3.connect(":memory:")
+                connection.deserialize(content)
+                # pylint: disable-next=protected-access
+                dataset_by_name[name] = binary._read_dataset(connection)
+                connection.close()
+
+        for name in names:
+            if name not in dataset_by_name:
+                raise RuntimeError(f"Dataset {name} does not exist")
+
+        # Return the datasets in the order requested
+        return {name: dataset_by_name[name] for name in names}
+
+    def write_many(self, dataset_by_name: dict[str, Dataset]) -> None:
+        def records() -> typing.Iterator[tuple[str, bytes]]:
+            for name, dataset in dataset_by_name.items():
+                connection = sqlite3.connect(":memory:")
+                # pylint: disable-next=protected-access
+                binary._write_dataset(connection, *dataset)
+                content = connection.serialize()
+                connection.close()
+
+                yield name, content
+
+        with self._connection:
+            self._connection.executemany(
+                f"""
+                INSERT OR REPLACE INTO {self._table_name} (name, content)
+                VALUES (?, ?)
+                """,
+                records(),
+            )
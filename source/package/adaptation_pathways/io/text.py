@@ -17,8 +17,11 @@ and to-action are the same.
 """
 
 import copy
+import gzip
 import io
+import lzma
 import re
+import typing
 from pathlib import Path
 
 from ..action import Action
@@ -32,19 +35,62 @@ edition_pattern = r"\d+"
 action_name_pattern = r"\w+"
 
 
+# Functions for opening a file or binary stream as a text stream, by the magic bytes at the start
+# of compressed contents
+_open_by_magic: dict[bytes, typing.Callable[..., typing.Any]] = {
+    b"\x1f\x8b": gzip.open,
+    b"\xfd7zXZ\x00": lzma.open,
+}
+_magic_size = max(len(magic) for magic in _open_by_magic)
+
+
+def _open_compressed(
+    pathname: str | Path | typing.BinaryIO, magic: bytes
+) -> io.IOBase | None:
+    for magic_, open_ in _open_by_magic.items():
+        if magic.startswith(magic_):
+            return open_(pathname, "rt", encoding="utf-8")
+
+    return None
+
+
 def _open_stream(pathname: str | Path | io.IOBase) -> io.IOBase:
     """
     Return a stream corresponding to the instance passed in
 
     If a pathname is passed in, then the file is opened and the result returned. In all other
-    cases, it is assumed that a stream was passed in, which is returned unchanged.
+    cases, it is assumed that a stream was passed in. Text streams are returned unchanged.
+
+    Files and binary streams compressed using gzip or xz are decompressed while reading. The
+    compression is detected by the first bytes of the contents, not by the file name extension.
     """
-    stream: io.IOBase
+    stream: io.IOBase | None
 
     if isinstance(pathname, (str, Path)):
-        stream = open(pathname, encoding="utf-8")  # pylint: disable=consider-using-with
-    else:
+        with open(pathname, "rb") as file:
+            magic = file.read(_magic_size)
+
+        stream = _open_compressed(pathname, magic)
+
+        if stream is None:
+            # pylint: disable-next=consider-using-with
+            stream = typing.cast(io.IOBase, open(pathname, encoding="utf-8"))
+    elif isinstance(pathname, io.TextIOBase):
         stream = pathname
+    else:
+        binary_stream = typing.cast(typing.BinaryIO, pathname)
+
+        if hasattr(binary_stream, "peek"):
+            magic = binary_stream.peek(_magic_size)[:_magic_size]
+        else:
+            position = binary_stream.tell()
+            magic = binary_stream.read(_magic_size)
+            binary_stream.seek(position)
+
+        stream = _open_compressed(binary_stream, magic)
+
+        if stream is None:
+            stream = io.TextIOWrapper(binary_stream, encoding="utf-8")
 
     return stream
 
@@ -68,28 +114,35 @@ def _strip_line(line: bytes) -> str:
     return str(line).split("# ", 1)[0].strip()
 
 
-def _parse_action(line: str, action_by_name: dict[str, Action]) -> tuple[Action, str]:
-    # TODO Allow any number of actions to be combined(?)
-    action_pattern = (
-        rf"(?P<action_name>{action_name_pattern})"
-        rf"(\(\s*(?P<action1_name>{action_name_pattern})\s*&\s*"
-        rf"(?P<action2_name>{action_name_pattern})\s*\))?"
-    )
-
-    argb_hex_pattern = r"#[a-fA-F0-9]{8}"
-    colour_pattern = rf"(?P<colour>{argb_hex_pattern})"
+# Patterns are compiled once, instead of once per line parsed
+_action_regex = re.compile(
+    rf"(?P<action_name>{action_name_pattern})"
+    rf"(\(\s*(?P<action1_name>{action_name_pattern})\s*&\s*"
+    rf"(?P<action2_name>{action_name_pattern})\s*\))?"
+    r"(\s+(?P<colour>#[a-fA-F0-9]{8}))?"
+)
+_sequence_regex = re.compile(
+    rf"(?P<from_action_name>{action_name_pattern})"
+    rf"(\[(?P<from_edition>{edition_pattern})\])?"
+    rf"\s+(?P<to_action_name>{action_name_pattern})"
+    rf"(\[(?P<to_edition>{edition_pattern})\])?"
+    r"(\s+(?P<tipping_point>\d+))?"
+)
 
-    pattern = rf"{action_pattern}(\s+{colour_pattern})?"
 
-    match = re.fullmatch(pattern, line)
+def _parse_action(line: str, action_by_name: dict[str, Action]) -> tuple[Action, str]:
+    # TODO Allow any number of actions to be combined(?)
+    match = _action_regex.fullmatch(line)
 
     if match is None:
         raise ValueError(f"Cannot parse action: {line}")
 
-    action_name = match.group("action_name")
-    action1_name = match.group("action1_name") or ""
-    action2_name = match.group("action2_name") or ""
-    colour = match.group("colour") or ""
+    action_name, action1_name, action2_name, colour = match.group(
+        "action_name", "action1_name", "action2_name", "colour"
+    )
+    action1_name = action1_name or ""
+    action2_name = action2_name or ""
+    colour = colour or ""
 
     assert (action1_name == "" and action2_name == "") or (
         action1_name != "" and action2_name != ""
@@ -155,97 +208,116 @@ def read_actions(
     return actions, colour_by_action_name
 
 
-# pylint: disable-next=too-many-locals
+def _action_by_name(actions: Actions) -> dict[str, Action | None]:
+    # Index actions by name. Names occurring more than once are mapped to None, so they can be
+    # reported when used in a sequence.
+    action_by_name: dict[str, Action | None] = {}
+
+    for action in actions:
+        action_by_name[action.name] = None if action.name in action_by_name else action
+
+    return action_by_name
+
+
 def _parse_sequence(
     line: str,
-    actions: Actions,
+    action_by_name: dict[str, Action | None],
     action_by_name_and_edition: dict[tuple[str, int], Action],
 ) -> tuple[Sequence, TippingPoint]:
 
-    def action_by_name(name: str) -> Action:
-        # Find action instance corresponding with the name. Should be only one of these.
-        actions_by_name = [action for action in actions if action.name == name]
+    def action_by_name_and_edition_(name: str, edition: int) -> Action:
+        action = action_by_name_and_edition.get((name, edition))
 
-        if len(actions_by_name) != 1:
-            raise ValueError(
-                f"Action {name} from sequence must occur exactly one in the  collection of actions"
-            )
+        if action is None:
+            # Find action instance corresponding with the name. Should be only one of these.
+            action = action_by_name.get(name)
 
-        return actions_by_name[0]
+            if action is None:
+                raise ValueError(
+                    f"Action {name} from sequence must occur exactly one in the  collection of "
+                    "actions"
+                )
 
-    def conditionally_add_node(name: str, edition: int):
-        if (name, edition) not in action_by_name_and_edition:
             # Shallow copy of the corresponding action instance in the actions collection. The
             # action instance will be new, which is what we want. Any layered
             # action instances (in case of an action combination) will be copied by
             # reference. Their identity thus corresponds with the instances in the actions
             # collection. This implies that code should not depend on the identity of the
             # combined actions, but on their name.
-            action_by_name_and_edition[(name, edition)] = copy.copy(
-                action_by_name(name)
-            )
+            action = copy.copy(action)
+            action_by_name_and_edition[(name, edition)] = action
 
-    from_action_pattern = (
-        rf"(?P<from_action_name>{action_name_pattern})"
-        rf"(\[(?P<from_edition>{edition_pattern})\])?"
-    )
-    to_action_pattern = (
-        rf"(?P<to_action_name>{action_name_pattern})"
-        rf"(\[(?P<to_edition>{edition_pattern})\])?"
-    )
-    tipping_point_pattern = r"(?P<tipping_point>\d+)"
-    pattern = (
-        rf"{from_action_pattern}\s+{to_action_pattern}(\s+{tipping_point_pattern})?"
-    )
+        return action
 
-    match = re.fullmatch(pattern, line)
+    match = _sequence_regex.fullmatch(line)
 
     if match is None:
         raise ValueError(f"Cannot parse sequence: {line}")
 
-    from_action_name = match.group("from_action_name")
-    from_edition = (
-        int(match.group("from_edition"))
-        if match.group("from_edition") is not None
-        else 0
+    (
+        from_action_name,
+        from_edition,
+        to_action_name,
+        to_edition,
+        tipping_point,
+    ) = match.group(
+        "from_action_name",
+        "from_edition",
+        "to_action_name",
+        "to_edition",
+        "tipping_point",
     )
-    conditionally_add_node(from_action_name, from_edition)
 
-    to_action_name = match.group("to_action_name")
-    to_edition = (
-        int(match.group("to_edition")) if match.group("to_edition") is not None else 0
+    from_action = action_by_name_and_edition_(
+        from_action_name, int(from_edition) if from_edition is not None else 0
     )
-    conditionally_add_node(to_action_name, to_edition)
-
-    tipping_point = (
-        int(match.group("tipping_point"))
-        if match.group("tipping_point") is not None
-        else 0
+    to_action = action_by_name_and_edition_(
+        to_action_name, int(to_edition) if to_edition is not None else 0
     )
 
-    from_action = action_by_name_and_edition[(from_action_name, from_edition)]
-    to_action = action_by_name_and_edition[(to_action_name, to_edition)]
-
-    return (from_action, to_action), tipping_point
+    return (from_action, to_action), (
+        int(tipping_point) if tipping_point is not None else 0
+    )
 
 
-def read_sequences(
+def iter_sequences(
     sequences_path: Path | io.IOBase,
     actions: Actions,
-) -> tuple[Sequences, TippingPointByAction]:
+    *,
+    batch_size: int = 10000,
+) -> typing.Iterator[tuple[Sequences, TippingPointByAction]]:
     """
-    Read sequences of actions and an optional tipping point from a stream and return the
-    information read
-
-    :raises ValueError: In case the contents are inconsistent
+    Read sequences of actions and an optional tipping point from a stream, and yield the
+    information read in batches
+
+    :param batch_size: Maximum number of lines to parse per batch
+    :raises ValueError: In case the contents are inconsistent. Batches read before the
+        inconsistency was found will already have been yielded.
+
+    Each batch contains the sequences read, and the tipping points of their to-actions. The
+    root sequence, relating the root action with itself, is not part of the sequences, but its
+    tipping point is. Only a single batch is kept in memory. Use this function instead of
+    :py:func:`read_sequences` for reading very large files, for example in combination with
+    :py:meth:`adaptation_pathways.graph.SequenceGraph.add_sequence_batches`. Compressed files
+    are supported, see :py:func:`_open_stream`.
     """
+    if batch_size <= 0:
+        raise ValueError(f"Batch size must be positive, not {batch_size}")
+
     stream = _open_stream(sequences_path)
-    sequences: Sequences = []
-    tipping_point_by_action: TippingPointByAction = {}
+    action_by_name = _action_by_name(actions)
     action_by_name_and_edition: dict[tuple[str, int], Action] = {}
 
+    # Tipping points of all to-actions read until now, for detecting actions with multiple
+    # tipping points
+    all_tipping_point_by_action: TippingPointByAction = {}
+
     with stream:
         root_action_seen = False
+        nr_sequences = 0
+        sequences: Sequences = []
+        tipping_point_by_action: TippingPointByAction = {}
+        nr_lines = 0
 
         for line in stream:
             line_as_string = _strip_line(line)
@@ -254,7 +326,7 @@ def read_sequences(
             if len(line_as_string) > 0:
                 sequence, tipping_point = _parse_sequence(
                     line_as_string,
-                    actions,
+                    action_by_name,
                     action_by_name_and_edition,
                 )
 
@@ -263,25 +335,59 @@ def read_sequences(
                 else:
                     sequences.append(sequence)
 
-                if sequence[1] in tipping_point_by_action:
+                if sequence[1] in all_tipping_point_by_action:
                     raise ValueError(
                         f"Found tipping point {tipping_point} "
                         f"for action {sequence[1]}, which already has "
-                        f"tipping point {tipping_point_by_action[sequence[1]]}. "
+                        f"tipping point {all_tipping_point_by_action[sequence[1]]}. "
                         "Actions must be associated with exactly one tipping point. "
                         f"Action editions ({sequence[1]}[1], {sequence[1]}[2]) can be used for "
                         "multiple occurrences of the same action."
                     )
 
+                all_tipping_point_by_action[sequence[1]] = tipping_point
                 tipping_point_by_action[sequence[1]] = tipping_point
+                nr_lines += 1
+
+                if nr_lines == batch_size:
+                    nr_sequences += len(sequences)
+                    yield sequences, tipping_point_by_action
+                    sequences = []
+                    tipping_point_by_action = {}
+                    nr_lines = 0
 
-        if len(sequences) > 0 and not root_action_seen:
+        nr_sequences += len(sequences)
+
+        if nr_sequences > 0 and not root_action_seen:
             raise ValueError(
                 "Exactly one sequence must relate the root / current action with itself. "
                 "This allows a tipping point to be defined for the graph's first action. "
                 "Such a sequence is not present in the file."
             )
 
+        if nr_lines > 0:
+            yield sequences, tipping_point_by_action
+
+
+def read_sequences(
+    sequences_path: Path | io.IOBase,
+    actions: Actions,
+) -> tuple[Sequences, TippingPointByAction]:
+    """
+    Read sequences of actions and an optional tipping point from a stream and return the
+    information read
+
+    :raises ValueError: In case the contents are inconsistent
+
+    See :py:func:`iter_sequences`.
+    """
+    sequences: Sequences = []
+    tipping_point_by_action: TippingPointByAction = {}
+
+    for sequences_, tipping_point_by_action_ in iter_sequences(sequences_path, actions):
+        sequences += sequences_
+        tipping_point_by_action.update(tipping_point_by_action_)
+
     return sequences, tipping_point_by_action
 
 
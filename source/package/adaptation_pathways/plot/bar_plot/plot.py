@@ -2,6 +2,7 @@ import typing
 
 import matplotlib.lines as mlines
 
+from ...action import Action
 from ...alias import TippingPointByAction
 from ...graph import PathwayMap, tipping_point_range
 from ...graph.node import ActionEnd
@@ -43,18 +44,14 @@ def _configure_x_axes(
 
 def _configure_y_axes(
     axes,
-    paths: list[list[typing.Any]],
+    leaf_actions: list[Action],
     *,
     # label_by_pathway,
     marker_by_pathway: MarkerByPathway,
     marker_style: MarkerStyle,
 ):
-    leaf_action_ends = [path[-1] for path in paths]
-    assert all(isinstance(action_end, ActionEnd) for action_end in leaf_action_ends)
-    leaf_actions = [action_end.action for action_end in leaf_action_ends]
-
     # labels = [label_by_pathway[action] for action in leaf_actions]
-    y_coordinates = list(range(len(paths)))
+    y_coordinates = list(range(len(leaf_actions)))
     axes.set_yticks(y_coordinates, labels="")
 
     markers = [marker_by_pathway.get(action, None) for action in leaf_actions]
@@ -123,7 +120,7 @@ def _configure_legend(
 
 def _plot_annotations(
     axes,
-    paths: list[list[typing.Any]],
+    leaf_actions: list[Action],
     action_names: set[str],
     *,
     colour_by_action_name,
@@ -140,7 +137,7 @@ def _plot_annotations(
     configure_title(axes, title=title)
     _configure_y_axes(
         axes,
-        paths,  # label_by_pathway=label_by_pathway,
+        leaf_actions,  # label_by_pathway=label_by_pathway,
         marker_by_pathway=marker_by_pathway,
         marker_style=marker_style,
     )
@@ -233,9 +230,22 @@ def plot_bars(
             "markersize": 10,
         }
 
-    paths = pathway_map.all_paths()
+    # Pathways are plotted in order of the level of the action instance of their leaf node,
+    # one bar per path. Distinct paths can end in the same action instance, so bars are
+    # positioned by the index of the path. Only the leaf actions are kept in memory, the paths
+    # themselves are iterated over lazily, in the same order each time.
+    leaf_actions = []
+
+    for path in pathway_map.iter_paths():
+        assert isinstance(path[-1], ActionEnd)
+        leaf_actions.append(path[-1].action)
 
-    paths.sort(key=lambda path: level_by_pathway[path[-1].action])
+    path_idxs = sorted(
+        range(len(leaf_actions)),
+        key=lambda path_idx: level_by_pathway[leaf_actions[path_idx]],
+    )
+    y_by_path_idx = {path_idx: y for y, path_idx in enumerate(path_idxs)}
+    leaf_actions = [leaf_actions[path_idx] for path_idx in path_idxs]
 
     bar_height = 0.8 if not stack_bars else 1.0
 
@@ -249,8 +259,8 @@ def plot_bars(
     tipping_point_range_ = max_tipping_point - min_tipping_point
     assert tipping_point_range_ >= 0
 
-    for idx, path in enumerate(paths):
-        y = idx
+    for path_idx, path in enumerate(pathway_map.iter_paths()):
+        y = y_by_path_idx[path_idx]
         action_ends = list(path[1::2])
 
         x = [tipping_point_by_action[action_end.action] for action_end in action_ends]
@@ -278,7 +288,7 @@ def plot_bars(
     action_names = {action.name for action in pathway_map.actions()}
     _plot_annotations(
         axes,
-        paths,
+        leaf_actions,
         action_names,
         colour_by_action_name=colour_by_action_name,
         # label_by_pathway=label_by_pathway,
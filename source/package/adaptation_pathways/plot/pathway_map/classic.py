@@ -39,7 +39,7 @@ def _plot_action_lines(
     tipping_point_overshoot,
 ) -> mpl.collections.LineCollection:
 
-    edge_nodes = list(pathway_map.graph.edges())
+    edge_nodes = list(pathway_map._graph.edges)
     edge_collection = mpl.collections.LineCollection([])
 
     if len(edge_nodes) > 0:
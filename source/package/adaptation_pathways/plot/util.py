@@ -213,7 +213,7 @@ def action_level_by_first_occurrence(pathway_map: PathwayMap) -> LevelByActionNa
     # - 2. Within a pathway, earlier actions must have a lower level
     # → Factor 1 is more important that factor 2
 
-    for path_idx, path in enumerate(pathway_map.all_paths()):
+    for path_idx, path in enumerate(pathway_map.iter_paths()):
         for action_begin_idx in range(0, len(path), 2):
             action_begin = path[action_begin_idx]
             action = action_begin.action
@@ -7,8 +7,15 @@ setTimeout(function () {
                 case "open_project":
                     openFile();
                     break;
-                case "save_project":
-                    saveFile(msgObj.content, msgObj.filename);
+                case "save_project_begin":
+                    save_chunks = [];
+                    break;
+                case "save_project_chunk":
+                    save_chunks.push(base64ToBytes(msgObj.content));
+                    break;
+                case "save_project_end":
+                    saveFile(save_chunks, msgObj.filename).catch(console.error);
+                    save_chunks = [];
                     break;
                 default:
                     oldMessageHandler(message);
@@ -21,40 +28,74 @@ setTimeout(function () {
     };
 });
 
+// Projects are passed between the browser and Python compressed (deflate, zlib format),
+// base64-encoded and in chunks. Project files themselves contain uncompressed JSON.
+
+function base64ToBytes(text) {
+    var binary = atob(text);
+    var bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+function bytesToBase64(bytes) {
+    var binary = "";
+    // Passing too many arguments to fromCharCode at once exceeds the stack size
+    for (var i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+}
+
 var file_open_input = document.createElement("input");
 file_open_input.type = "file";
 file_open_input.accept = ".pwproj";
 file_open_input.multiple = false;
 
+async function postFile(file) {
+    var reader = file
+        .stream()
+        .pipeThrough(new CompressionStream("deflate"))
+        .getReader();
+
+    pythonWorker.postMessage(JSON.stringify({ action: "open_project_begin" }));
+
+    while (true) {
+        var { done, value } = await reader.read();
+        if (done) break;
+        pythonWorker.postMessage(
+            JSON.stringify({
+                action: "open_project_chunk",
+                payload: bytesToBase64(value),
+            })
+        );
+    }
+
+    pythonWorker.postMessage(JSON.stringify({ action: "open_project_end" }));
+}
+
 function openFile() {
     file_open_input.onchange = (e) => {
         if (e.target.files.length == 0) return;
 
-        var file = e.target.files[0];
-
-        var reader = new FileReader();
-        reader.readAsText(file, "UTF-8");
-
-        reader.onload = (readerEvent) => {
-            var content = readerEvent.target.result;
-            pythonWorker.postMessage(
-                JSON.stringify({
-                    action: "open_project_result",
-                    payload: content,
-                })
-            );
-        };
+        postFile(e.target.files[0]).catch(console.error);
     };
 
     file_open_input.click();
 }
 
+var save_chunks = [];
 var file_download_link = document.createElement("a");
 
-function saveFile(data, filename) {
-    var blob = new Blob([data], {
-        type: "text/plain;charset=utf-8",
-    });
+async function saveFile(chunks, filename) {
+    var stream = new Blob(chunks)
+        .stream()
+        .pipeThrough(new DecompressionStream("deflate"));
+    var blob = await new Response(stream, {
+        headers: { "Content-Type": "text/plain;charset=utf-8" },
+    }).blob();
     file_download_link.href = URL.createObjectURL(blob);
     file_download_link.download = filename;
     file_download_link.click();
@@ -1,4 +1,5 @@
 class Config:
     project_extension = "pwproj"
+    project_container_extension = "pwprojdb"
     about_url = "https://pathways.deltares.nl/"
     github_url = "https://github.com/Deltares-research/PathwaysGenerator/"
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-arguments,too-many-instance-attributes
 import random
+from functools import partial
 
 import flet as ft
 from src import theme
@@ -47,12 +48,14 @@ class ActionsEditor(ft.Column):
         self.update_table()
         self.update()
 
-    def on_name_edited(self, _):
-        self.app.notify_actions_changed()
+    def on_name_edited(self, action: Action, _):
+        self.app.notify_actions_changed(action.id)
 
-    def on_cell_edited(self, cell: MetricValueCell):
-        self.app.project.update_pathway_values(cell.metric.id)
-        self.app.notify_actions_changed()
+    def on_cell_edited(self, action: Action, cell: MetricValueCell):
+        # Only the values of pathways ending with this action, and their descendants, change
+        self.app.project.invalidate_action(action.id, cell.metric.id)
+        self.app.project.update_values()
+        self.app.notify_actions_changed(action.id)
 
     def on_delete_actions(self, rows: list[TableRow]):
         self.app.project.delete_actions(row.row_id for row in rows)
@@ -85,15 +88,15 @@ class ActionsEditor(ft.Column):
         def on_color_picked(color: str):
             action.color = color
             action_icon.update_action(action)
-            self.app.notify_action_color_changed()
+            self.app.notify_action_color_changed(action.id)
 
         def on_icon_picked(icon: str):
             action.icon = icon
             action_icon.update_action(action)
-            self.app.notify_action_color_changed()
+            self.app.notify_action_color_changed(action.id)
 
         def on_editor_closed(_):
-            self.app.notify_actions_changed()
+            self.app.notify_actions_changed(action.id)
 
         def update_items():
             action_button.items = [
@@ -164,7 +167,9 @@ class ActionsEditor(ft.Column):
                 effect = action.metric_data[metric.id]
                 metric_cells.append(
                     MetricEffectCell(
-                        metric, effect, on_finished_editing=self.on_cell_edited
+                        metric,
+                        effect,
+                        on_finished_editing=partial(self.on_cell_edited, action),
                     )
                 )
 
@@ -173,7 +178,9 @@ class ActionsEditor(ft.Column):
                     row_id=action.id,
                     cells=[
                         TableCell(self.create_icon_editor(action)),
-                        EditableTextCell(action, "name", self.on_name_edited),
+                        EditableTextCell(
+                            action, "name", partial(self.on_name_edited, action)
+                        ),
                         *metric_cells,
                     ],
                 )
@@ -1,5 +1,7 @@
 # from typing import Callable
 
+from functools import partial
+
 import flet as ft
 from src.pathways_app import PathwaysApp
 
@@ -41,12 +43,11 @@ class CriteriaEditor(ft.Column):
         self.update_metrics()
         self.update()
 
-    def on_metric_updated(self, _):
-        self.app.notify_conditions_changed()
+    def on_metric_updated(self, metric: Metric, _):
+        self.app.notify_criteria_changed(metric.id)
 
     def on_new_criteria(self):
-        metric = self.app.project.create_criteria()
-        self.app.project.update_pathway_values(metric.id)
+        self.app.project.create_criteria()
         self.app.notify_criteria_changed()
 
     def on_delete_criteria(self, rows: list[TableRow]):
@@ -61,8 +62,10 @@ class CriteriaEditor(ft.Column):
         row = TableRow(
             row_id=metric.id,
             cells=[
-                EditableTextCell(metric, "name", self.on_metric_updated),
-                MetricUnitCell(metric, self.on_metric_updated),
+                EditableTextCell(
+                    metric, "name", partial(self.on_metric_updated, metric)
+                ),
+                MetricUnitCell(metric, partial(self.on_metric_updated, metric)),
             ],
         )
         return row
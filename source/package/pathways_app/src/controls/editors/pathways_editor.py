@@ -1,3 +1,5 @@
+from functools import partial
+
 import flet as ft
 from src import theme
 from src.pathways_app import PathwaysApp
@@ -70,8 +72,10 @@ class PathwaysEditor(ft.Container):
         self.pathway_table.set_rows(rows)
         return rows
 
-    def on_metric_value_edited(self, cell: MetricValueCell):
-        self.app.project.update_pathway_values(cell.metric.id)
+    def on_metric_value_edited(self, pathway: Pathway, cell: MetricValueCell):
+        self.app.project.notify_changed("pathway", pathway.id)
+        self.app.project.invalidate_pathway(pathway.id, cell.metric.id)
+        self.app.project.update_values()
         self.app.notify_pathways_changed()
 
     def get_pathway_row(self, pathway: Pathway, ancestors: list[Pathway]):
@@ -148,7 +152,9 @@ class PathwaysEditor(ft.Container):
                     MetricValueCell(
                         metric,
                         pathway.metric_data[metric.id],
-                        on_finished_editing=self.on_metric_value_edited,
+                        on_finished_editing=partial(
+                            self.on_metric_value_edited, pathway
+                        ),
                     )
                     for metric in self.app.project.all_metrics()
                 ),
@@ -6,7 +6,7 @@ from src.pathways_app import PathwaysApp
 from src.utils import find_index
 
 from adaptation_pathways.app.model.metric import Metric
-from adaptation_pathways.app.model.scenario import YearDataPoint
+from adaptation_pathways.app.model.scenario import Scenario, YearDataPoint
 
 from ..editable_cell import EditableIntCell, EditableTextCell
 from ..header import SmallHeader
@@ -81,7 +81,13 @@ class ScenariosEditor(ft.Column):
             [
                 TableRow(
                     scenario.id,
-                    [EditableTextCell(scenario, "name", self.on_scenario_name_edited)],
+                    [
+                        EditableTextCell(
+                            scenario,
+                            "name",
+                            partial(self.on_scenario_name_edited, scenario),
+                        )
+                    ],
                 )
                 for scenario in self.app.project.all_scenarios
             ]
@@ -97,7 +103,8 @@ class ScenariosEditor(ft.Column):
 
         self.app.notify_scenarios_changed()
 
-    def on_scenario_name_edited(self):
+    def on_scenario_name_edited(self, scenario: Scenario, _):
+        self.app.project.notify_changed("scenario", scenario.id)
         self.app.notify_scenarios_changed()
 
     def on_delete_scenarios(self, rows: list[TableRow]):
@@ -6,7 +6,13 @@ from pyodide.code import run_js
 from src.config import Config
 from src.data import create_empty_project
 
-from adaptation_pathways.app.service.project_service import ProjectService
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service import (
+    project_container,
+    project_journal,
+    project_stream,
+)
+from adaptation_pathways.app.service.project_journal import ProjectJournal
 
 
 is_web = True
@@ -21,6 +27,10 @@ class PathwaysApp:
         self.page = page
         self.project = create_empty_project("Blank Project")
         self.project.organization = "Deltares"
+        # Journal of the project file opened or saved last, used for autosaving edits
+        self.journal: ProjectJournal | None = None
+        # Decoder of the project being received from the browser, in the web app
+        self.project_decoder: project_stream.ProjectDecoder | None = None
         self.file_opener = ft.FilePicker(on_result=self.on_file_opened)
         self.file_saver = ft.FilePicker(on_result=self.on_file_saved)
         self.page.overlay.append(self.file_opener)
@@ -41,38 +51,71 @@ class PathwaysApp:
             def new_send(data: str):
                 message: dict = json.loads(data)
                 action = message.get("action", None)
-                if action == "open_project_result":
-                    project_text = message.get("payload", None)
-                    if project_text is None:
+                if action == "open_project_begin":
+                    self.project_decoder = project_stream.ProjectDecoder()
+                elif action == "open_project_chunk":
+                    if self.project_decoder is not None:
+                        try:
+                            self.project_decoder.feed(message["payload"])
+                        except ValueError as error:
+                            print(f"Open project failed: {error}")
+                            self.project_decoder = None
+                elif action == "open_project_end":
+                    if self.project_decoder is None:
                         print("Open project failed: no payload received")
                     else:
-                        self.on_project_text_received(project_text)
+                        self.on_project_decoded(self.project_decoder)
+                        self.project_decoder = None
                 else:
                     old_send(data)
 
             flet_js.send = new_send
 
-    def notify_conditions_changed(self):
+    def notify_conditions_changed(self, metric_id: str | None = None):
+        # Metrics are edited directly by the editors, so the project is not aware of it.
+        # Creating and deleting metrics is notified by the project itself.
+        if metric_id is not None:
+            self.project.notify_changed("condition", metric_id)
+        self.autosave()
+
         for listener in self.on_conditions_changed:
             listener()
 
-    def notify_criteria_changed(self):
+    def notify_criteria_changed(self, metric_id: str | None = None):
+        if metric_id is not None:
+            self.project.notify_changed("criteria", metric_id)
+        self.autosave()
+
         for listener in self.on_criteria_changed:
             listener()
 
     def notify_scenarios_changed(self):
+        if self.project.values_scenario is not None:
+            self.project.notify_changed("scenario", self.project.values_scenario_id)
+        self.autosave()
+
         for listener in self.on_scenarios_changed:
             listener()
 
-    def notify_actions_changed(self):
+    def notify_actions_changed(self, action_id: str | None = None):
+        if action_id is not None:
+            self.project.notify_changed("action", action_id)
+        self.autosave()
+
         for listener in self.on_actions_changed:
             listener()
 
-    def notify_action_color_changed(self):
+    def notify_action_color_changed(self, action_id: str | None = None):
+        if action_id is not None:
+            self.project.notify_changed("action", action_id)
+        self.autosave()
+
         for listener in self.on_action_color_changed:
             listener()
 
     def notify_pathways_changed(self):
+        self.autosave()
+
         for listener in self.on_pathways_changed:
             listener()
 
@@ -81,14 +124,53 @@ class PathwaysApp:
             listener()
 
     def notify_project_info_changed(self):
+        self.project.notify_changed("project", self.project.id)
+        self.autosave()
+
         for listener in self.on_project_info_changed:
             listener()
 
+    def autosave(self):
+        """
+        Append the edits made since the previous autosave to the journal of the project file
+        """
+        if self.journal is None:
+            return
+
+        try:
+            self.journal.save()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.show_error(f"Autosaving the project failed: {error}")
+
+    def show_error(self, message: str):
+        self.page.open(ft.SnackBar(ft.Text(message)))
+
+    def replace_project(self, project: PathwaysProject):
+        # The container a project was read from stays open until it is closed explicitly,
+        # in case parts of the project were deleted before being read
+        project_container.close_container(self.project)
+        self.project = project
+
+    def start_journal(self, path: str | None):
+        if self.journal is not None:
+            self.journal.close()
+
+        self.journal = (
+            None
+            if path is None
+            else ProjectJournal(
+                self.project,
+                path,
+                container=path.endswith(f".{Config.project_container_extension}"),
+            )
+        )
+
     def open_link(self, url: str):
         self.page.launch_url(url)
 
     def new_project(self):
-        self.project = create_empty_project("New Project")
+        self.replace_project(create_empty_project("New Project"))
+        self.start_journal(None)
         self.page.go("/wizard")
         self.notify_project_changed()
 
@@ -99,7 +181,10 @@ class PathwaysApp:
             self.file_opener.pick_files(
                 "Choose a Project File",
                 file_type=ft.FilePickerFileType.ANY,
-                allowed_extensions=[Config.project_extension],
+                allowed_extensions=[
+                    Config.project_container_extension,
+                    Config.project_extension,
+                ],
                 allow_multiple=False,
             )
 
@@ -107,33 +192,55 @@ class PathwaysApp:
         if len(event.files) == 0:
             return
 
-        with open(event.files[0].path, encoding="utf-8") as file:
-            text = file.read()
-            file.close()
+        # Edits autosaved to the journal, but not saved to the file itself, are recovered
+        self.replace_project(project_journal.recover(event.files[0].path))
+        self.start_journal(event.files[0].path)
+        self.page.go("/project")
+        self.notify_project_changed()
 
-            self.project = ProjectService.from_json(text)
-            self.page.go("/project")
-            self.notify_project_changed()
+    def on_project_decoded(self, decoder: project_stream.ProjectDecoder):
+        try:
+            project = decoder.finish()
+        except ValueError as error:
+            print(f"Open project failed: {error}")
+            return
 
-    def on_project_text_received(self, content: str):
-        self.project = ProjectService.from_json(content)
+        self.replace_project(project)
+        self.start_journal(None)
         self.page.go("/project")
         self.notify_project_changed()
 
+    def post_message(self, message: dict):
+        # Escapes quotes properly
+        message_json = json.dumps(json.dumps(message))
+        run_js(f"self.postMessage({message_json});")
+
     def save_project(self):
         filename = f"{self.project.name}.{Config.project_extension}"
 
         if is_web:
-            project_json = ProjectService.to_json(self.project)
-            # Escapes quotes properly
-            project_json = json.dumps(project_json)
+            # The project is passed to the browser compressed and in chunks, so the whole
+            # text is never stored at once. The browser decompresses it while saving.
+            self.post_message({"action": "save_project_begin"})
 
-            message_json = f'{{ "action": "save_project", "filename":"{filename}", "content":{project_json} }}'
-            message_json = json.dumps(message_json)
+            for chunk in project_stream.iter_encoded(self.project):
+                self.post_message({"action": "save_project_chunk", "content": chunk})
 
-            run_js(f"self.postMessage({message_json});")
+            self.post_message({"action": "save_project_end", "filename": filename})
+        elif self.journal is not None:
+            try:
+                self.journal.compact()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.show_error(f"Saving the project failed: {error}")
         else:
-            self.file_saver.save_file("Save Pathways Project", filename)
+            self.file_saver.save_file(
+                "Save Pathways Project",
+                f"{self.project.name}.{Config.project_container_extension}",
+                allowed_extensions=[
+                    Config.project_container_extension,
+                    Config.project_extension,
+                ],
+            )
 
     def on_file_saved(self, event: ft.FilePickerResultEvent):
         if event.path is None:
@@ -141,9 +248,9 @@ class PathwaysApp:
             return
 
         try:
-            with open(event.path, "w", encoding="utf-8") as file:
-                text = ProjectService.to_json(self.project)
-                file.write(text)
-                file.close()
-        except Exception as error:
-            print(error)
+            self.start_journal(event.path)
+
+            if self.journal is not None:
+                self.journal.compact()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.show_error(f"Saving the project failed: {error}")
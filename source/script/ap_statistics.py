@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+import sys
+
+from adaptation_pathways.cli.statistics import main
+
+
+sys.exit(main())
@@ -0,0 +1,187 @@
+import random
+import unittest
+
+from adaptation_pathways.app.model.metric import MetricValue, MetricValueState
+from adaptation_pathways.app.model.pathway import Pathway
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+
+from ..test_data import example_project
+
+
+def random_project(nr_pathways: int, *, seed: int = 0) -> PathwaysProject:
+    generator = random.Random(seed)
+    project = example_project()
+    action_ids = [
+        project.create_action("#0000ff", "icon").id for _ in range(5)
+    ] + project.action_ids[1:]
+
+    for action in project.all_actions:
+        for effect in action.metric_data.values():
+            effect.value = generator.uniform(0, 10)
+
+        project.invalidate_action(action.id)
+
+    project.update_values()
+
+    pathway_ids = list(project.pathway_ids)
+
+    while len(pathway_ids) < nr_pathways:
+        action_id = generator.choice(action_ids)
+        parent_id = generator.choice(pathway_ids)
+
+        if f"{parent_id}->{action_id}" not in project.pathways_by_id:
+            pathway_ids.append(project.create_pathway(action_id, parent_id).id)
+
+    return project
+
+
+def pathway_values(project: PathwaysProject) -> dict:
+    return {
+        pathway.id: {
+            metric_id: (value.value, value.state)
+            for metric_id, value in pathway.metric_data.items()
+        }
+        for pathway in project.all_pathways
+    }
+
+
+def recalculated_values(project: PathwaysProject) -> dict:
+    for metric in project.all_metrics():
+        project.update_pathway_values(metric.id)
+
+    return pathway_values(project)
+
+
+class PathwaysProjectTest(unittest.TestCase):
+    def test_create_pathway(self):
+        project = example_project()
+        pathway = project.get_pathway("4->5")
+
+        self.assertEqual(
+            pathway.metric_data["1"], MetricValue(2.0, MetricValueState.ESTIMATE)
+        )
+
+        child = project.create_pathway("5", pathway.id)
+
+        self.assertEqual(
+            child.metric_data["1"], MetricValue(4.0, MetricValueState.ESTIMATE)
+        )
+        self.assertEqual(list(project.get_children(pathway.id)), [child])
+
+    def test_incremental(self):
+        project = random_project(200)
+        values = pathway_values(project)
+
+        self.assertEqual(values, recalculated_values(project))
+
+    def test_invalidate_pathway(self):
+        project = random_project(200)
+        pathway = project.get_pathway(project.pathway_ids[10])
+        pathway.metric_data["1"] = MetricValue(100.0, MetricValueState.OVERRIDE)
+
+        project.invalidate_pathway(pathway.id, "1")
+        project.update_values()
+        values = pathway_values(project)
+
+        self.assertEqual(values, recalculated_values(project))
+
+        # Switching back to an estimate recalculates the value itself as well
+        pathway.metric_data["1"].state = MetricValueState.ESTIMATE
+        project.invalidate_pathway(pathway.id)
+        project.update_values()
+        values = pathway_values(project)
+
+        self.assertNotEqual(values[pathway.id]["1"][0], 100.0)
+        self.assertEqual(values, recalculated_values(project))
+
+    def test_invalidate_action(self):
+        project = random_project(200)
+        action = project.get_action(project.action_ids[-1])
+        action.metric_data["2"].value = 3.0
+
+        project.invalidate_action(action.id, "2")
+        project.update_values()
+        values = pathway_values(project)
+
+        self.assertEqual(values, recalculated_values(project))
+
+    def test_only_dirty_pathways_updated(self):
+        project = random_project(50)
+        pathway = project.get_pathway(project.pathway_ids[-1])
+        other_pathway = project.get_pathway(project.pathway_ids[0])
+        other_pathway.metric_data["1"].value = -1.0
+
+        project.invalidate_pathway(pathway.id, "1")
+        project.update_values()
+
+        self.assertEqual(other_pathway.metric_data["1"].value, -1.0)
+
+    def test_delete_pathways(self):
+        project = random_project(100)
+        pathway_id = project.pathway_ids[5]
+        descendant_ids = {
+            pathway.id
+            for pathway in project.all_pathways
+            if any(
+                ancestor.id == pathway_id for ancestor in project.get_ancestors(pathway)
+            )
+        }
+
+        project.delete_pathways([pathway_id])
+
+        self.assertNotIn(pathway_id, project.pathways_by_id)
+        self.assertTrue(descendant_ids.isdisjoint(project.pathways_by_id))
+        self.assertEqual(len(project.pathway_ids), 99 - len(descendant_ids))
+        self.assertEqual(list(project.get_children(pathway_id)), [])
+
+        # The index of the pathways is kept up to date
+        action = project.create_action("#0000ff", "icon")
+        pathway = project.create_pathway(action.id, project.root_pathway_id)
+
+        self.assertIn(pathway, project.get_children(project.root_pathway_id))
+
+    def test_reparent_pathway(self):
+        project = random_project(100)
+        pathway = project.get_pathway(project.pathway_ids[-1])
+        old_parent_id = pathway.parent_id
+        new_parent_id = project.root_pathway_id
+        self.assertNotEqual(old_parent_id, new_parent_id)
+
+        # Make sure the index exists before the pathway is changed
+        list(project.get_children(new_parent_id))
+
+        pathway.parent_id = new_parent_id
+        project.notify_changed("pathway", pathway.id)
+        project.invalidate_pathway(pathway.id)
+        project.update_values()
+
+        self.assertNotIn(pathway, project.get_children(old_parent_id))
+        self.assertIn(pathway, project.get_children(new_parent_id))
+
+        values = pathway_values(project)
+        self.assertEqual(values, recalculated_values(project))
+
+    def test_replace_pathway(self):
+        project = random_project(100)
+        old_pathway = project.get_pathway(project.pathway_ids[-1])
+        list(project.get_children(project.root_pathway_id))
+
+        # Replace the pathway by one with another parent and action, keeping the number of
+        # pathways the same
+        action = project.create_action("#0000ff", "icon")
+        pathway = Pathway(action.id, project.root_pathway_id)
+        pathway.id = old_pathway.id
+        project.pathways_by_id[pathway.id] = pathway
+        project.notify_changed("pathway", pathway.id)
+
+        project.invalidate_action(action.id)
+        project.update_values()
+
+        self.assertNotIn(old_pathway, project.get_children(old_pathway.parent_id))
+        self.assertEqual(
+            list(project.get_children(project.root_pathway_id))[-1], pathway
+        )
+        self.assertIn("1", pathway.metric_data)
+
+        values = pathway_values(project)
+        self.assertEqual(values, recalculated_values(project))
@@ -0,0 +1,152 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from adaptation_pathways.app.service import project_container, serialization
+from adaptation_pathways.app.service.project_service import ProjectService
+
+from ..test_data import example_project
+
+
+class ProjectContainerTest(unittest.TestCase):
+    def test_round_trip(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project.pwprojdb"
+            project_container.write_container(project, pathname)
+
+            self.assertTrue(project_container.is_container(pathname))
+            self.assertEqual(list(Path(directory_pathname).iterdir()), [pathname])
+
+            project_we_got = project_container.read_container(pathname)
+
+            self.assertEqual(
+                serialization.project_to_value(project_we_got),
+                serialization.project_to_value(project),
+            )
+
+    def test_lazy(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project.pwprojdb"
+            project_container.write_container(project, pathname)
+            project_we_got = project_container.read_container(pathname)
+
+            # Scenarios and pathway values are read when accessed for the first time
+            scenarios = project_we_got.scenarios_by_id
+            pathways = list(project_we_got.all_pathways)
+
+            self.assertEqual(list(scenarios), ["3"])
+            self.assertFalse(scenarios.is_read("3"))
+            self.assertEqual([pathway.id for pathway in pathways], ["4", "4->5"])
+            self.assertFalse(any(pathway.is_read for pathway in pathways))
+
+            self.assertEqual(
+                [year_data.year for year_data in scenarios["3"].yearly_data],
+                [2030, 2040],
+            )
+            self.assertTrue(scenarios.is_read("3"))
+
+            self.assertEqual(
+                pathways[1].metric_data, project.pathways_by_id["4->5"].metric_data
+            )
+            self.assertTrue(pathways[1].is_read)
+            self.assertFalse(pathways[0].is_read)
+
+            # Edits made before reading replace what is stored
+            pathways[0].metric_data = {}
+            self.assertTrue(pathways[0].is_read)
+            self.assertEqual(pathways[0].metric_data, {})
+
+            # The project can be saved to the file it was read from
+            project_we_got.create_pathway("5", "4->5")
+            project_container.write_container(project_we_got, pathname)
+
+            self.assertEqual(
+                len(project_container.read_container(pathname).pathway_ids), 3
+            )
+
+    def test_read_from_other_thread(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project.pwprojdb"
+            project_container.write_container(project, pathname)
+            project_we_got = project_container.read_container(pathname)
+            values = []
+
+            def read():
+                values.append(serialization.project_to_value(project_we_got))
+
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+
+            self.assertEqual(values, [serialization.project_to_value(project)])
+
+    def test_close(self):
+        # pylint: disable=protected-access
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project.pwprojdb"
+            project_container.write_container(project, pathname)
+
+            # Records replaced or deleted before being read are not waited for
+            project_we_got = project_container.read_container(pathname)
+            reader = project_we_got.scenarios_by_id._reader
+            project_we_got.scenarios_by_id["3"] = project.scenarios_by_id["3"]
+            project_we_got.delete_pathways(["4"])
+
+            self.assertIsNotNone(reader._connection)
+
+            project_container.close_container(project_we_got)
+
+            self.assertIsNone(reader._connection)
+
+            # Parts not read yet cannot be read after closing
+            project_we_got = project_container.read_container(pathname)
+            project_container.close_container(project_we_got)
+
+            self.assertRaises(
+                RuntimeError, project_we_got.scenarios_by_id.__getitem__, "3"
+            )
+
+            # Writing a project closes the container it was read from
+            project_we_got = project_container.read_container(pathname)
+            reader = project_we_got.scenarios_by_id._reader
+            project_container.write_container(project_we_got, pathname)
+
+            self.assertIsNone(reader._connection)
+
+    def test_invalid_container(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project.pwprojdb"
+
+            self.assertRaises(ValueError, project_container.read_container, pathname)
+
+            pathname.write_text("{}", encoding="utf-8")
+            self.assertFalse(project_container.is_container(pathname))
+            self.assertRaises(ValueError, project_container.read_container, pathname)
+
+
+class ProjectServiceTest(unittest.TestCase):
+    def test_from_file(self):
+        project = example_project()
+        value = serialization.project_to_value(project)
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            container_pathname = Path(directory_pathname) / "project.pwprojdb"
+            json_pathname = Path(directory_pathname) / "project.pwproj"
+
+            ProjectService.to_container(project, container_pathname)
+            json_pathname.write_text(ProjectService.to_json(project), encoding="utf-8")
+
+            for pathname in [container_pathname, json_pathname]:
+                self.assertEqual(
+                    serialization.project_to_value(ProjectService.from_file(pathname)),
+                    value,
+                )
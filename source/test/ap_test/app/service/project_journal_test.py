@@ -0,0 +1,203 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from adaptation_pathways.app.model.metric import MetricValue, MetricValueState
+from adaptation_pathways.app.service import serialization
+from adaptation_pathways.app.service.project_journal import (
+    ProjectJournal,
+    journal_pathname,
+    recover,
+)
+
+from ..test_data import example_project
+
+
+def nr_lines(pathname: Path) -> int:
+    return len(pathname.read_text(encoding="utf-8").splitlines())
+
+
+class ProjectJournalTest(unittest.TestCase):
+    def _test_save_recover(self, container: bool):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project"
+            journal = ProjectJournal(project, pathname, container=container)
+
+            # Without a journal, the first save compacts
+            project.name = "Other name"
+            project.notify_changed("project", project.id)
+            journal.save()
+            self.assertTrue(pathname.exists())
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1)
+            self.assertFalse(journal.has_changes)
+
+            # Edits are appended: one record for the project, one per object edited
+            action = project.create_action("#0000ff", "icon", "New action")
+            project.create_pathway(action.id, "4->5")
+            project.set_scenario_data(
+                "3", 2050, "1", MetricValue(3.0, MetricValueState.OVERRIDE)
+            )
+            project.name = "Edited name"
+            journal.save()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1 + 4)
+
+            project.delete_actions(["5"])
+            journal.save()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1 + 4 + 4)
+
+            # Saving without edits does nothing
+            journal.save()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1 + 4 + 4)
+
+            project_we_got = recover(pathname)
+
+            self.assertEqual(project_we_got.name, "Edited name")
+            self.assertEqual(project_we_got.action_ids, ["4", "6"])
+            self.assertEqual(project_we_got.pathway_ids, ["4"])
+            self.assertEqual(
+                [
+                    year_data.year
+                    for year_data in project_we_got.scenarios_by_id["3"].yearly_data
+                ],
+                [2030, 2040, 2050],
+            )
+            self.assertEqual(
+                serialization.project_to_value(project_we_got),
+                serialization.project_to_value(project),
+            )
+
+            # The journal is compacted on request
+            journal.compact()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1)
+            self.assertEqual(
+                serialization.project_to_value(recover(pathname)),
+                serialization.project_to_value(project),
+            )
+
+            journal.close()
+            project.create_scenario("Not recorded")
+            self.assertFalse(journal.has_changes)
+
+    def test_save_recover_container(self):
+        self._test_save_recover(container=True)
+
+    def test_save_recover_json(self):
+        self._test_save_recover(container=False)
+
+    def test_compact_when_full(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project"
+            journal = ProjectJournal(project, pathname, max_nr_records=4)
+            journal.compact()
+
+            project.create_scenario("Scenario")
+            journal.save()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1 + 2)
+
+            project.create_scenario("Scenario")
+            project.create_scenario("Scenario")
+            journal.save()
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1)
+            self.assertEqual(len(recover(pathname).scenario_ids), 4)
+
+    def test_recover_after_crash(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project"
+            journal = ProjectJournal(project, pathname)
+            journal.compact()
+
+            project.create_pathway("5", "4->5")
+            journal.save()
+
+            # Crash while appending a record
+            with open(journal_pathname(pathname), "a", encoding="utf-8") as file:
+                file.write('{"kind":"pathway","value":{"id":')
+
+            project_we_got = recover(pathname)
+            self.assertEqual(project_we_got.pathway_ids, ["4", "4->5", "4->5->5"])
+            self.assertEqual(
+                project_we_got.pathways_by_id["4->5->5"].metric_data["1"].value, 4.0
+            )
+
+            # Continuing the journal removes the incomplete record first
+            journal = ProjectJournal(project_we_got, pathname)
+            project_we_got.delete_pathway("4->5->5")
+            journal.save()
+
+            self.assertEqual(recover(pathname).pathway_ids, ["4", "4->5"])
+
+    def test_recover_affected_values(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project"
+            journal = ProjectJournal(project, pathname)
+            journal.compact()
+
+            project.create_pathway("5", "4->5")
+            project.name = "Edited name"
+            project.notify_changed("project", project.id)
+            journal.save()
+
+            # Only the values of the new pathway and of its parent are read from the container
+            project_we_got = recover(pathname)
+            self.assertFalse(project_we_got.pathways_by_id["4"].is_read)
+            self.assertTrue(project_we_got.pathways_by_id["4->5"].is_read)
+            self.assertEqual(
+                project_we_got.pathways_by_id["4->5->5"].metric_data["1"].value, 4.0
+            )
+            self.assertEqual(
+                serialization.project_to_value(project_we_got),
+                serialization.project_to_value(project),
+            )
+
+            # Children of a deleted pathway which are not deleted become roots
+            journal = ProjectJournal(project_we_got, pathname)
+            project_we_got.delete_pathway("4->5")
+            journal.save()
+
+            project_we_got = recover(pathname)
+            self.assertEqual(project_we_got.pathway_ids, ["4", "4->5->5"])
+            self.assertEqual(
+                project_we_got.pathways_by_id["4->5->5"].metric_data["1"].value, 2.0
+            )
+
+    def test_stale_journal(self):
+        project = example_project()
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            pathname = Path(directory_pathname) / "project"
+            journal = ProjectJournal(project, pathname)
+            journal.compact()
+
+            project.create_scenario("Scenario")
+            journal.save()
+
+            # The snapshot was replaced, without replacing the journal
+            other_project = example_project()
+            other_project.name = "Other project"
+            ProjectJournal(other_project, Path(directory_pathname) / "other").compact()
+            (Path(directory_pathname) / "other").replace(pathname)
+
+            project_we_got = recover(pathname)
+            self.assertEqual(project_we_got.name, "Other project")
+            self.assertEqual(len(project_we_got.scenario_ids), 1)
+
+            # Saving edits to a stale journal compacts it
+            journal = ProjectJournal(project_we_got, pathname)
+            project_we_got.create_scenario("Scenario")
+            journal.save()
+
+            self.assertEqual(nr_lines(journal_pathname(pathname)), 1)
+            first_record = json.loads(
+                journal_pathname(pathname).read_text(encoding="utf-8")
+            )
+            self.assertEqual(first_record["version"], 1)
+            self.assertEqual(len(recover(pathname).scenario_ids), 2)
@@ -0,0 +1,132 @@
+import base64
+import json
+import unittest
+import zlib
+
+from adaptation_pathways.app.service import project_stream, serialization
+from adaptation_pathways.app.service.project_service import ProjectService
+
+from ..test_data import example_project
+
+
+class ProjectStreamTest(unittest.TestCase):
+    def test_round_trip(self):
+        project = example_project()
+        chunks = list(project_stream.iter_encoded(project, chunk_size=10))
+
+        self.assertGreater(len(chunks), 1)
+
+        # Each chunk except the last one encodes 9 bytes, without padding
+        for chunk in chunks[:-1]:
+            self.assertEqual(len(chunk), 12)
+            self.assertEqual(len(base64.b64decode(chunk, validate=True)), 9)
+
+        self.assertLessEqual(len(chunks[-1]), 12)
+
+        project_we_got = project_stream.decode(chunks)
+
+        self.assertEqual(
+            serialization.project_to_value(project_we_got),
+            serialization.project_to_value(project),
+        )
+
+    def test_compressed(self):
+        project = example_project()
+        data = b"".join(project_stream.iter_compressed(project, chunk_size=7))
+
+        self.assertEqual(
+            json.loads(zlib.decompress(data)), serialization.project_to_value(project)
+        )
+
+    def test_data_url(self):
+        project = example_project()
+        data_url = ProjectService.to_data_url(project)
+
+        self.assertTrue(data_url.startswith("data:text/plain;base64,"))
+
+        project_we_got = ProjectService.from_data_url(data_url)
+
+        self.assertEqual(
+            serialization.project_to_value(project_we_got),
+            serialization.project_to_value(project),
+        )
+
+    def test_compressed_data_url(self):
+        project = example_project()
+        data_url = ProjectService.to_compressed_data_url(project)
+
+        self.assertTrue(data_url.startswith(project_stream.data_url_prefix))
+
+        # The chunks concatenated form a single base64 text
+        base64.b64decode(data_url[len(project_stream.data_url_prefix) :], validate=True)
+
+        project_we_got = ProjectService.from_data_url(data_url)
+
+        self.assertEqual(
+            serialization.project_to_value(project_we_got),
+            serialization.project_to_value(project),
+        )
+
+    def test_chunks_of_other_size(self):
+        # Chunks compressed and encoded elsewhere, like in the browser, can have any size
+        project = example_project()
+        data = zlib.compress(ProjectService.to_json(project).encode("utf-8"))
+        chunks = [
+            base64.b64encode(data[offset : offset + 5]).decode("ascii")
+            for offset in range(0, len(data), 5)
+        ]
+
+        project_we_got = project_stream.decode(chunks)
+
+        self.assertEqual(
+            serialization.project_to_value(project_we_got),
+            serialization.project_to_value(project),
+        )
+
+    def test_parse_incrementally(self):
+        # Each chunk contains a single character of the text, with whitespace between tokens
+        project = example_project()
+        text = json.dumps(serialization.project_to_value(project), indent=1)
+        compressor = zlib.compressobj()
+        chunks = [
+            base64.b64encode(
+                compressor.compress(character.encode("utf-8"))
+                + compressor.flush(zlib.Z_SYNC_FLUSH)
+            ).decode("ascii")
+            for character in text
+        ]
+        chunks.append(base64.b64encode(compressor.flush()).decode("ascii"))
+
+        project_we_got = project_stream.decode(chunks)
+
+        self.assertEqual(
+            serialization.project_to_value(project_we_got),
+            serialization.project_to_value(project),
+        )
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(project_stream.iter_compressed(example_project(), chunk_size=0))
+
+    def test_incomplete(self):
+        chunks = list(project_stream.iter_encoded(example_project(), chunk_size=30))
+
+        with self.assertRaises(ValueError):
+            project_stream.decode(chunks[:-1])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            project_stream.decode(["not base64!"])
+
+        with self.assertRaises(ValueError):
+            project_stream.decode([base64.b64encode(b"not compressed").decode("ascii")])
+
+        for text in ["[]", '{"a": [1, 2}', '{"a": 1} {}']:
+            with self.assertRaises(ValueError):
+                project_stream.decode(
+                    [
+                        base64.b64encode(zlib.compress(text.encode("utf-8"))).decode(
+                            "ascii"
+                        )
+                    ]
+                )
@@ -0,0 +1,283 @@
+import json
+import unittest
+
+from adaptation_pathways.app.model.metric import (
+    MetricOperation,
+    MetricUnit,
+    MetricValue,
+    MetricValueState,
+    default_units,
+)
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+from adaptation_pathways.app.service import serialization
+from adaptation_pathways.app.service.project_service import ProjectService
+
+from ..test_data import example_project
+
+
+# Project as saved by earlier versions of the app, using jsonpickle
+legacy_project = {
+    "py/object": "adaptation_pathways.app.model.pathways_project.PathwaysProject",
+    "id": "project",
+    "name": "Project",
+    "organization": "Organization",
+    "start_year": 2020,
+    "end_year": 2100,
+    "_current_id": 4,
+    "condition_ids": ["1"],
+    "conditions_by_id": {
+        "1": {
+            "py/object": "adaptation_pathways.app.model.metric.Metric",
+            "id": "1",
+            "name": "New Condition",
+            "unit_or_default": {
+                "py/object": "adaptation_pathways.app.model.metric.MetricUnit",
+                "name": "Meter",
+                "symbol": "m",
+                "short_name": None,
+                "symbol_plural": None,
+                "place_after_value": True,
+                "value_format": "n",
+            },
+        }
+    },
+    "criteria_ids": [],
+    "criteria_by_id": {},
+    "scenario_ids": ["2"],
+    "scenarios_by_id": {
+        "2": {
+            "py/object": "adaptation_pathways.app.model.scenario.Scenario",
+            "id": "2",
+            "name": "Scenario",
+            "yearly_data": [
+                {
+                    "py/object": "adaptation_pathways.app.model.scenario.YearDataPoint",
+                    "year": 2030,
+                    "metric_data": {
+                        "1": {
+                            "py/object": "adaptation_pathways.app.model.metric.MetricValue",
+                            "value": 1.5,
+                            "state": {
+                                "py/reduce": [
+                                    {
+                                        "py/type": "adaptation_pathways.app.model.metric.MetricValueState"
+                                    },
+                                    {"py/tuple": [2]},
+                                ]
+                            },
+                        }
+                    },
+                }
+            ],
+        }
+    },
+    "action_ids": ["3", "4"],
+    "actions_by_id": {
+        "3": {
+            "py/object": "adaptation_pathways.app.model.action.Action",
+            "id": "3",
+            "name": "Current situation",
+            "color": "#ff0000",
+            "icon": "icon",
+            "metric_data": {
+                "1": {
+                    "py/object": "adaptation_pathways.app.model.metric.MetricEffect",
+                    "value": 0,
+                    "operation": {
+                        "py/reduce": [
+                            {
+                                "py/type": "adaptation_pathways.app.model.metric.MetricOperation"
+                            },
+                            {"py/tuple": ["Add"]},
+                        ]
+                    },
+                }
+            },
+        },
+        "4": {
+            "py/object": "adaptation_pathways.app.model.action.Action",
+            "id": "4",
+            "name": "New Action (4)",
+            "color": "#00ff00",
+            "icon": "icon",
+            "metric_data": {
+                "1": {
+                    "py/object": "adaptation_pathways.app.model.metric.MetricEffect",
+                    "value": 2.0,
+                    "operation": {"py/id": 20},
+                }
+            },
+        },
+    },
+    "pathway_ids": ["3", "3->4"],
+    "pathways_by_id": {
+        "3": {
+            "py/object": "adaptation_pathways.app.model.pathway.Pathway",
+            "id": "3",
+            "action_id": "3",
+            "parent_id": None,
+            "metric_data": {
+                "1": {
+                    "py/object": "adaptation_pathways.app.model.metric.MetricValue",
+                    "value": 0,
+                    "state": {
+                        "py/reduce": [
+                            {
+                                "py/type": "adaptation_pathways.app.model.metric.MetricValueState"
+                            },
+                            {"py/tuple": [0]},
+                        ]
+                    },
+                }
+            },
+        },
+        "3->4": {
+            "py/object": "adaptation_pathways.app.model.pathway.Pathway",
+            "id": "3->4",
+            "action_id": "4",
+            "parent_id": "3",
+            "metric_data": {
+                "1": {
+                    "py/object": "adaptation_pathways.app.model.metric.MetricValue",
+                    "value": 2.0,
+                    "state": {
+                        "py/reduce": [
+                            {
+                                "py/type": "adaptation_pathways.app.model.metric.MetricValueState"
+                            },
+                            {"py/tuple": [{"py/tuple": [1]}]},
+                        ]
+                    },
+                }
+            },
+        },
+    },
+    "root_pathway_id": "3",
+    "root_action_id": "3",
+    "values_scenario_id": "none",
+    "graph_metric_id": "1",
+    "graph_scenario_id": "2",
+    "graph_is_time": False,
+}
+
+
+class SerializationTest(unittest.TestCase):
+    def test_round_trip(self):
+        project = example_project()
+        value = serialization.project_to_value(project)
+
+        self.assertEqual(value["format"], serialization.format_name)
+        self.assertEqual(value["version"], serialization.format_version)
+
+        # The value can be converted to JSON and back without changes
+        self.assertEqual(json.loads(json.dumps(value)), value)
+
+        project_we_got = serialization.project_from_value(value)
+
+        self.assertEqual(serialization.project_to_value(project_we_got), value)
+        self.assertEqual(project_we_got._current_id, project._current_id)
+        self.assertEqual(
+            project_we_got.conditions_by_id["1"].unit_or_default,
+            default_units.length.si[2],
+        )
+        self.assertEqual(project_we_got.criteria_by_id["2"].unit_or_default, "€")
+        self.assertIs(
+            project_we_got.actions_by_id["5"].metric_data["2"].operation,
+            MetricOperation.MULTIPLY,
+        )
+        self.assertEqual(
+            project_we_got.pathways_by_id["4->5"].metric_data["1"],
+            MetricValue(2.0, MetricValueState.ESTIMATE),
+        )
+        self.assertEqual(
+            [
+                year_data.year
+                for year_data in project_we_got.scenarios_by_id["3"].yearly_data
+            ],
+            [2030, 2040],
+        )
+
+        # Editing the project after reading it works as before
+        pathway = project_we_got.create_pathway("5", "4->5")
+        self.assertEqual(pathway.metric_data["1"].value, 4.0)
+        self.assertEqual(project_we_got.create_scenario("Other").id, "6")
+
+    def test_unsupported_version(self):
+        value = serialization.project_to_value(example_project())
+
+        value["version"] = serialization.format_version + 1
+        self.assertRaises(ValueError, serialization.project_from_value, value)
+
+        del value["format"]
+        self.assertRaises(ValueError, serialization.project_from_value, value)
+
+    def test_invalid_project(self):
+        value = serialization.project_to_value(example_project())
+        del value["actions"]
+
+        self.assertRaises(ValueError, serialization.project_from_value, value)
+
+    def test_legacy_project(self):
+        self.assertTrue(serialization.is_legacy_value(legacy_project))
+
+        project = serialization.project_from_legacy_value(legacy_project)
+
+        self.assertIsInstance(project, PathwaysProject)
+        self.assertEqual(project.name, "Project")
+        self.assertEqual(project._current_id, 4)
+        self.assertEqual(project.condition_ids, ["1"])
+        self.assertEqual(
+            project.conditions_by_id["1"].unit_or_default,
+            MetricUnit(name="Meter", symbol="m"),
+        )
+        self.assertEqual(
+            project.scenarios_by_id["2"].yearly_data[0].metric_data["1"],
+            MetricValue(1.5, MetricValueState.OVERRIDE),
+        )
+        self.assertIs(
+            project.actions_by_id["4"].metric_data["1"].operation, MetricOperation.ADD
+        )
+        self.assertEqual(project.actions_by_id["4"].apply_effect("1", 1.0), 3.0)
+
+        # Repeated enumeration members are stored as references
+        self.assertEqual(
+            project.pathways_by_id["3"].metric_data["1"],
+            MetricValue(0, MetricValueState.BASE),
+        )
+        self.assertEqual(
+            project.pathways_by_id["3->4"].metric_data["1"],
+            MetricValue(2.0, MetricValueState.ESTIMATE),
+        )
+
+    def test_legacy_unsupported_class(self):
+        value = json.loads(json.dumps(legacy_project))
+        value["py/object"] = "os.system"
+
+        self.assertRaises(ValueError, serialization.project_from_legacy_value, value)
+
+
+class ProjectServiceTest(unittest.TestCase):
+    def test_json(self):
+        project = example_project()
+        text = ProjectService.to_json(project)
+
+        self.assertNotIn("py/", text)
+        self.assertEqual(
+            serialization.project_to_value(ProjectService.from_json(text)),
+            serialization.project_to_value(project),
+        )
+
+    def test_legacy_json(self):
+        project = ProjectService.from_json(json.dumps(legacy_project))
+
+        self.assertEqual(project.root_pathway_id, "3")
+
+        # Saving a legacy project converts it to the current format
+        self.assertEqual(
+            json.loads(ProjectService.to_json(project))["version"],
+            serialization.format_version,
+        )
+
+    def test_invalid_json(self):
+        self.assertRaises(ValueError, ProjectService.from_json, "[]")
+        self.assertRaises(ValueError, ProjectService.from_json, "{")
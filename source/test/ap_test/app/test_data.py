@@ -0,0 +1,31 @@
+from adaptation_pathways.app.model.metric import (
+    MetricOperation,
+    MetricValue,
+    MetricValueState,
+    default_units,
+)
+from adaptation_pathways.app.model.pathways_project import PathwaysProject
+
+
+def example_project() -> PathwaysProject:
+    project = PathwaysProject("project", "Project", "Organization", 2020, 2100)
+    condition = project.create_condition()
+    condition.unit_or_default = default_units.length.si[2]
+    criteria = project.create_criteria()
+    criteria.unit_or_default = "€"
+
+    scenario = project.create_scenario("Scenario")
+    scenario.set_data(2030, condition.id, MetricValue(1.5, MetricValueState.OVERRIDE))
+    scenario.set_data(2040, condition.id, MetricValue(2.0, MetricValueState.ESTIMATE))
+
+    root_action = project.create_action("#ff0000", "icon", "Current situation")
+    action = project.create_action("#00ff00", "icon")
+    action.metric_data[condition.id].value = 2.0
+    action.metric_data[criteria.id].operation = MetricOperation.MULTIPLY
+
+    project.root_action_id = root_action.id
+    root_pathway = project.create_pathway(root_action.id)
+    project.root_pathway_id = root_pathway.id
+    project.create_pathway(action.id, root_pathway.id)
+
+    return project
@@ -0,0 +1,137 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import docopt
+
+from adaptation_pathways.alias import TippingPointByAction
+from adaptation_pathways.cli.batch import parse_nr_workers
+from adaptation_pathways.cli.export import export_many
+from adaptation_pathways.cli.import_ import import_many
+from adaptation_pathways.io import binary, text
+from adaptation_pathways.plot.colour import default_action_colours
+
+from .. import test_data
+
+
+def write_text_dataset(basename_pathname: str) -> None:
+    actions, sequences = test_data.serial_pathway()
+    tipping_point_by_action: TippingPointByAction = {actions[0]: 2000}
+    tipping_point_by_action |= {
+        sequence[1]: 2010 + idx for idx, sequence in enumerate(sequences)
+    }
+    colour_by_action_name = {
+        action.name: colour
+        for action, colour in zip(actions, default_action_colours(len(actions)))
+    }
+    text.write_dataset(
+        actions,
+        sequences,
+        tipping_point_by_action,
+        colour_by_action_name,
+        basename_pathname,
+    )
+
+
+class BatchTest(unittest.TestCase):
+    def _test_round_trip(self, nr_workers):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            text_pathname = os.path.join(directory_pathname, "text")
+            binary_pathname = os.path.join(directory_pathname, "binary")
+            export_pathname = os.path.join(directory_pathname, "export")
+            os.mkdir(text_pathname)
+
+            for idx in range(5):
+                write_text_dataset(os.path.join(text_pathname, f"dataset_{idx}"))
+
+            # Only the actions file: reading the dataset fails
+            with open(
+                text.format_actions_path(os.path.join(text_pathname, "invalid")),
+                "w",
+                encoding="utf8",
+            ) as file:
+                file.write("current\n")
+
+            stdout, stderr = io.StringIO(), io.StringIO()
+
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                status = import_many(text_pathname, binary_pathname, nr_workers)
+
+            self.assertEqual(status, 1)
+            self.assertEqual(stdout.getvalue(), "Imported 5 of 6 datasets (1 failed)\n")
+            self.assertTrue(
+                stderr.getvalue().startswith(os.path.join(text_pathname, "invalid: "))
+            )
+            self.assertEqual(
+                sorted(os.listdir(binary_pathname)),
+                [f"dataset_{idx}.apw" for idx in range(5)],
+            )
+
+            stdout = io.StringIO()
+
+            with contextlib.redirect_stdout(stdout):
+                status = export_many(
+                    os.path.join(binary_pathname, "dataset_[0-2].apw"),
+                    export_pathname,
+                    nr_workers,
+                )
+
+            self.assertEqual(status, 0)
+            self.assertEqual(stdout.getvalue(), "Exported 3 of 3 datasets\n")
+
+            for idx in range(3):
+                self.assertEqual(
+                    text.read_dataset(os.path.join(export_pathname, f"dataset_{idx}"))[
+                        0
+                    ][0].name,
+                    binary.read_dataset(
+                        os.path.join(binary_pathname, f"dataset_{idx}")
+                    )[0][0].name,
+                )
+
+            # Nothing selected
+            stdout = io.StringIO()
+
+            with contextlib.redirect_stdout(stdout):
+                status = export_many(text_pathname, export_pathname, nr_workers)
+
+            self.assertEqual(status, 1)
+            self.assertEqual(stdout.getvalue(), "Exported 0 of 0 datasets\n")
+
+    def test_serial(self):
+        self._test_round_trip(1)
+
+    def test_parallel(self):
+        self._test_round_trip(2)
+
+    def test_duplicate_outputs(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            binary_pathname = os.path.join(directory_pathname, "binary")
+
+            for name in ["a", "b"]:
+                os.mkdir(os.path.join(directory_pathname, name))
+                write_text_dataset(os.path.join(directory_pathname, name, "dataset"))
+
+            # Both datasets would be imported to binary/dataset.apw
+            stderr = io.StringIO()
+
+            with contextlib.redirect_stderr(stderr):
+                status = import_many(
+                    os.path.join(directory_pathname, "*", "dataset-action.txt"),
+                    binary_pathname,
+                    1,
+                )
+
+            self.assertEqual(status, 1)
+            self.assertIn("same output", stderr.getvalue())
+            self.assertEqual(os.listdir(binary_pathname), [])
+
+    def test_parse_nr_workers(self):
+        self.assertIsNone(parse_nr_workers(None))
+        self.assertEqual(parse_nr_workers("4"), 4)
+
+        for nr_workers in ["x", "0", "-1", "1.5"]:
+            with self.assertRaises(docopt.DocoptExit):
+                parse_nr_workers(nr_workers)
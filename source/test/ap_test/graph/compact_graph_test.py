@@ -0,0 +1,182 @@
+import pickle
+import unittest
+
+import networkx as nx
+import numpy.testing as npt
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.graph import (
+    SequenceGraph,
+    sequence_graph_to_pathway_graph,
+    sequence_graph_to_pathway_map,
+)
+from adaptation_pathways.graph.compact_graph import CompactDiGraph
+from adaptation_pathways.graph.node import Action as ActionNode
+
+
+class CompactDiGraphTest(unittest.TestCase):
+    def test_constructor(self):
+        graph = CompactDiGraph()
+
+        self.assertEqual(graph.number_of_nodes(), 0)
+        self.assertEqual(graph.number_of_edges(), 0)
+        self.assertEqual(list(graph.nodes), [])
+        self.assertEqual(list(graph.edges), [])
+
+    def test_add_node(self):
+        graph = CompactDiGraph()
+        graph.add_node("a")
+        graph.add_node("a")
+
+        self.assertEqual(graph.number_of_nodes(), 1)
+        self.assertEqual(graph.number_of_edges(), 0)
+        self.assertIn("a", graph)
+        self.assertEqual(graph.in_degree("a"), 0)
+        self.assertEqual(graph.out_degree("a"), 0)
+
+    def test_add_edge(self):
+        graph = CompactDiGraph()
+        graph.add_edges_from([("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+
+        # Duplicate edges are ignored
+        graph.add_edge("a", "b")
+
+        self.assertEqual(list(graph.nodes), ["a", "b", "c", "d"])
+        self.assertEqual(
+            list(graph.edges), [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+        )
+        self.assertEqual(list(graph.successors("a")), ["b", "c"])
+        self.assertEqual(list(graph.predecessors("d")), ["b", "c"])
+        self.assertEqual(graph.in_degree(), [("a", 0), ("b", 1), ("c", 1), ("d", 2)])
+        self.assertEqual(graph.out_degree(), [("a", 2), ("b", 1), ("c", 1), ("d", 0)])
+
+        sources, targets = graph.edge_ids()
+        npt.assert_array_equal(sources, [0, 0, 1, 2])
+        npt.assert_array_equal(targets, [1, 2, 3, 3])
+
+    def test_add_edge_after_query(self):
+        graph = CompactDiGraph()
+        graph.add_edge("a", "b")
+
+        self.assertEqual(list(graph.successors("a")), ["b"])
+
+        graph.add_edge("c", "a")
+        graph.add_edge("a", "d")
+
+        self.assertEqual(list(graph.successors("a")), ["b", "d"])
+        self.assertEqual(list(graph.predecessors("a")), ["c"])
+        self.assertEqual(graph.number_of_edges(), 3)
+
+    def test_interleave_add_and_query(self):
+        # Pending edges are merged into the CSR arrays now and then
+        graph = CompactDiGraph()
+        graph._min_nr_pending_edges = 4  # pylint: disable=protected-access
+        nx_graph = nx.DiGraph()
+
+        for idx in range(50):
+            for edge in [(idx, idx + 1), (idx // 2, idx + 1), (idx, idx + 1)]:
+                graph.add_edge(*edge)
+                nx_graph.add_edge(*edge)
+
+            self.assertEqual(
+                list(graph.successors(idx)), list(nx_graph.successors(idx))
+            )
+            self.assertEqual(
+                list(graph.predecessors(idx + 1)), list(nx_graph.predecessors(idx + 1))
+            )
+            self.assertEqual(graph.out_degree(idx // 2), nx_graph.out_degree(idx // 2))
+            self.assertEqual(
+                graph.descendants(idx // 2), sorted(nx.descendants(nx_graph, idx // 2))
+            )
+
+        self.assertEqual(list(graph.edges), list(nx_graph.edges))
+        self.assertEqual(graph.number_of_edges(), nx_graph.number_of_edges())
+
+    def test_pickle(self):
+        graph = CompactDiGraph()
+        graph.add_edges_from([("a", "b"), ("b", "c")])
+        self.assertEqual(list(graph.successors("a")), ["b"])
+        graph.add_edge("a", "c")
+
+        graph = pickle.loads(pickle.dumps(graph))
+
+        self.assertEqual(list(graph.successors("a")), ["b", "c"])
+        self.assertEqual(list(graph.edges), [("a", "b"), ("a", "c"), ("b", "c")])
+
+    def test_descendants(self):
+        graph = CompactDiGraph()
+        graph.add_edges_from([("a", "b"), ("b", "c"), ("d", "e"), ("a", "c")])
+
+        self.assertEqual(graph.descendants("a"), ["b", "c"])
+        self.assertEqual(graph.descendants("b"), ["c"])
+        self.assertEqual(graph.descendants("c"), [])
+        self.assertEqual(graph.descendants("d"), ["e"])
+
+    def test_to_networkx(self):
+        graph = CompactDiGraph()
+        graph.add_edges_from([("a", "c"), ("b", "c"), ("a", "b")])
+
+        nx_graph = graph.to_networkx()
+
+        self.assertEqual(list(nx_graph.nodes), list(graph.nodes))
+        self.assertEqual(list(nx_graph.edges), list(graph.edges))
+
+
+class CompactGraphTest(unittest.TestCase):
+    def test_same_as_networkx(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = Action("c")
+        sequences = [(current, a), (current, b), (a, c), (b, c)]
+
+        for compact in [False, True]:
+            sequence_graph = SequenceGraph(sequences, compact=compact)
+            self.assertEqual(sequence_graph.is_compact, compact)
+
+            pathway_graph = sequence_graph_to_pathway_graph(sequence_graph)
+            self.assertEqual(pathway_graph.is_compact, compact)
+
+            pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+            self.assertEqual(pathway_map.is_compact, compact)
+
+        graphs = [
+            sequence_graph_to_pathway_map(SequenceGraph(sequences, compact=compact))
+            for compact in [False, True]
+        ]
+
+        self.assertEqual(graphs[0].nr_nodes(), graphs[1].nr_nodes())
+        self.assertEqual(graphs[0].nr_edges(), graphs[1].nr_edges())
+        self.assertEqual(
+            [[str(node) for node in path] for path in graphs[0].all_paths()],
+            [[str(node) for node in path] for path in graphs[1].all_paths()],
+        )
+        self.assertEqual(str(graphs[0]), str(graphs[1]))
+
+    def test_all_to_nodes_order(self):
+        # Both engines return the nodes in the order in which they were added to the graph,
+        # which differs from the breadth-first order
+        current, a, b, c, d = (
+            ActionNode(Action(name)) for name in ["current", "a", "b", "c", "d"]
+        )
+
+        for compact in [False, True]:
+            sequence_graph = SequenceGraph(compact=compact)
+            sequence_graph.add_sequences([(current, a), (a, b), (current, c), (c, d)])
+
+            self.assertEqual(sequence_graph.all_to_actions(current), [a, b, c, d])
+            self.assertEqual(sequence_graph.all_to_actions(c), [d])
+
+    def test_networkx_copy(self):
+        current, a, b = (ActionNode(Action(name)) for name in ["current", "a", "b"])
+        sequence_graph = SequenceGraph(compact=True)
+        sequence_graph.add_sequence(current, a)
+        graph = sequence_graph.graph
+
+        # The copy is reused until the graph changes
+        self.assertIs(sequence_graph.graph, graph)
+
+        sequence_graph.add_sequence(a, b)
+
+        self.assertIsNot(sequence_graph.graph, graph)
+        self.assertEqual(sequence_graph.graph.number_of_edges(), 2)
@@ -0,0 +1,104 @@
+import unittest
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.graph import (
+    SequenceGraph,
+    sequence_graph_to_pathway_graph,
+    sequence_graph_to_pathway_map,
+)
+
+
+def chain_sequences(nr_actions: int) -> list[tuple[Action, Action]]:
+    actions = [Action(f"{idx}") for idx in range(nr_actions)]
+
+    return list(zip(actions[:-1], actions[1:]))
+
+
+def diamond_sequences(nr_diamonds: int) -> list[tuple[Action, Action]]:
+    # Per diamond, two actions follow the same action, and are both followed by the same action
+    action = Action("0")
+    sequences = []
+
+    for idx in range(nr_diamonds):
+        left = Action(f"{idx}l")
+        right = Action(f"{idx}r")
+        next_action = Action(f"{idx + 1}")
+        sequences += [
+            (action, left),
+            (action, right),
+            (left, next_action),
+            (right, next_action),
+        ]
+        action = next_action
+
+    return sequences
+
+
+class SequenceGraphToPathwayGraphTest(unittest.TestCase):
+    def test_empty(self):
+        progress = []
+        pathway_graph = sequence_graph_to_pathway_graph(
+            SequenceGraph(), progress=progress.append
+        )
+
+        self.assertEqual(pathway_graph.nr_nodes(), 0)
+        self.assertEqual(progress, [0])
+
+    def test_deep_chain(self):
+        # Deeper than the default recursion limit
+        nr_actions = 5000
+        sequence_graph = SequenceGraph(chain_sequences(nr_actions))
+        progress = []
+        pathway_graph = sequence_graph_to_pathway_graph(
+            sequence_graph, progress=progress.append
+        )
+
+        # Action periods and action conversions
+        self.assertEqual(pathway_graph.nr_nodes(), 2 * nr_actions - 1)
+        self.assertEqual(progress, [nr_actions])
+
+        pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+
+        self.assertEqual(pathway_map.nr_nodes(), 2 * nr_actions)
+        self.assertEqual(len(pathway_map.all_paths()), 1)
+
+    def test_diamonds(self):
+        sequence_graph = SequenceGraph(diamond_sequences(2))
+        pathway_graph = sequence_graph_to_pathway_graph(sequence_graph)
+
+        self.assertEqual(
+            [[str(node) for node in path] for path in pathway_graph.all_paths()],
+            [
+                ["0", "0 | 0l", "0l", "0l | 1", "1", "1 | 1l", "1l", "1l | 2", "2"],
+                ["0", "0 | 0l", "0l", "0l | 1", "1", "1 | 1r", "1r", "1r | 2", "2"],
+                ["0", "0 | 0r", "0r", "0r | 1", "1", "1 | 1l", "1l", "1l | 2", "2"],
+                ["0", "0 | 0r", "0r", "0r | 1", "1", "1 | 1r", "1r", "1r | 2", "2"],
+            ],
+        )
+
+    def test_max_nr_action_periods(self):
+        nr_diamonds = 5
+        sequence_graph = SequenceGraph(diamond_sequences(nr_diamonds))
+        pathway_graph = sequence_graph_to_pathway_graph(sequence_graph)
+        nr_action_periods = (pathway_graph.nr_nodes() + 1) // 2
+
+        pathway_graph = sequence_graph_to_pathway_graph(
+            sequence_graph, max_nr_action_periods=nr_action_periods
+        )
+        self.assertEqual(len(pathway_graph.all_paths()), 2**nr_diamonds)
+
+        self.assertRaises(
+            ValueError,
+            sequence_graph_to_pathway_graph,
+            sequence_graph,
+            max_nr_action_periods=nr_action_periods - 1,
+        )
+
+    def test_cycle(self):
+        root = Action("root")
+        a = Action("a")
+        b = Action("b")
+        sequence_graph = SequenceGraph([(root, a), (a, b), (b, a)])
+
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            sequence_graph_to_pathway_graph(sequence_graph)
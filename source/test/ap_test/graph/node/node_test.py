@@ -0,0 +1,90 @@
+import pickle
+import unittest
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.graph.node import Action as ActionNode
+from adaptation_pathways.graph.node import (
+    ActionBegin,
+    ActionConversion,
+    ActionEnd,
+    ActionPeriod,
+    Node,
+)
+
+
+class NodeTest(unittest.TestCase):
+    def test_labels(self):
+        a = Action("a")
+        b = Action("b")
+
+        self.assertEqual(Node("meh").label, "meh")
+        self.assertEqual(Node().label, "")
+        self.assertEqual(ActionNode(a).label, "a")
+        self.assertEqual(ActionBegin(a).label, "[a")
+        self.assertEqual(ActionEnd(a).label, "a]")
+        self.assertEqual(str(ActionPeriod(a)), "a")
+        self.assertEqual(
+            str(ActionConversion(ActionPeriod(a), ActionPeriod(b))), "a | b"
+        )
+        self.assertEqual(
+            repr(ActionConversion(ActionPeriod(a), ActionPeriod(b))),
+            'ActionConversion("a | b")',
+        )
+
+    def test_slots(self):
+        node = ActionBegin(Action("a"))
+
+        self.assertFalse(hasattr(node, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            # pylint: disable-next=assigning-non-slot,attribute-defined-outside-init
+            node.meh = 5
+
+    def test_pickle(self):
+        a = Action("a")
+        b = Action("b")
+        nodes = [
+            Node("meh"),
+            ActionNode(a),
+            ActionBegin(a),
+            ActionEnd(a),
+            ActionPeriod(a),
+            ActionConversion(ActionPeriod(a), ActionPeriod(b)),
+        ]
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for node in nodes:
+                node_we_got = pickle.loads(pickle.dumps(node, protocol=protocol))
+
+                self.assertIs(type(node_we_got), type(node))
+                self.assertEqual(node_we_got.label, node.label)
+                self.assertEqual(
+                    node_we_got.__getstate__().keys(), node.__getstate__().keys()
+                )
+
+        # Labels not formatted yet are not pickled, but formatted after unpickling
+        node = ActionBegin(a)
+
+        self.assertNotIn("_label", node.__getstate__())
+
+        node_we_got = pickle.loads(pickle.dumps(node))
+
+        self.assertNotIn("_label", node_we_got.__getstate__())
+        self.assertEqual(node_we_got.label, "[a")
+        self.assertIn("_label", node_we_got.__getstate__())
+
+        # Nodes sharing an action before pickling share it afterwards
+        begin, end = pickle.loads(pickle.dumps((ActionBegin(a), ActionEnd(a))))
+        self.assertIs(begin.action, end.action)
+
+        # Nodes remain hashable by identity
+        self.assertEqual(len({begin, end, begin}), 2)
+
+    def test_legacy_state(self):
+        # Nodes used to be pickled with their instance dictionary as state
+        a = Action("a")
+        node = ActionBegin.__new__(ActionBegin)
+        node.__setstate__({"_label": "[a", "_action": a})
+
+        self.assertEqual(node.label, "[a")
+        self.assertIs(node.action, a)
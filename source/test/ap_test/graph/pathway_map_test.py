@@ -1,10 +1,12 @@
 import unittest
 
 from adaptation_pathways.action import Action
+from adaptation_pathways.action_combination import ActionCombination
 from adaptation_pathways.graph import (
     PathwayMap,
     SequenceGraph,
     sequence_graph_to_pathway_map,
+    tipping_point_violations,
     verify_tipping_points,
 )
 from adaptation_pathways.graph.node import Action as ActionNode
@@ -50,6 +52,87 @@ class PathwayMapTest(unittest.TestCase):
 
         verify_tipping_points(graph, tipping_point_by_action)
 
+    def test_cached_collections(self):
+        graph = PathwayMap()
+        current = Action("current")
+        a = Action("a")
+        current_begin = ActionBegin(current)
+        current_end = ActionEnd(current)
+        a_begin = ActionBegin(a)
+        a_end = ActionEnd(a)
+
+        graph.add_period(current_begin, current_end)
+
+        self.assertEqual(graph.root_nodes, [current_begin])
+        self.assertEqual(graph.leaf_nodes(), [current_end])
+        self.assertEqual(graph.all_action_begins(), [current_begin])
+        self.assertEqual(graph.all_action_ends(), [current_end])
+        self.assertEqual(graph.actions(), [current])
+        self.assertEqual(graph.all_paths(), [[current_begin, current_end]])
+
+        # Changing the collections returned must not change the cached ones
+        graph.all_action_begins().clear()
+        graph.all_paths()[0].clear()
+
+        self.assertEqual(graph.all_action_begins(), [current_begin])
+        self.assertEqual(graph.all_paths(), [[current_begin, current_end]])
+
+        # Changing the graph must invalidate the cached collections
+        graph.add_conversion(current_end, a_begin)
+        graph.add_period(a_begin, a_end)
+
+        self.assertEqual(graph.root_nodes, [current_begin])
+        self.assertEqual(graph.leaf_nodes(), [a_end])
+        self.assertEqual(graph.all_action_begins(), [current_begin, a_begin])
+        self.assertEqual(graph.all_action_ends(), [current_end, a_end])
+        self.assertEqual(graph.actions(), [current, a])
+        self.assertEqual(
+            graph.all_paths(), [[current_begin, current_end, a_begin, a_end]]
+        )
+
+    def test_continued_actions(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = Action("c")
+        d = ActionCombination("d", [a, b])
+        e = ActionCombination("e", [a, c])
+        sequences = [
+            (current, a),
+            (current, b),
+            (current, c),
+            (a, d),
+            (b, d),
+            (c, e),
+        ]
+
+        for share_prefixes in [False, True]:
+            pathway_map = sequence_graph_to_pathway_map(
+                SequenceGraph(sequences), share_prefixes=share_prefixes
+            )
+
+            self.assertEqual(pathway_map.continued_actions(d), [a, b])
+            self.assertEqual(pathway_map.continued_actions(e), [c])
+            self.assertEqual(
+                pathway_map.continued_actions(ActionCombination("f", [a, b])), []
+            )
+
+    def test_action_ends_by_action(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        sequences = [(current, a), (current, b), (b, a)]
+
+        pathway_map = sequence_graph_to_pathway_map(SequenceGraph(sequences))
+        action_ends = pathway_map.action_ends_by_action(a)
+
+        self.assertEqual(len(action_ends), 2)
+        self.assertTrue(all(action_end.action is a for action_end in action_ends))
+        self.assertEqual(len(pathway_map.action_ends_by_action(current)), 2)
+
+        with self.assertRaises(LookupError):
+            pathway_map.action_ends_by_action(Action("a"))
+
 
 class VerifyTippingPointsTest(unittest.TestCase):
     def test_empty_graph(self):
@@ -125,3 +208,37 @@ class VerifyTippingPointsTest(unittest.TestCase):
         tipping_point_by_action[f] = 2040.0  # All OK now
 
         verify_tipping_points(pathway_map, tipping_point_by_action)
+
+    def test_all_violations(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = Action("c")
+        sequences = [(current, a), (a, b), (a, c), (current, c)]
+
+        tipping_point_by_action = {
+            current: 2030.0,
+            a: 2020.0,  # <-- Tips before current
+            b: 2040.0,
+            c: 2020.0,  # <-- Tips at the same time as a, before current
+        }
+
+        for compact in [False, True]:
+            for share_prefixes in [False, True]:
+                pathway_map = sequence_graph_to_pathway_map(
+                    SequenceGraph(sequences, compact=compact),
+                    share_prefixes=share_prefixes,
+                )
+
+                self.assertCountEqual(
+                    tipping_point_violations(pathway_map, tipping_point_by_action),
+                    [(current, a), (a, c), (current, c)],
+                )
+
+                with self.assertRaises(ValueError) as context:
+                    verify_tipping_points(pathway_map, tipping_point_by_action)
+
+                self.assertEqual(len(str(context.exception).splitlines()), 3)
+
+        with self.assertRaises(KeyError):
+            verify_tipping_points(pathway_map, {current: 2030.0})
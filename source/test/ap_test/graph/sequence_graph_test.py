@@ -12,6 +12,43 @@ class SequenceGraphTest(unittest.TestCase):
         self.assertEqual(graph.nr_actions(), 0)
         self.assertEqual(graph.nr_sequences(), 0)
 
+    def test_add_sequence_batches(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = Action("c")
+        graph = SequenceGraph()
+
+        graph.add_sequence_batches(
+            iter([[(current, a), (current, b)], [], [(a, c), (b, c)]])
+        )
+
+        self.assertEqual(graph.nr_actions(), 4)
+        self.assertEqual(graph.nr_sequences(), 4)
+        self.assertEqual(graph.root_node.action, current)
+        self.assertEqual(
+            [node.action for node in graph.from_actions(graph.leaf_nodes()[0])],
+            [a, b],
+        )
+
+    def test_add_sequence_batches_twice(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+
+        for compact in [False, True]:
+            graph = SequenceGraph([(current, a)], compact=compact)
+
+            # Actions already in the graph are associated with their existing node
+            graph.add_sequence_batches([[(current, b)], [(a, b)]])
+            graph.add_sequence_batches([[(current, b)]])
+
+            self.assertEqual(graph.nr_actions(), 3)
+            self.assertEqual(graph.nr_sequences(), 3)
+            self.assertEqual(
+                [node.action for node in graph.to_actions(graph.root_node)], [a, b]
+            )
+
     def test_root_node(self):
         graph = SequenceGraph()
         current = ActionNode(Action("current"))
@@ -23,3 +60,102 @@ class SequenceGraphTest(unittest.TestCase):
         self.assertEqual(graph.root_node, current)
         self.assertEqual(graph.nr_from_actions(current), 0)
         self.assertEqual(graph.nr_to_actions(current), 0)
+
+    def test_from_actions(self):
+        graph = SequenceGraph()
+        current = ActionNode(Action("current"))
+        a = ActionNode(Action("a"))
+        b = ActionNode(Action("b"))
+        c = ActionNode(Action("c"))
+
+        graph.add_sequences([(current, a), (current, b), (a, c), (b, c)])
+
+        self.assertEqual(graph.from_actions(current), [])
+        self.assertEqual(graph.from_actions(a), [current])
+        self.assertEqual(graph.from_actions(b), [current])
+        self.assertCountEqual(graph.from_actions(c), [a, b])
+        self.assertEqual(graph.nr_from_actions(c), 2)
+
+    def test_iter_paths(self):
+        graph = SequenceGraph()
+        current = ActionNode(Action("current"))
+        a = ActionNode(Action("a"))
+        b = ActionNode(Action("b"))
+        c = ActionNode(Action("c"))
+
+        graph.add_sequences([(current, a), (a, b), (current, c)])
+
+        self.assertEqual(list(graph.iter_paths()), [[current, a, b], [current, c]])
+        self.assertEqual(list(graph.iter_paths()), graph.all_paths())
+        self.assertEqual(list(graph.iter_paths(max_nr_paths=1)), [[current, a, b]])
+        self.assertEqual(list(graph.iter_paths(max_nr_paths=0)), [])
+        self.assertEqual(list(graph.iter_paths(max_depth=1)), [[current, c]])
+        self.assertEqual(
+            list(graph.iter_paths(max_depth=2)), [[current, a, b], [current, c]]
+        )
+
+    def test_path_statistics(self):
+        current = ActionNode(Action("current"))
+        a = ActionNode(Action("a"))
+        b = ActionNode(Action("b"))
+        c = ActionNode(Action("c"))
+        d = ActionNode(Action("d"))
+
+        for compact in [False, True]:
+            graph = SequenceGraph(compact=compact)
+            graph.add_sequences(
+                [(current, a), (current, b), (a, c), (b, c), (current, d)]
+            )
+            statistics = graph.path_statistics()
+
+            self.assertEqual(statistics.nr_paths, len(graph.all_paths()))
+            self.assertEqual(statistics.nr_paths, 3)
+            self.assertEqual(statistics.nr_paths_by_depth, {1: 1, 2: 2})
+            self.assertEqual(
+                statistics.nr_paths_by_node, {current: 3, a: 1, b: 1, c: 2, d: 1}
+            )
+            self.assertEqual(
+                graph.nr_occurrences_by_action_name(statistics),
+                {"current": 3, "a": 1, "b": 1, "c": 2, "d": 1},
+            )
+
+    def test_path_statistics_empty(self):
+        graph = SequenceGraph()
+        statistics = graph.path_statistics()
+
+        self.assertEqual(statistics.nr_paths, 0)
+        self.assertEqual(statistics.nr_paths_by_depth, {})
+        self.assertEqual(statistics.nr_paths_by_node, {})
+
+        current = ActionNode(Action("current"))
+        graph.add_action(current)
+        statistics = graph.path_statistics()
+
+        self.assertEqual(statistics.nr_paths, len(graph.all_paths()))
+        self.assertEqual(statistics.nr_paths_by_node, {current: 0})
+
+    def test_path_statistics_cycle(self):
+        graph = SequenceGraph()
+        current = ActionNode(Action("current"))
+        a = ActionNode(Action("a"))
+        b = ActionNode(Action("b"))
+
+        graph.add_sequences([(current, a), (a, b), (b, a)])
+
+        self.assertRaises(ValueError, graph.path_statistics)
+
+    def test_edge_ids(self):
+        current = ActionNode(Action("current"))
+        a = ActionNode(Action("a"))
+        b = ActionNode(Action("b"))
+        c = ActionNode(Action("c"))
+
+        for compact in [False, True]:
+            graph = SequenceGraph(compact=compact)
+            graph.add_sequences([(current, a), (a, b), (current, c)])
+
+            nodes, from_ids, to_ids = graph.edge_ids()
+
+            self.assertEqual(nodes, [current, a, b, c])
+            self.assertEqual(from_ids.tolist(), [0, 0, 1])
+            self.assertEqual(to_ids.tolist(), [1, 3, 2])
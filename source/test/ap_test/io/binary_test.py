@@ -1,10 +1,15 @@
 import random
+import sqlite3
 import unittest
 
 from adaptation_pathways import alias
 from adaptation_pathways.action import Action
+from adaptation_pathways.action_combination import ActionCombination
 from adaptation_pathways.io import binary
-from adaptation_pathways.plot.colour import default_action_colours
+from adaptation_pathways.plot.colour import (
+    default_action_colours,
+    default_node_colour,
+)
 
 from .. import test_data
 
@@ -142,6 +147,175 @@ class SQLiteTest(unittest.TestCase):
             overwrite=False,
         )
 
+    def test_bulk(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        actions = [current, a, b]
+        sequences = [(current, a), (a, b)]
+        tipping_point_by_action = {current: 2020, a: 2030, b: 2040}
+        colour_by_action_name = {
+            action.name: colour
+            for action, colour in zip(actions, default_action_colours(len(actions)))
+        }
+
+        for bulk in [False, True]:
+            database_path = f"test_bulk_{bulk}.db"
+            binary.write_dataset(
+                actions,
+                sequences,
+                tipping_point_by_action,
+                colour_by_action_name,
+                database_path,
+                bulk=bulk,
+            )
+            self.compare_data(
+                *zip(
+                    binary.read_dataset(database_path),
+                    (
+                        actions,
+                        sequences,
+                        tipping_point_by_action,
+                        colour_by_action_name,
+                    ),
+                )
+            )
+
+    def test_update(self):
+        database_path = "test_update.db"
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        actions = [current, a, b]
+        sequences = [(current, a), (a, b)]
+        tipping_point_by_action = {current: 2020, a: 2030, b: 2040}
+        red = (1.0, 0.0, 0.0, 1.0)
+        green = (0.0, 1.0, 0.0, 1.0)
+        colour_by_action_name = {action.name: red for action in actions}
+
+        self.assertRaises(
+            RuntimeError,
+            binary.update_dataset,
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            "does_not_exist.db",
+        )
+
+        binary.write_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            database_path,
+        )
+
+        # Nothing changed
+        changes = binary.update_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            database_path,
+        )
+        self.assertFalse(changes.has_changes())
+
+        # Change a tipping point and a colour
+        tipping_point_by_action[b] = 2045
+        colour_by_action_name["a"] = green
+        changes = binary.update_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            database_path,
+        )
+        self.assertTrue(changes.has_changes())
+        self.assertEqual(
+            changes,
+            binary.DatasetChanges(
+                changed_colours=["a"], changed_tipping_points=[("b", 2040, 2045)]
+            ),
+        )
+        self.compare_data(
+            *zip(
+                binary.read_dataset(database_path),
+                (actions, sequences, tipping_point_by_action, colour_by_action_name),
+            )
+        )
+
+        # Replace action b by a second edition of action a, and by a combination of the two
+        # editions of a
+        a2 = Action("a")
+        c = ActionCombination("c", [current, a])
+        actions = [current, a, c]
+        sequences = [(current, a), (a, a2), (a2, c)]
+        tipping_point_by_action = {current: 2020, a: 2030, a2: 2050, c: 2060}
+        colour_by_action_name = {"current": red, "a": green, "c": red}
+        changes = binary.update_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            colour_by_action_name,
+            database_path,
+        )
+        self.assertEqual(
+            changes,
+            binary.DatasetChanges(
+                added_actions=["c"],
+                removed_actions=["b"],
+                added_sequences=[("a", "a"), ("a", "c")],
+                removed_sequences=[("a", "b")],
+            ),
+        )
+
+        actions_we_got, sequences_we_got, tipping_points_we_got, colours_we_got = (
+            binary.read_dataset(database_path)
+        )
+        self.compare_data(
+            (actions_we_got, actions),
+            (sequences_we_got, sequences),
+            (tipping_points_we_got, tipping_point_by_action),
+            (colours_we_got, colour_by_action_name),
+        )
+        self.assertIsNot(sequences_we_got[0][1], sequences_we_got[1][1])
+        self.assertIs(sequences_we_got[1][1], sequences_we_got[2][0])
+        self.assertEqual(
+            [action.name for action in actions_we_got[2].actions], ["current", "a"]
+        )
+
+    def test_missing_colour(self):
+        database_path = "test_missing_colour.db"
+        current = Action("current")
+        a = Action("a")
+        colour = (0.1, 0.2, 0.3, 0.4)
+
+        binary.write_dataset(
+            [current, a],
+            [(current, a)],
+            {current: 2020, a: 2030},
+            {"current": colour, "a": colour},
+            database_path,
+        )
+
+        connection = sqlite3.connect(database_path)
+
+        with connection:
+            connection.execute("DELETE FROM plot WHERE action_id = 1")
+
+        # The edition index is used for looking up sequences by edition
+        self.assertIn(
+            ("index", "sequence_edition_index"),
+            list(connection.execute("SELECT type, name FROM sqlite_master")),
+        )
+        connection.close()
+
+        _, _, _, colour_by_action_name = binary.read_dataset(database_path)
+
+        self.assertEqual(list(colour_by_action_name), ["current", "a"])
+        self.assertEqual(colour_by_action_name["a"], default_node_colour())
+
     def test_encoding(self):
         database_path = "tesт_sævè_æß.db"
         current = Action("çürr€ñt")
@@ -200,3 +374,121 @@ class SQLiteTest(unittest.TestCase):
         database_path = "test_use_case_02_pathway.db"
         actions, sequences = test_data.use_case_02_pathway()
         self._test_round_trip(database_path, actions, sequences)
+
+
+class BinaryDatasetTest(unittest.TestCase):
+    def setUp(self):
+        self.database_path = "test_binary_dataset.db"
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = ActionCombination("c", [a, b])
+        d = Action("d")
+        e = Action("e")
+        a2 = Action("a")
+        actions = [current, a, b, c, d, e]
+        sequences = [(current, a), (current, b), (a, c), (b, a2), (a2, d)]
+        tipping_point_by_action = {
+            current: 2000,
+            a: 2010,
+            b: 2020,
+            c: 2030,
+            a2: 2040,
+            d: 2050,
+        }
+        colours = list(default_action_colours(len(actions)))
+        self.colour_by_action_name = {
+            action.name: colours[idx] for idx, action in enumerate(actions)
+        }
+
+        binary.write_dataset(
+            actions,
+            sequences,
+            tipping_point_by_action,
+            self.colour_by_action_name,
+            self.database_path,
+        )
+
+    def test_queries(self):
+        with binary.BinaryDataset(self.database_path) as dataset:
+            self.assertEqual(dataset.nr_actions(), 6)
+            self.assertEqual(dataset.nr_sequences(), 5)
+            self.assertEqual(
+                dataset.action_names(), ["current", "a", "b", "c", "d", "e"]
+            )
+            self.assertEqual(dataset.tipping_point_range(), (2000, 2050))
+
+            root_edition_id = dataset.root_edition()
+            self.assertEqual(dataset.action_name(root_edition_id), "current")
+            self.assertEqual(dataset.tipping_point(root_edition_id), 2000)
+            self.assertEqual(len(dataset.editions("a")), 2)
+            self.assertEqual(dataset.editions("e"), [])
+            self.assertRaises(ValueError, dataset.action_name, 100)
+
+            self.assertEqual(
+                [
+                    (record.to_action_name, record.tipping_point)
+                    for record in dataset.sequences_from("a")
+                ],
+                [("c", 2030), ("d", 2050)],
+            )
+
+            records = dataset.children(root_edition_id)
+            self.assertEqual([record.to_action_name for record in records], ["a", "b"])
+            self.assertEqual(
+                dataset.children(records[0].to_edition_id)[0].tipping_point, 2030
+            )
+
+            b_edition_id = records[1].to_edition_id
+            self.assertEqual(
+                [
+                    (record.from_action_name, record.to_action_name)
+                    for record in dataset.subtree(b_edition_id)
+                ],
+                [("b", "a"), ("a", "d")],
+            )
+            self.assertEqual(
+                len(dataset.subtree(root_edition_id)), dataset.nr_sequences()
+            )
+
+    def test_read_subtree(self):
+        with binary.BinaryDataset(self.database_path) as dataset:
+            b_edition_id = dataset.editions("b")[0]
+            actions, sequences, tipping_point_by_action, colour_by_action_name = (
+                dataset.read_subtree(b_edition_id)
+            )
+
+            self.assertRaises(ValueError, dataset.read_subtree, 100)
+
+        self.assertEqual([action.name for action in actions], ["a", "b", "d"])
+        self.assertEqual(
+            [(sequence[0].name, sequence[1].name) for sequence in sequences],
+            [("b", "a"), ("a", "d")],
+        )
+        self.assertEqual(
+            [
+                (action.name, tipping_point)
+                for action, tipping_point in tipping_point_by_action.items()
+            ],
+            [("b", 2020), ("a", 2040), ("d", 2050)],
+        )
+        self.assertEqual(
+            colour_by_action_name,
+            {name: self.colour_by_action_name[name] for name in ["a", "b", "d"]},
+        )
+
+        # The whole dataset
+        with binary.BinaryDataset(self.database_path) as dataset:
+            self.assertEqual(
+                [
+                    (sequence[0].name, sequence[1].name)
+                    for sequence in dataset.read_subtree(dataset.root_edition())[1]
+                ],
+                [
+                    (sequence[0].name, sequence[1].name)
+                    for sequence in binary.read_dataset(self.database_path)[1]
+                ],
+            )
+
+    def test_does_not_exist(self):
+        self.assertRaises(RuntimeError, binary.BinaryDataset, "does_not_exist.db")
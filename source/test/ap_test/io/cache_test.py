@@ -0,0 +1,183 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.graph import SequenceGraph
+from adaptation_pathways.io import binary, text
+from adaptation_pathways.io.cache import Cache, dataset_key, dataset_paths
+from adaptation_pathways.plot.colour import default_action_colours
+
+
+def dataset(nr_actions: int):
+    actions = [Action(f"action_{idx}") for idx in range(nr_actions)]
+    sequences = list(zip(actions[:-1], actions[1:]))
+    tipping_point_by_action = {action: 2000 + idx for idx, action in enumerate(actions)}
+    colour_by_action_name = {
+        action.name: colour
+        for action, colour in zip(actions, default_action_colours(nr_actions))
+    }
+
+    return actions, sequences, tipping_point_by_action, colour_by_action_name
+
+
+class CacheTest(unittest.TestCase):
+    def test_store_load(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            cache = Cache(Path(directory_pathname) / "cache")
+
+            self.assertEqual(len(cache), 0)
+            self.assertNotIn("a", cache)
+            self.assertRaises(KeyError, cache.load, "a")
+
+            cache.store("a", [1, 2, 3])
+
+            self.assertEqual(len(cache), 1)
+            self.assertIn("a", cache)
+            self.assertEqual(cache.load("a"), [1, 2, 3])
+            self.assertGreater(cache.size(), 0)
+
+            cache.store("a", [4])
+            self.assertEqual(cache.load("a"), [4])
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.size(), 0)
+
+    def test_load_or_create(self):
+        nr_calls = 0
+
+        def create():
+            nonlocal nr_calls
+            nr_calls += 1
+            return "value"
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            cache = Cache(directory_pathname)
+
+            self.assertEqual(cache.load_or_create("a", create), "value")
+            self.assertEqual(cache.load_or_create("a", create), "value")
+            self.assertEqual(nr_calls, 1)
+
+    def test_corrupt_value(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            cache = Cache(directory_pathname)
+            cache.store("a", list(range(100)))
+
+            path = Path(directory_pathname) / "a.pickle"
+            path.write_bytes(path.read_bytes()[:10])
+
+            self.assertRaises(KeyError, cache.load, "a")
+            self.assertNotIn("a", cache)
+
+    def test_eviction(self):
+        value = bytes(1000)
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            cache = Cache(directory_pathname)
+            cache.store("a", value)
+            size = cache.size()
+
+            cache = Cache(directory_pathname, max_size=3 * size)
+            cache.store("b", value)
+            cache.store("c", value)
+
+            # Make the first value the most recently used one
+            for idx, key in enumerate(["b", "c", "a"]):
+                os.utime(Path(directory_pathname) / f"{key}.pickle", ns=(idx, idx))
+
+            cache.store("d", value)
+
+            self.assertLessEqual(cache.size(), 3 * size)
+            self.assertIn("a", cache)
+            self.assertNotIn("b", cache)
+            self.assertIn("c", cache)
+            self.assertIn("d", cache)
+
+            # A value larger than the maximum size is not kept
+            cache = Cache(directory_pathname, max_size=size - 1)
+            cache.store("e", value)
+            self.assertEqual(len(cache), 0)
+
+        self.assertRaises(ValueError, Cache, directory_pathname, max_size=-1)
+
+    def test_shared_instances(self):
+        actions, sequences, tipping_point_by_action, colour_by_action_name = dataset(5)
+        sequence_graph = SequenceGraph(sequences)
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            cache = Cache(directory_pathname)
+            cache.store(
+                "a",
+                (
+                    (
+                        actions,
+                        sequences,
+                        tipping_point_by_action,
+                        colour_by_action_name,
+                    ),
+                    sequence_graph,
+                ),
+            )
+            (actions, sequences, tipping_point_by_action, _), sequence_graph = (
+                cache.load("a")
+            )
+
+        # Actions in the sequences, tipping points and graph are the same instances
+        self.assertIs(sequences[0][0], actions[0])
+        self.assertEqual(tipping_point_by_action[actions[4]], 2004)
+        self.assertIs(sequence_graph.root_node.action, actions[0])
+        self.assertEqual(sequence_graph.nr_nodes(), 5)
+
+
+class DatasetKeyTest(unittest.TestCase):
+    def test_text_dataset(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            basename_pathname = os.path.join(directory_pathname, "dataset")
+            text.write_dataset(*dataset(3), basename_pathname)
+
+            self.assertEqual(
+                dataset_paths(basename_pathname),
+                [
+                    text.format_actions_path(basename_pathname),
+                    text.format_sequences_path(basename_pathname),
+                ],
+            )
+
+            key = dataset_key(basename_pathname, "product")
+            self.assertEqual(dataset_key(basename_pathname, "product"), key)
+            self.assertNotEqual(dataset_key(basename_pathname, "other_product"), key)
+
+            # Same contents, different location
+            other_basename_pathname = os.path.join(directory_pathname, "other")
+            text.write_dataset(*dataset(3), other_basename_pathname)
+            self.assertEqual(dataset_key(other_basename_pathname, "product"), key)
+
+            text.write_dataset(*dataset(4), basename_pathname)
+            self.assertNotEqual(dataset_key(basename_pathname, "product"), key)
+
+    def test_binary_dataset(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            basename_pathname = os.path.join(directory_pathname, "dataset")
+            binary.write_dataset(*dataset(3), basename_pathname)
+
+            self.assertEqual(
+                dataset_paths(basename_pathname),
+                [binary.normalize_database_path(basename_pathname)],
+            )
+
+            key = dataset_key(basename_pathname, "product")
+            self.assertEqual(dataset_key(f"{basename_pathname}.apw", "product"), key)
+
+            binary.write_dataset(*dataset(4), basename_pathname)
+            self.assertNotEqual(dataset_key(basename_pathname, "product"), key)
+
+    def test_missing_dataset(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            basename_pathname = os.path.join(directory_pathname, "dataset")
+
+            self.assertEqual(
+                dataset_key(basename_pathname, "product"),
+                dataset_key(basename_pathname, "product"),
+            )
@@ -0,0 +1,160 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.io import columnar
+from adaptation_pathways.plot.colour import default_action_colours
+
+from .. import test_data
+
+
+def dataset(actions, sequences):
+    tipping_point_by_action: dict[Action, float] = {}
+
+    if len(sequences) > 0:
+        to_actions = {sequence[1] for sequence in sequences}
+        root_action = next(
+            sequence[0] for sequence in sequences if sequence[0] not in to_actions
+        )
+        tipping_point_by_action[root_action] = 2000.0
+
+        for idx, sequence in enumerate(sequences):
+            tipping_point_by_action[sequence[1]] = 2010.0 + idx
+
+    colours = list(default_action_colours(len(actions)))
+    colour_by_action_name = {
+        action.name: colours[idx] for idx, action in enumerate(actions)
+    }
+
+    return actions, sequences, tipping_point_by_action, colour_by_action_name
+
+
+class ColumnarTest(unittest.TestCase):
+    def compare_datasets(self, dataset_we_got, dataset_we_want):
+        actions, sequences, tipping_point_by_action, colour_by_action_name = (
+            dataset_we_got
+        )
+
+        self.assertEqual(
+            [(type(action), action.name) for action in actions],
+            [(type(action), action.name) for action in dataset_we_want[0]],
+        )
+        self.assertEqual(
+            [
+                (type(from_action), from_action.name, to_action.name)
+                for from_action, to_action in sequences
+            ],
+            [
+                (type(from_action), from_action.name, to_action.name)
+                for from_action, to_action in dataset_we_want[1]
+            ],
+        )
+        self.assertEqual(
+            [
+                (action.name, tipping_point)
+                for action, tipping_point in tipping_point_by_action.items()
+            ],
+            [
+                (action.name, tipping_point)
+                for action, tipping_point in dataset_we_want[2].items()
+            ],
+        )
+        self.assertEqual(colour_by_action_name, dataset_we_want[3])
+
+        # Editions of the same action are different instances
+        self.assertEqual(
+            len({id(action) for sequence in sequences for action in sequence}),
+            len({id(action) for sequence in dataset_we_want[1] for action in sequence}),
+        )
+
+    def _test_round_trip(self, actions, sequences):
+        dataset_we_want = dataset(actions, sequences)
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            dataset_path = Path(directory_pathname) / "dataset"
+            self.assertFalse(columnar.dataset_exists(dataset_path))
+
+            columnar.write_dataset(*dataset_we_want, dataset_path)
+            self.assertTrue(columnar.dataset_exists(dataset_path))
+            self.assertTrue((Path(directory_pathname) / "dataset.apc").is_dir())
+
+            self.compare_datasets(columnar.read_dataset(dataset_path), dataset_we_want)
+
+    def test_empty(self):
+        self._test_round_trip([], [])
+
+    def test_serial_pathway(self):
+        self._test_round_trip(*test_data.serial_pathway())
+
+    def test_diverging_pathway(self):
+        self._test_round_trip(*test_data.diverging_pathway())
+
+    def test_converging_pathway(self):
+        self._test_round_trip(*test_data.converging_pathway())
+
+    def test_action_combination_pathways(self):
+        self._test_round_trip(*test_data.action_combination_01_actions())
+        self._test_round_trip(*test_data.action_combination_01_pathway())
+        self._test_round_trip(*test_data.action_combination_02_pathway())
+        self._test_round_trip(*test_data.action_combination_03_pathway())
+
+    def test_use_case_pathways(self):
+        self._test_round_trip(*test_data.use_case_01_pathway())
+        self._test_round_trip(*test_data.use_case_02_pathway())
+
+    def test_columns(self):
+        actions, sequences = test_data.serial_pathway()
+        dataset_ = dataset(actions, sequences)
+
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            dataset_path = Path(directory_pathname) / "dataset"
+            columnar.write_dataset(*dataset_, dataset_path)
+
+            self.assertRaises(
+                RuntimeError,
+                columnar.write_dataset,
+                *dataset_,
+                dataset_path,
+                overwrite=False,
+            )
+
+            columns = columnar.read_columns(dataset_path)
+
+            self.assertIsInstance(columns.sequence_tipping_point, np.memmap)
+            self.assertEqual(columns.nr_actions, len(actions))
+            self.assertEqual(columns.nr_editions, len(actions))
+            self.assertEqual(columns.nr_sequences, len(sequences))
+            self.assertEqual(
+                columns.action_name.tolist(), [action.name for action in actions]
+            )
+            self.assertEqual(columns.sequence_from_edition_id.tolist(), [0, 0, 1, 2])
+            self.assertEqual(columns.sequence_to_edition_id.tolist(), [0, 1, 2, 3])
+            self.assertEqual(
+                columns.edition_tipping_point().tolist(),
+                [2000.0, 2010.0, 2011.0, 2012.0],
+            )
+            self.assertEqual(columns.tipping_point_violations().tolist(), [])
+
+            self.assertNotIsInstance(
+                columnar.read_columns(dataset_path, mmap=False).action_name, np.memmap
+            )
+
+        self.assertRaises(RuntimeError, columnar.read_columns, dataset_path)
+
+    def test_tipping_point_violations(self):
+        actions, sequences = test_data.diverging_pathway()
+        dataset_ = dataset(actions, sequences)
+        tipping_point_by_action = dataset_[2]
+
+        # Equal and decreasing tipping points are violations
+        tipping_point_by_action[sequences[1][1]] = tipping_point_by_action[
+            sequences[1][0]
+        ]
+        tipping_point_by_action[sequences[2][1]] = 1990.0
+
+        columns = columnar.to_columns(*dataset_)
+
+        self.assertEqual(columns.tipping_point_violations().tolist(), [2, 3])
@@ -0,0 +1,132 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from adaptation_pathways.action import Action
+from adaptation_pathways.io import binary
+from adaptation_pathways.io.store import (
+    ConnectionPool,
+    DatasetStore,
+    DirectoryStore,
+    FileStore,
+)
+from adaptation_pathways.plot.colour import default_action_colours
+
+
+def dataset(nr_actions: int):
+    actions = [Action(f"action_{idx}") for idx in range(nr_actions)]
+    sequences = list(zip(actions[:-1], actions[1:]))
+    tipping_point_by_action = {action: 2000 + idx for idx, action in enumerate(actions)}
+    colour_by_action_name = {
+        action.name: colour
+        for action, colour in zip(actions, default_action_colours(nr_actions))
+    }
+
+    return actions, sequences, tipping_point_by_action, colour_by_action_name
+
+
+class StoreTest(unittest.TestCase):
+    def compare_datasets(self, dataset_we_got, dataset_we_want):
+        actions, sequences, tipping_point_by_action, colour_by_action_name = (
+            dataset_we_got
+        )
+
+        self.assertEqual(
+            [action.name for action in actions],
+            [action.name for action in dataset_we_want[0]],
+        )
+        self.assertEqual(
+            [(sequence[0].name, sequence[1].name) for sequence in sequences],
+            [(sequence[0].name, sequence[1].name) for sequence in dataset_we_want[1]],
+        )
+        self.assertEqual(
+            [
+                (action.name, tipping_point)
+                for action, tipping_point in tipping_point_by_action.items()
+            ],
+            [
+                (action.name, tipping_point)
+                for action, tipping_point in dataset_we_want[2].items()
+            ],
+        )
+        self.assertEqual(colour_by_action_name, dataset_we_want[3])
+
+    def _test_store(self, store):
+        dataset_by_name = {f"dataset_{idx}": dataset(idx + 2) for idx in range(5)}
+
+        with store:
+            self.assertEqual(store.names(), [])
+            self.assertNotIn("dataset_0", store)
+
+            store.write_many(dataset_by_name)
+
+            self.assertEqual(store.names(), sorted(dataset_by_name))
+            self.assertIn("dataset_0", store)
+
+            datasets_we_got = store.read_many(["dataset_3", "dataset_1"])
+            self.assertEqual(list(datasets_we_got), ["dataset_3", "dataset_1"])
+
+            for name, dataset_we_got in datasets_we_got.items():
+                self.compare_datasets(dataset_we_got, dataset_by_name[name])
+
+            # Overwrite a dataset, after it has been read
+            store.write("dataset_1", dataset_by_name["dataset_4"])
+            self.compare_datasets(store.read("dataset_1"), dataset_by_name["dataset_4"])
+            self.assertEqual(len(store.names()), 5)
+
+            self.assertRaises(RuntimeError, store.read, "does_not_exist")
+
+    def test_directory_store(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            directory_path = Path(directory_pathname) / "store"
+            self._test_store(DirectoryStore(directory_path, max_nr_connections=2))
+
+            # Each dataset is stored in a regular binary formatted file
+            self.compare_datasets(
+                binary.read_dataset(directory_path / "dataset_2.apw"), dataset(4)
+            )
+
+            with DirectoryStore(directory_path) as store:
+                self.assertRaises(ValueError, store.read, "../dataset_2")
+                self.assertNotIn("../dataset_2", store)
+
+    def test_file_store(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            database_path = Path(directory_pathname) / "store.db"
+            self._test_store(FileStore(database_path))
+
+            # Reopen the store
+            with FileStore(database_path) as store:
+                self.assertEqual(len(store.names()), 5)
+                self.compare_datasets(store.read("dataset_2"), dataset(4))
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            DatasetStore()  # pylint: disable=abstract-class-instantiated
+
+    def test_connection_pool(self):
+        with tempfile.TemporaryDirectory() as directory_pathname:
+            paths = [Path(directory_pathname) / f"{idx}.apw" for idx in range(3)]
+
+            for path in paths:
+                binary.write_dataset(*dataset(2), path)
+
+            pool = ConnectionPool(2)
+            connection = pool.connection(paths[0])
+
+            self.assertIs(pool.connection(paths[0]), connection)
+            pool.connection(paths[1])
+            pool.connection(paths[0])
+            pool.connection(paths[2])
+
+            # The least recently used connection was closed
+            self.assertEqual(len(pool), 2)
+            self.assertIs(pool.connection(paths[0]), connection)
+
+            pool.discard(paths[0])
+            self.assertEqual(len(pool), 1)
+            self.assertIsNot(pool.connection(paths[0]), connection)
+
+            pool.close()
+            self.assertEqual(len(pool), 0)
+            self.assertRaises(ValueError, ConnectionPool, 0)
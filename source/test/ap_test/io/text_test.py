@@ -1,5 +1,9 @@
+import gzip
+import lzma
+import tempfile
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
+from pathlib import Path
 
 from adaptation_pathways.action import Action
 from adaptation_pathways.action_combination import ActionCombination
@@ -354,3 +358,99 @@ class TextTest(unittest.TestCase):
         self.assertEqual(tipping_point_by_action[sequences[0][1]], 2030)
         self.assertEqual(tipping_point_by_action[sequences[1][1]], 2040)
         self.assertEqual(tipping_point_by_action[sequences[2][1]], 2050)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "Cannot parse action: a b"):
+            text.read_actions(StringIO("a b"))
+
+        with self.assertRaisesRegex(ValueError, "Action a already defined"):
+            text.read_actions(StringIO("a\na"))
+
+        with self.assertRaisesRegex(ValueError, "Unknown action b"):
+            text.read_actions(StringIO("a\nc(a & b)"))
+
+        actions = [Action("current"), Action("a"), Action("a")]
+
+        with self.assertRaisesRegex(ValueError, "Cannot parse sequence: current"):
+            text.read_sequences(StringIO("current"), actions)
+
+        # Unknown action
+        with self.assertRaisesRegex(ValueError, "Action b from sequence must occur"):
+            text.read_sequences(StringIO("current current\ncurrent b"), actions)
+
+        # Action defined more than once
+        with self.assertRaisesRegex(ValueError, "Action a from sequence must occur"):
+            text.read_sequences(StringIO("current current\ncurrent a"), actions)
+
+        with self.assertRaisesRegex(ValueError, "Found tipping point 2040"):
+            text.read_sequences(
+                StringIO("current current\ncurrent a 2030\ncurrent a 2040"),
+                actions[:2],
+            )
+
+        with self.assertRaisesRegex(ValueError, "Exactly one sequence must relate"):
+            text.read_sequences(StringIO("current a"), actions[:2])
+
+    def test_iter_sequences(self):
+        actions, _ = text.read_actions(StringIO("current\na\nb\nc"))
+        contents = """
+            current current 2020
+            current a 2030
+            # comment
+            a b 2040
+            b c 2050
+            """
+
+        batches = list(text.iter_sequences(StringIO(contents), actions, batch_size=2))
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(
+            [[(s[0].name, s[1].name) for s in sequences] for sequences, _ in batches],
+            [[("current", "a")], [("a", "b"), ("b", "c")]],
+        )
+        self.assertEqual(
+            [
+                [(a.name, tp) for a, tp in tipping_point_by_action.items()]
+                for _, tipping_point_by_action in batches
+            ],
+            [[("current", 2020), ("a", 2030)], [("b", 2040), ("c", 2050)]],
+        )
+
+        # Actions are shared between batches
+        self.assertIs(batches[0][0][0][1], batches[1][0][0][0])
+
+        sequences, tipping_point_by_action = text.read_sequences(
+            StringIO(contents), actions
+        )
+
+        self.assertEqual(
+            [(s[0].name, s[1].name) for s in sequences],
+            [("current", "a"), ("a", "b"), ("b", "c")],
+        )
+        self.assertEqual(len(tipping_point_by_action), 4)
+
+        with self.assertRaisesRegex(ValueError, "Batch size must be positive"):
+            list(text.iter_sequences(StringIO(contents), actions, batch_size=0))
+
+    def test_compressed(self):
+        contents = b"current current 2020\ncurrent a 2030\n"
+        actions = [Action("current"), Action("a")]
+
+        for compress in [lambda contents: contents, gzip.compress, lzma.compress]:
+            compressed_contents = compress(contents)
+
+            sequences, tipping_point_by_action = text.read_sequences(
+                BytesIO(compressed_contents), actions
+            )
+
+            self.assertEqual(len(sequences), 1)
+            self.assertEqual(sorted(tipping_point_by_action.values()), [2020, 2030])
+
+            with tempfile.TemporaryDirectory() as directory_pathname:
+                path = Path(directory_pathname) / "dataset-sequence.txt"
+                path.write_bytes(compressed_contents)
+
+                sequences, tipping_point_by_action = text.read_sequences(path, actions)
+
+            self.assertEqual(len(sequences), 1)
+            self.assertEqual(sorted(tipping_point_by_action.values()), [2020, 2030])
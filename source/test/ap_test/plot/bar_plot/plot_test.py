@@ -4,6 +4,7 @@ from io import StringIO
 
 import matplotlib.pyplot as plt
 
+from adaptation_pathways.action import Action
 from adaptation_pathways.graph import (
     PathwayMap,
     SequenceGraph,
@@ -112,3 +113,28 @@ class PlotBarsTest(unittest.TestCase):
 
         # self.assertSequenceEqual(labels, ["c", "b", "a"])
         self.assertSequenceEqual(y_coordinates, [0, 1, 2])
+
+    def test_converging_paths(self):
+        current = Action("current")
+        a = Action("a")
+        b = Action("b")
+        c = Action("c")
+
+        # Both paths end in the same action instance
+        sequence_graph = SequenceGraph([(current, a), (current, b), (a, c), (b, c)])
+        pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+        tipping_point_by_action = {current: 2030, a: 2040, b: 2050, c: 2060}
+
+        _, axes = plt.subplots(layout="constrained")
+
+        plot_bars(axes, pathway_map, tipping_point_by_action=tipping_point_by_action)
+
+        y_coordinates = [label.get_position()[1] for label in axes.get_yticklabels()]
+
+        self.assertSequenceEqual(y_coordinates, [0, 1])
+        self.assertSequenceEqual(
+            sorted(
+                {patch.get_y() + 0.5 * patch.get_height() for patch in axes.patches}
+            ),
+            [0, 1],
+        )
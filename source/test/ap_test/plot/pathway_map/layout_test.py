@@ -25,7 +25,7 @@ from adaptation_pathways.plot.util import action_level_by_first_occurrence
 
 
 def configure_pathway_map(
-    actions_str: str, sequences_str: str
+    actions_str: str, sequences_str: str, *, share_prefixes: bool = False
 ) -> tuple[PathwayMap, dict[str, typing.Any]]:
     actions, _ = read_actions(StringIO(actions_str))
     sequences, tipping_point_by_action = read_sequences(
@@ -33,7 +33,9 @@ def configure_pathway_map(
     )
 
     sequence_graph = SequenceGraph(sequences)
-    pathway_map = sequence_graph_to_pathway_map(sequence_graph)
+    pathway_map = sequence_graph_to_pathway_map(
+        sequence_graph, share_prefixes=share_prefixes
+    )
 
     arguments = {
         "level_by_action_name": action_level_by_first_occurrence(pathway_map),
@@ -1604,6 +1606,45 @@ class PathwayMapClassicLayoutTest(PathwayLayoutTestBase):
             ],
         )
 
+    def test_action_combination07(self):
+        # The combination continues a in two pathways. It continues a single existing action
+        # only, so it is positioned at the same y-coordinate as a, also when each pathway is
+        # represented by its own nodes.
+        actions = """
+            current
+            a
+            b
+            c
+            d(a & c)
+            """
+        sequences = """
+            current current 2020
+            current a 2030
+            a d 2040
+            d b 2050
+            d c[1] 2060
+            current c[2] 2070
+            """
+        y_coordinates_we_want = {
+            "current": 0,
+            "a": 2,
+            "d": 2,
+            "b": 1,
+            "c": -1,
+        }
+
+        for share_prefixes in [False, True]:
+            pathway_map, arguments = configure_pathway_map(
+                actions, sequences, share_prefixes=share_prefixes
+            )
+            positions, y_coordinate_by_action_name = classic_layout(
+                pathway_map, **arguments
+            )
+
+            self.assertEqual(len(pathway_map.all_paths()), 3)
+            self.assertNotIn("d", y_coordinate_by_action_name)
+            self.assert_equal_y_coordinates(positions, y_coordinates_we_want)
+
     def assert_equal_y_coordinates(self, positions, y_coordinates_we_want):
         for node, position in positions.items():
             self.assertAlmostEqual(position[1], y_coordinates_we_want[node.action.name])
@@ -1686,3 +1727,68 @@ class PathwayMapClassicLayoutTest(PathwayLayoutTestBase):
         }
 
         self.assert_equal_y_coordinates(positions, y_coordinates_we_want)
+
+    def test_share_prefixes(self):
+        actions = """
+            current
+            a
+            b
+            c
+            d
+            e
+            """
+        sequences = """
+            current     current     2030
+            current     a[1]        2100
+            current     b[1]        2040
+            b[1]        a[2]        2100
+            b[1]        c[2]        2050
+            c[2]        b[2]        2070
+            b[2]        a[3]        2100
+            c[2]        a[4]        2100
+            c[2]        d[3]        2100
+            b[1]        e[1]        2060
+            e[1]        d[2]        2100
+            e[1]        a[5]        2100
+            current     d[1]        2100
+            """
+
+        for overlapping_lines_spread in [(0.0, 0.0), (0.02, 0.02)]:
+            pathway_map, arguments = configure_pathway_map(actions, sequences)
+            shared_pathway_map, shared_arguments = configure_pathway_map(
+                actions, sequences, share_prefixes=True
+            )
+
+            self.assertEqual(len(shared_pathway_map.root_nodes), 1)
+            self.assertEqual(len(pathway_map.root_nodes), 8)
+            self.assertLess(shared_pathway_map.nr_nodes(), pathway_map.nr_nodes())
+
+            positions, y_coordinate_by_action_name = classic_layout(
+                pathway_map,
+                overlapping_lines_spread=overlapping_lines_spread,
+                **arguments,
+            )
+            shared_positions, shared_y_coordinate_by_action_name = classic_layout(
+                shared_pathway_map,
+                overlapping_lines_spread=overlapping_lines_spread,
+                **shared_arguments,
+            )
+
+            self.assertEqual(
+                shared_y_coordinate_by_action_name, y_coordinate_by_action_name
+            )
+
+            paths = pathway_map.all_paths()
+            shared_paths = shared_pathway_map.all_paths()
+            self.assertEqual(len(shared_paths), len(paths))
+
+            for path, shared_path in zip(paths, shared_paths):
+                self.assertEqual(
+                    [node.label for node in shared_path],
+                    [node.label for node in path],
+                )
+                self.assert_equal_positions(
+                    shared_positions,
+                    shared_path,
+                    [(node.label, positions[node]) for node in path],
+                )